@@ -1,60 +1,178 @@
 from dotenv import load_dotenv
+import asyncio
 import os
+import time
+from typing import Callable, Dict
 
 from livekit import agents, rtc
-from livekit.agents import AgentServer, AgentSession, Agent, room_io
+from livekit.agents import AgentServer, AgentSession, Agent, JobProcess, RunContext, function_tool, room_io
 from livekit.plugins import (
     openai,
     noise_cancellation,
 )
 
-from prompts import (
-    SYSTEM_INSTRUCTION, 
-    AGENT_INSTRUCTION, 
-    SESSION_INSTRUCTION,
-    INTERVIEW_OBJECTIVE,
-    QUESTION_POLICY,
-    EVALUATION_GUIDELINES,
-    CLOSING_INSTRUCTION
-)
+from prompts import SESSION_INSTRUCTION
 from tools import InterviewTools
-from evaluation import InterviewEvaluator
+from evaluation_queue import get_evaluation_queue
+from incremental_evaluation import StageAssessmentTracker
+from session_journal import SessionJournal, open_session_journal, recover_interrupted_sessions
 from interview_config import get_interview_config
+from instruction_bundles import (
+    STAGE_SCOPED_INSTRUCTIONS,
+    InstructionBundle,
+    get_session_bundle,
+    prewarm_instruction_bundles
+)
+from turn_latency import get_worker_latency_histogram
+from event_log import get_event_logger
+from token_counter import count_tokens
+from role_taxonomy import get_role_taxonomy
+from moderation import get_moderation_matcher
+from evaluation_store import get_evaluation_store
 
 load_dotenv(".env")
 
+# How long a finished session waits for its queued evaluation before shutting down.
+# Jobs still unfinished after this are released to the other workers.
+EVALUATION_DRAIN_TIMEOUT = 300
+
+# Sessions running in this process; the last one to finish stops the evaluation queue
+_active_sessions = 0
+
 
 class InterviewAssistant(Agent):
     """AI Interview Assistant Agent - SIMA from Tacktile System"""
     
-    def __init__(self) -> None:
-        # Combine all relevant instructions for the agent's persistent behavior
-        full_instructions = f"""{SYSTEM_INSTRUCTION}
+    def __init__(self, bundle: InstructionBundle = None) -> None:
+        """
+        Args:
+            bundle: Instructions to start with (default: the role-less first-stage bundle)
+        """
+        bundle = bundle or get_session_bundle()
+        super().__init__(instructions=bundle.instructions)
+        self.instruction_bundle = bundle
+        # Store tools separately
+        self.interview_tools = InterviewTools()
+    
+    async def _switch_bundle(self, bundle: InstructionBundle) -> None:
+        """Replace the realtime instructions if the bundle differs from the current one"""
+        if bundle.bundle_hash == self.instruction_bundle.bundle_hash:
+            return
+        self.instruction_bundle = bundle
+        await self.update_instructions(bundle.instructions)
+        get_event_logger().emit(
+            "instructions_switched",
+            role=bundle.role,
+            stage=bundle.stage,
+            bundle_hash=bundle.bundle_hash[:12],
+            tokens=count_tokens(bundle.instructions)
+        )
+    
+    async def apply_position(self, position: str) -> None:
+        """Switch to the detected role's bundle (same cached prefix, role context appended)"""
+        await self._switch_bundle(get_session_bundle(position, self.interview_tools.interview_stage))
+    
+    @function_tool
+    async def update_interview_stage(self, context: RunContext, stage: str) -> str:
+        """Call this when the interview moves on to a new stage.
+        
+        Args:
+            stage: One of introduction, technical, behavioral, experience, questions, closing
+        """
+        result = self.interview_tools.update_interview_stage(stage)
+        # Only the new stage's guidance stays in the realtime context
+        await self._switch_bundle(get_session_bundle(self.interview_tools.position, stage))
+        return result
+    
+    @function_tool
+    async def check_question_asked(self, context: RunContext, question: str) -> str:
+        """Call this before asking a question to check whether it, or a rewording of it, was already asked.
+        
+        Args:
+            question: The question you are about to ask
+        """
+        match = self.interview_tools.find_similar_question(question)
+        if match is None:
+            return "Not asked yet."
+        return f"Already asked (similarity {match['similarity']}): \"{match['question']}\". Ask something different."
 
-{AGENT_INSTRUCTION}
 
-{INTERVIEW_OBJECTIVE}
+def build_noise_filters() -> Dict:
+    """Noise-cancellation filter per participant kind ("default" for everything but SIP)"""
+    return {
+        rtc.ParticipantKind.PARTICIPANT_KIND_SIP: noise_cancellation.BVCTelephony(),
+        "default": noise_cancellation.BVC(),
+    }
 
-{QUESTION_POLICY}
 
-{EVALUATION_GUIDELINES}
+def _timed(timings: Dict[str, float], phase: str, build: Callable):
+    """Run one prewarm phase, recording its duration in milliseconds"""
+    start = time.perf_counter()
+    result = build()
+    timings[phase] = round((time.perf_counter() - start) * 1000, 1)
+    return result
 
-{CLOSING_INSTRUCTION}"""
-        
-        super().__init__(instructions=full_instructions)
-        # Store tools separately
-        self.interview_tools = InterviewTools()
+
+def prewarm(proc: JobProcess) -> None:
+    """
+    Per-process setup, run once before this worker accepts any interview
+    
+    Builds what every session shares - instruction bundles for every
+    configured role, noise-cancellation filters, the tokenizer, role taxonomy,
+    moderation matcher and evaluation index - so none of it runs between job
+    assignment and the first greeting. The evaluation process
+    (EVALUATION_PROCESSES) is not started here: prewarm runs in every job
+    process, and a spawned process re-imports this module. It starts on the
+    first evaluation instead, like the evaluation OpenAI client, which
+    belongs to the job's event loop.
+    """
+    timings = {}
+    proc.userdata["instruction_bundle"] = _timed(timings, "instructions", prewarm_instruction_bundles)
+    proc.userdata["noise_filters"] = _timed(timings, "noise_cancellation", build_noise_filters)
+    _timed(timings, "tokenizer", lambda: count_tokens(proc.userdata["instruction_bundle"].instructions))
+    _timed(timings, "role_taxonomy", get_role_taxonomy)
+    _timed(timings, "moderation", get_moderation_matcher)
+    _timed(timings, "evaluation_store", get_evaluation_store)
+    timings["total"] = round(sum(timings.values()), 1)
+    proc.userdata["prewarm_ms"] = timings
+    print(f"🔥 Worker prewarmed in {timings['total']} ms {timings}")
 
 
 server = AgentServer()
+server.setup_fnc = prewarm
 
 
 @server.rtc_session()
 async def interview_agent(ctx: agents.JobContext):
     """Main interview agent session handler"""
+    job_started = time.perf_counter()
+    # Counted before anything shared is touched, so a finishing session won't shut it down under us
+    global _active_sessions
+    _active_sessions += 1
+    
+    # Event handlers log through the queue-backed event log, never to stdout directly
+    event_log = get_event_logger()
+    room_name = ctx.room.name
+    
+    # Create the interview assistant instance (instructions and filters come from prewarm)
+    assistant = InterviewAssistant(ctx.proc.userdata.get("instruction_bundle"))
+    noise_filters = ctx.proc.userdata.get("noise_filters") or build_noise_filters()
+    
+    # Start the evaluation queue (replays jobs left unfinished by a previous worker).
+    # Waits for a stop() still running from the previous session.
+    evaluation_queue = await get_evaluation_queue()
     
-    # Create the interview assistant instance
-    assistant = InterviewAssistant()
+    # Queue evaluations for interviews cut short by a crashed worker
+    recovered = await recover_interrupted_sessions(evaluation_queue.enqueue)
+    if recovered:
+        print(f"♻️  Recovered {len(recovered)} interrupted interview(s) for evaluation")
+    
+    # Journal every transcript/note change so this interview survives a crash
+    journal = open_session_journal(ctx.room.name)
+    assistant.interview_tools.attach_journal(journal)
+    
+    # Assess each interview stage in the background as soon as it finishes
+    stage_tracker = StageAssessmentTracker(assistant.interview_tools, acquire_quota=evaluation_queue.acquire_quota)
     
     # Don't set position from config - let it be detected from candidate
     # assistant.interview_tools.set_candidate_details(position=config["position"])
@@ -72,6 +190,14 @@ async def interview_agent(ctx: agents.JobContext):
         ),
     )
     
+    # Instruction updates for a detected position (referenced until done, failures logged)
+    position_tasks = set()
+    
+    def on_position_applied(task: asyncio.Task):
+        position_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            event_log.emit("position_apply_failed", exc=task.exception(), room=room_name)
+    
     # Event handler to capture conversation items
     @session.on("conversation_item_added")
     def on_conversation_item_added(item):
@@ -96,58 +222,124 @@ async def interview_agent(ctx: agents.JobContext):
                     # Map role to speaker
                     speaker = "candidate" if role == "user" else "interviewer"
                     assistant.interview_tools.add_to_transcript(speaker, text)
-                    print(f"📝 Captured: {speaker[:4]}... ({len(text)} chars)")
+                    event_log.emit("transcript_captured", room=room_name, speaker=speaker, chars=len(text))
+                    
+                    # Position just detected - append its role context to the instructions
+                    position = assistant.interview_tools.position
+                    if position and position != assistant.instruction_bundle.role:
+                        task = asyncio.create_task(assistant.apply_position(position))
+                        position_tasks.add(task)
+                        task.add_done_callback(on_position_applied)
                     
         except Exception as e:
-            print(f"⚠️ Error capturing conversation: {e}")
-            import traceback
-            traceback.print_exc()
+            event_log.emit("transcript_capture_failed", exc=e, room=room_name)
+    
+    # Input tokens reported by the realtime model per response - confirms prompt-cache
+    # prefix hits and measures what the instructions cost on every turn
+    prompt_cache = {"responses": 0, "input_tokens": 0, "cached_tokens": 0}
+    
+    @session.on("metrics_collected")
+    def on_metrics_collected(event):
+        """Accumulate input and cached token counts"""
+        metrics = event.metrics
+        details = getattr(metrics, "input_token_details", None)
+        if details is not None:
+            prompt_cache["responses"] += 1
+            prompt_cache["input_tokens"] += getattr(metrics, "input_tokens", 0)
+            prompt_cache["cached_tokens"] += getattr(details, "cached_tokens", 0)
     
     # Add error handler for session
     @session.on("error")
     def on_session_error(error):
         """Handle session errors"""
-        print(f"❌ Session error occurred: {error}")
+        event_log.emit("session_error", room=room_name, error=str(error))
     
-    # Add handler for when agent starts speaking
-    @session.on("agent_started_speaking")
-    def on_agent_speaking():
-        """Track when agent speaks"""
-        print("🗣️ Agent started speaking...")
+    # Candidate finished their turn - the response latency clock starts
+    @session.on("user_state_changed")
+    def on_user_state_changed(event):
+        """Track when the candidate stops speaking"""
+        if event.old_state == "speaking" and event.new_state != "speaking":
+            assistant.interview_tools.turn_latency.user_stopped_speaking(getattr(event, "created_at", None))
     
-    # Add handler for when agent stops speaking
-    @session.on("agent_stopped_speaking") 
-    def on_agent_stopped():
-        """Track when agent stops"""
-        print("🤐 Agent stopped speaking")
+    # Interviewer started answering - the response latency clock stops
+    @session.on("agent_state_changed")
+    def on_agent_state_changed(event):
+        """Track when the agent starts and stops speaking"""
+        if event.new_state == "speaking":
+            latency_ms = assistant.interview_tools.turn_latency.agent_started_speaking(
+                getattr(event, "created_at", None),
+                turn=len(assistant.interview_tools.transcript)
+            )
+            event_log.emit(
+                "agent_started_speaking",
+                room=room_name,
+                latency_ms=round(latency_ms, 1) if latency_ms is not None else None
+            )
+        elif event.old_state == "speaking":
+            event_log.emit("agent_stopped_speaking", room=room_name)
     
     # Track if evaluation has been generated
     evaluation_generated = False
+    evaluation_task = None
     
     # Room disconnect handler - fires when user leaves
     @ctx.room.on("participant_disconnected")
     def on_participant_disconnected(participant: rtc.RemoteParticipant):
         """Handle participant disconnect"""
-        nonlocal evaluation_generated
+        nonlocal evaluation_generated, evaluation_task
         if not evaluation_generated and participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_STANDARD:
             print(f"\n👋 Participant {participant.identity} disconnected")
             print(f"💬 Total conversation turns: {len(assistant.interview_tools.transcript)}")
             evaluation_generated = True
             # Schedule evaluation
-            import asyncio
-            asyncio.create_task(generate_post_interview_evaluation(assistant.interview_tools))
+            evaluation_task = asyncio.create_task(
+                generate_post_interview_evaluation(assistant.interview_tools, stage_tracker, journal)
+            )
     
     # Also handle room disconnection (backup)
     @ctx.room.on("disconnected")
     def on_room_disconnected():
         """Handle room disconnect (backup trigger)"""
-        nonlocal evaluation_generated
+        nonlocal evaluation_generated, evaluation_task
         if not evaluation_generated and len(assistant.interview_tools.transcript) > 0:
             print(f"\n🔌 Room disconnected")
             print(f"💬 Total conversation turns: {len(assistant.interview_tools.transcript)}")
             evaluation_generated = True
-            import asyncio
-            asyncio.create_task(generate_post_interview_evaluation(assistant.interview_tools))
+            evaluation_task = asyncio.create_task(
+                generate_post_interview_evaluation(assistant.interview_tools, stage_tracker, journal)
+            )
+    
+    async def wait_for_evaluation():
+        """Keep the job alive (bounded) until its queued evaluation finishes"""
+        job_id = await evaluation_task if evaluation_task is not None else None
+        # Already removed if the job was queued; otherwise kept for recovery
+        await asyncio.to_thread(journal.close)
+        latency = assistant.interview_tools.turn_latency.to_dict()
+        worker_latency = get_worker_latency_histogram().summary()
+        print(f"⏱️  Response latency: session {latency['session']}, "
+              f"{latency['slo_breaches']} turn(s) over {latency['slo_ms']:.0f} ms")
+        print(f"⏱️  Worker response latency: {worker_latency}")
+        bundle = assistant.instruction_bundle
+        responses = prompt_cache["responses"] or 1
+        print(f"🧾 Instructions {bundle.bundle_hash[:12]} (prefix {bundle.prefix_hash[:12]}, "
+              f"{'stage-scoped' if STAGE_SCOPED_INSTRUCTIONS else 'full'}): "
+              f"{prompt_cache['input_tokens'] // responses} input tokens per response, "
+              f"{prompt_cache['cached_tokens']}/{prompt_cache['input_tokens']} served from prompt cache")
+        event_log.emit("event_log_stats", room=room_name, stats=event_log.stats())
+        global _active_sessions
+        try:
+            if job_id is not None:
+                await evaluation_queue.wait_for(job_id, timeout=EVALUATION_DRAIN_TIMEOUT)
+        finally:
+            _active_sessions -= 1
+            if _active_sessions == 0:
+                # Hand unfinished jobs to the other workers instead of leaving them leased
+                await evaluation_queue.stop()
+            if _active_sessions == 0:  # Re-checked: a new session may have started during stop()
+                # Write out the buffered events before the process exits
+                await asyncio.to_thread(event_log.close)
+    
+    ctx.add_shutdown_callback(wait_for_evaluation)
     
     # Start the session with room configuration
     await session.start(
@@ -155,9 +347,9 @@ async def interview_agent(ctx: agents.JobContext):
         agent=assistant,
         room_options=room_io.RoomOptions(
             audio_input=room_io.AudioInputOptions(
-                noise_cancellation=lambda params: noise_cancellation.BVCTelephony() 
-                if params.participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP 
-                else noise_cancellation.BVC(),
+                noise_cancellation=lambda params: noise_filters.get(
+                    params.participant.kind, noise_filters["default"]
+                ),
             ),
         ),
     )
@@ -168,14 +360,27 @@ async def interview_agent(ctx: agents.JobContext):
     await session.generate_reply(
         instructions=SESSION_INSTRUCTION
     )
+    greeting_ms = (time.perf_counter() - job_started) * 1000
+    print(f"⏱️  Greeting requested {greeting_ms:.0f} ms after job assignment "
+          f"(worker prewarm: {ctx.proc.userdata.get('prewarm_ms', {}).get('total', 'not run')} ms)")
 
 
-async def generate_post_interview_evaluation(interview_tools: InterviewTools):
+async def generate_post_interview_evaluation(
+    interview_tools: InterviewTools,
+    stage_tracker: StageAssessmentTracker = None,
+    journal: SessionJournal = None
+):
     """
-    Generate comprehensive evaluation after interview concludes
+    Queue a comprehensive evaluation after interview concludes
     
     Args:
         interview_tools: The InterviewTools instance with all interview data
+        stage_tracker: Stage assessments made during the interview; the queued
+            job then only merges them with the turns they don't cover
+        journal: The session journal - removed once the job is safely queued
+        
+    Returns:
+        Evaluation job id, or None if nothing was queued
     """
     try:
         print("\n" + "="*70)
@@ -190,35 +395,32 @@ async def generate_post_interview_evaluation(interview_tools: InterviewTools):
         if transcript_length == 0:
             print("⚠️  No conversation captured - Session ended too early")
             print("    Skipping evaluation generation.")
-            return
+            if journal is not None:
+                await asyncio.to_thread(journal.close, True)
+            return None
         
         print(f"✅ Captured {transcript_length} conversation turns")
         
-        # Create evaluator and run assessment
-        evaluator = InterviewEvaluator()
-        evaluation = await evaluator.evaluate_interview(
-            candidate_name=interview_data["candidate_name"],
-            position=interview_data["position"],
-            transcript=interview_data["transcript"],
-            interview_notes=interview_data["interview_notes"],
-            duration_minutes=interview_data["duration_minutes"],
-            candidate_info=interview_data["candidate_info"]
-        )
+        if stage_tracker is not None:
+            interview_data.update(await stage_tracker.collect())
+            print(f"🧩 {len(interview_data['stage_findings'])} stage(s) already assessed during the interview")
         
-        # Print summary report
-        summary_report = evaluator.generate_summary_report(evaluation)
-        print(summary_report)
+        # Persist the job; the queue's worker pool runs it under the OpenAI rate limits
+        evaluation_queue = await get_evaluation_queue()
+        job_id = await evaluation_queue.enqueue(interview_data)
+        pending = await asyncio.to_thread(evaluation_queue.pending_count)
+        print(f"📥 Evaluation queued (job {job_id}, {pending} pending)")
         
-        # Print file location
-        print(f"\n✅ Full evaluation saved to: {evaluation['metadata']['saved_to']}")
-        print(f"📊 Overall Recommendation: {evaluation['recommendation']['decision']}")
-        print(f"📈 Role Fit: {evaluation['recommendation']['role_fit_percentage']}%")
-        print("\n" + "="*70 + "\n")
+        # The queue now holds the interview durably
+        if journal is not None:
+            await asyncio.to_thread(journal.close, True)
+        return job_id
         
     except Exception as e:
         print(f"\n❌ Error generating evaluation: {e}")
         import traceback
         traceback.print_exc()
+        return None
 
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+"""
+Instruction size benchmark
+Compares the realtime instructions sent on every response with full
+instructions (all six prompt sections) and with stage-scoped instructions,
+per interview stage and averaged over a typical 25-minute interview.
+
+Turn latency before/after is measured live: run sessions with
+STAGE_SCOPED_INSTRUCTIONS=false and =true and compare the turn_latency
+percentiles saved in the evaluations.
+
+Usage:
+    python benchmark_instructions.py [role]
+"""
+
+import sys
+
+from instruction_bundles import STAGE_SECTIONS, get_instruction_bundle
+from token_counter import CHARS_PER_TOKEN, count_tokens, is_exact
+
+# Share of the interview's turns spent in each stage (from AGENT_INSTRUCTION's timings)
+STAGE_SHARE = {
+    "introduction": 0.15,
+    "experience": 0.15,
+    "technical": 0.35,
+    "behavioral": 0.25,
+    "questions": 0.05,
+    "closing": 0.05,
+}
+
+
+if __name__ == "__main__":
+    role = sys.argv[1] if len(sys.argv) > 1 else "Software Engineer"
+    full = count_tokens(get_instruction_bundle(role).instructions)
+    counting = "tiktoken" if is_exact() else f"~{CHARS_PER_TOKEN} chars/token estimate"
+
+    print(f"\n🧾 Realtime instruction tokens per response ({role}, {counting})\n")
+    print(f"  {'Stage':<14}{'Full':>8}{'Scoped':>9}{'Saved':>8}")
+    weighted = 0.0
+    for stage in STAGE_SECTIONS:
+        scoped = count_tokens(get_instruction_bundle(role, stage=stage).instructions)
+        weighted += scoped * STAGE_SHARE[stage]
+        print(f"  {stage:<14}{full:>8}{scoped:>9}{1 - scoped / full:>8.0%}")
+    print(f"\n  Per-turn average over an interview: {full} → {weighted:.0f} tokens ({1 - weighted / full:.0%} fewer)\n")
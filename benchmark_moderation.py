@@ -0,0 +1,102 @@
+"""
+Moderation matcher micro-benchmark
+Compares the previous per-keyword substring scan of
+check_inappropriate_behavior with the precompiled regex matcher on
+long utterances.
+
+Usage:
+    python benchmark_moderation.py [repetitions]
+"""
+
+import sys
+import time
+
+from moderation import KeywordMatcher, get_moderation_matcher
+
+
+def legacy_check(message: str) -> str:
+    """The previous implementation: keyword lists rebuilt per call, one substring scan per keyword"""
+    message_lower = message.lower()
+    severe_keywords = [
+        'fuck', 'shit', 'bitch', 'ass', 'damn',
+        'stupid interviewer', 'waste of time',
+        'this is bullshit', 'you suck'
+    ]
+    warning_keywords = [
+        'irritating', 'annoying', 'boring',
+        "don't know anything", "i don't care",
+        'whatever', 'this is dumb'
+    ]
+    for keyword in severe_keywords:
+        if keyword in message_lower:
+            return 'terminate'
+    for keyword in warning_keywords:
+        if keyword in message_lower:
+            return 'warning'
+    return 'none'
+
+
+def matcher_check(message: str) -> str:
+    hits = get_moderation_matcher().find_all(message)
+    if any(hit.severity == 'terminate' for hit in hits):
+        return 'terminate'
+    return 'warning' if hits else 'none'
+
+
+UTTERANCES = {
+    "clean": (
+        "In my last role I led the migration of our billing service to an event driven "
+        "architecture, wrote the data contracts and mentored two junior engineers. "
+    ),
+    "false positive": (
+        "I took a class on performance assessment and passed the classic systems design "
+        "exam, then reassessed our HR pipeline. "
+    ),
+    "warning at end": (
+        "We built dashboards for the operations team and tuned the queries for latency. "
+    ),
+}
+
+
+def scaling_keywords(count: int) -> list:
+    """Synthetic phrase list of the given size (never present in the utterances)"""
+    return [f"zq{index:04d} phrase" for index in range(count)]
+
+
+def substring_scan(message: str, keywords: list) -> list:
+    message_lower = message.lower()
+    return [keyword for keyword in keywords if keyword in message_lower]
+
+
+def time_call(func, message: str, repetitions: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repetitions):
+        func(message)
+    return (time.perf_counter() - started) / repetitions * 1e6
+
+
+if __name__ == "__main__":
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    get_moderation_matcher()  # Built once per process, outside the timed loop
+
+    print(f"\n⏱️  Moderation matcher benchmark ({repetitions} runs per case)\n")
+    print(f"{'case':<18}{'chars':>8}{'legacy µs':>12}{'matcher µs':>12}   legacy → matcher")
+    for name, sentence in UTTERANCES.items():
+        message = sentence * 20
+        if name == "warning at end":
+            message += "Honestly the on-call rotation was boring."
+        legacy = time_call(legacy_check, message, repetitions)
+        matcher = time_call(matcher_check, message, repetitions)
+        print(f"{name:<18}{len(message):>8}{legacy:>12.1f}{matcher:>12.1f}   "
+              f"{legacy_check(message)} → {matcher_check(message)}")
+
+    # Substring scans cost one pass per phrase; the compiled alternation is one pass over the text
+    message = UTTERANCES["clean"] * 20
+    print(f"\n{'phrases':<18}{'chars':>8}{'legacy µs':>12}{'matcher µs':>12}")
+    for count in (16, 100, 500):
+        keywords = scaling_keywords(count)
+        matcher = KeywordMatcher([(keyword, 'warning') for keyword in keywords])
+        legacy = time_call(lambda text: substring_scan(text, keywords), message, repetitions // 10 or 1)
+        scanned = time_call(matcher.find_all, message, repetitions // 10 or 1)
+        print(f"{count:<18}{len(message):>8}{legacy:>12.1f}{scanned:>12.1f}")
+    print()
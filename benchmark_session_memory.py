@@ -0,0 +1,116 @@
+"""
+Session memory benchmark
+Measures the memory InterviewTools holds for a simulated 30-minute
+interview, against the previous representation (one dict with an ISO-8601
+timestamp string per turn, note and question).
+
+Message texts are created before measuring, so the numbers show the
+per-record overhead both representations add on top of the text itself.
+Also reports snapshot()/restore() time and size for one such session.
+
+Usage:
+    python benchmark_session_memory.py [sessions]
+"""
+
+import logging
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from tools import InterviewTools
+
+# A 30-minute interview: a turn every ~5 seconds, plus notes and questions
+TURNS = 360
+NOTES = 40
+QUESTIONS = 30
+STAGES = ["introduction", "technical", "behavioral", "experience", "questions", "closing"]
+
+
+def make_session_inputs(session: int) -> dict:
+    return {
+        "turns": [
+            ("interviewer" if turn % 2 == 0 else "candidate",
+             f"Session {session} turn {turn}: " + "we discussed the design trade-offs in detail " * 4)
+            for turn in range(TURNS)
+        ],
+        "notes": [(f"Note {note} for session {session}", "technical") for note in range(NOTES)],
+        "questions": [(f"Question {question} for session {session}?", "experience") for question in range(QUESTIONS)]
+    }
+
+
+def build_legacy(inputs: dict) -> dict:
+    """The previous representation: fresh dicts with ISO timestamp strings"""
+    transcript, notes, questions = [], [], []
+    for index, (speaker, message) in enumerate(inputs["turns"]):
+        stage = STAGES[index * len(STAGES) // TURNS]
+        transcript.append({"timestamp": datetime.now().isoformat(), "speaker": speaker, "message": message})
+        if index < NOTES:
+            note, category = inputs["notes"][index]
+            notes.append({"timestamp": datetime.now().isoformat(), "category": category, "note": note, "stage": stage})
+        if index < QUESTIONS:
+            question, category = inputs["questions"][index]
+            questions.append({
+                "timestamp": datetime.now().isoformat(), "question": question, "stage": stage, "category": category
+            })
+    return {"transcript": transcript, "notes": notes, "questions": questions}
+
+
+def build_current(inputs: dict) -> InterviewTools:
+    tools = InterviewTools()
+    tools.candidate_name = "Benchmark"  # Skip name/position detection
+    for index, (speaker, message) in enumerate(inputs["turns"]):
+        stage = STAGES[index * len(STAGES) // TURNS]
+        if stage != tools.interview_stage:
+            tools.update_interview_stage(stage)
+        tools.add_to_transcript(speaker, message)
+        if index < NOTES:
+            tools.record_note(*inputs["notes"][index])
+        if index < QUESTIONS:
+            tools.mark_question_asked(*inputs["questions"][index])
+    return tools
+
+
+def measure(builder, all_inputs: list) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [builder(inputs) for inputs in all_inputs]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del sessions
+    return used
+
+
+def time_snapshot(tools: InterviewTools, compress: bool, rounds: int = 200) -> tuple:
+    """Average snapshot and restore time in milliseconds, and snapshot size"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        data = tools.snapshot(compress=compress)
+    snapshot_ms = (time.perf_counter() - start) / rounds * 1000
+    start = time.perf_counter()
+    for _ in range(rounds):
+        InterviewTools.restore(data)
+    restore_ms = (time.perf_counter() - start) / rounds * 1000
+    return snapshot_ms, restore_ms, len(data)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    session_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    all_inputs = [make_session_inputs(session) for session in range(session_count)]
+
+    legacy = measure(build_legacy, all_inputs) / session_count
+    current = measure(build_current, all_inputs) / session_count
+    records = TURNS + NOTES + QUESTIONS
+
+    print(f"\n🧠 Session memory ({session_count} sessions, {TURNS} turns / {NOTES} notes / {QUESTIONS} questions each)\n")
+    print(f"  Dict records:     {legacy / 1024:8.1f} KiB per session  ({legacy / records:6.1f} B per record)")
+    print(f"  Slotted records:  {current / 1024:8.1f} KiB per session  ({current / records:6.1f} B per record)")
+    print(f"  Saved:            {(legacy - current) / 1024:8.1f} KiB per session  ({1 - current / legacy:.0%})\n")
+
+    session = build_current(all_inputs[0])
+    print("📦 Session snapshot\n")
+    for label, compress in (("Raw", False), ("zlib", True)):
+        snapshot_ms, restore_ms, size = time_snapshot(session, compress)
+        print(f"  {label + ':':<6} {size / 1024:7.1f} KiB   snapshot {snapshot_ms:6.3f} ms   restore {restore_ms:6.3f} ms")
+    print()
@@ -1,13 +1,121 @@
+import asyncio
 import json
 import logging
+import re
+import weakref
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Any, Callable, Dict, List, Optional
 from pathlib import Path
 import openai
 import os
 
+from evaluation_archive import EvaluationArchive
+from evaluation_cache import EvaluationCache, make_cache_key
+from evaluation_store import get_evaluation_store
+from evaluation_stream import IncrementalSectionParser
+from prompt_budget import (
+    EVALUATION_CONTEXT_TOKENS,
+    EVALUATION_RESPONSE_TOKENS,
+    SEPARATOR_TOKENS,
+    section_tokens,
+    select_transcript_window,
+    turn_tokens
+)
+from token_counter import count_tokens
+
 logger = logging.getLogger("interview-evaluation")
 
+# OpenAI evaluation settings
+PROMPT_VERSION = "3"  # Bump whenever the evaluation prompts change (invalidates cached results)
+EVALUATION_MODEL = "gpt-4o"
+EVALUATION_TEMPERATURE = 0.3  # Lower temperature for consistent evaluation
+EVALUATION_REQUEST_TIMEOUT = 90.0  # Seconds allowed for a single completion request
+EVALUATION_CONNECT_TIMEOUT = 10.0  # Seconds allowed to open a connection
+EVALUATION_MAX_RETRIES = 2
+EVALUATION_MAX_CONCURRENT_REQUESTS = 8  # Per event loop, across all evaluators
+
+# Transcripts whose candidate answers don't fit the context window (see prompt_budget)
+# are evaluated with map-reduce over turn-aligned segments of this many tokens
+SEGMENT_MAX_TOKENS = 1500
+SEGMENT_MAX_OUTPUT_TOKENS = 900
+
+# A new turn starts at a blank line followed by a speaker label
+_TURN_BOUNDARY = re.compile(r"\n\s*\n(?=\s*(?:Interviewer|Candidate):)", re.IGNORECASE)
+
+# One AsyncOpenAI client (and therefore one connection pool) per event loop and API key.
+# Clients are bound to the loop that first used them, so they are keyed by loop.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, openai.AsyncOpenAI]]" = weakref.WeakKeyDictionary()
+_request_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def get_async_openai_client(api_key: str = None) -> openai.AsyncOpenAI:
+    """
+    Get the shared async OpenAI client for the running event loop
+    
+    Args:
+        api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+        
+    Returns:
+        AsyncOpenAI client with explicit timeouts, reused across evaluations
+    """
+    loop = asyncio.get_running_loop()
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    clients = _async_clients.setdefault(loop, {})
+    
+    client = clients.get(api_key)
+    if client is None:
+        client = openai.AsyncOpenAI(
+            api_key=api_key,
+            timeout=openai.Timeout(EVALUATION_REQUEST_TIMEOUT, connect=EVALUATION_CONNECT_TIMEOUT),
+            max_retries=EVALUATION_MAX_RETRIES,
+        )
+        clients[api_key] = client
+        logger.info("Created shared async OpenAI client for evaluations")
+    return client
+
+
+def _get_request_slots() -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent OpenAI requests on the running loop"""
+    loop = asyncio.get_running_loop()
+    slots = _request_slots.get(loop)
+    if slots is None:
+        slots = asyncio.Semaphore(EVALUATION_MAX_CONCURRENT_REQUESTS)
+        _request_slots[loop] = slots
+    return slots
+
+
+def split_transcript_turns(transcript: str) -> List[str]:
+    """
+    Split a formatted transcript ("Speaker: message" blocks) into turns
+    
+    Blank lines inside a message stay with that message; only a blank line
+    followed by a speaker label starts a new turn.
+    """
+    return [turn.strip() for turn in _TURN_BOUNDARY.split(transcript) if turn.strip()]
+
+
+def segment_transcript(turns: List[str], max_tokens: int) -> List[str]:
+    """
+    Pack consecutive turns into segments of at most max_tokens
+    
+    Turns are never cut - a single turn longer than max_tokens becomes its own segment.
+    """
+    segments = []
+    current = []
+    current_len = 0
+    for turn in turns:
+        cost = turn_tokens(turn) + SEPARATOR_TOKENS
+        if current and current_len + cost > max_tokens:
+            segments.append("\n\n".join(current))
+            current = []
+            current_len = 0
+        current.append(turn)
+        current_len += cost
+    if current:
+        segments.append("\n\n".join(current))
+    return segments
+
 
 class InterviewEvaluator:
     """
@@ -15,11 +123,70 @@ class InterviewEvaluator:
     Generates comprehensive assessment, ratings, and recommendations
     """
     
-    def __init__(self, openai_api_key: str = None):
+    def __init__(
+        self,
+        openai_api_key: str = None,
+        fallback_on_error: bool = True,
+        cache: Optional[EvaluationCache] = None,
+        storage_format: str = None
+    ):
+        """
+        Args:
+            openai_api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+            fallback_on_error: Save a fallback assessment when the AI call fails.
+                Set to False to let the error propagate (e.g. so a job queue can retry).
+            cache: Optional cache of AI assessments, keyed by the evaluation inputs
+            storage_format: "json" (one pretty-printed file per evaluation, default) or
+                "archive" (zstd-compressed segments in evaluations/archive, needs zstandard).
+                Defaults to EVALUATION_STORAGE_FORMAT from the environment.
+        """
         self.api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
-        self.client = openai.OpenAI(api_key=self.api_key)
+        self.fallback_on_error = fallback_on_error
+        self.cache = cache
         self.evaluations_dir = Path("evaluations")
         self.evaluations_dir.mkdir(exist_ok=True)
+        self.store = get_evaluation_store(self.evaluations_dir)
+        
+        storage_format = storage_format or os.getenv("EVALUATION_STORAGE_FORMAT", "json")
+        if storage_format not in ("json", "archive"):
+            raise ValueError(f"Unknown storage_format: {storage_format}")
+        self.archive = EvaluationArchive(self.evaluations_dir / "archive") if storage_format == "archive" else None
+    
+    @property
+    def client(self) -> openai.AsyncOpenAI:
+        """Shared async OpenAI client for the running event loop"""
+        return get_async_openai_client(self.api_key)
+    
+    async def _create_chat_completion(self, messages: List[Dict], **kwargs):
+        """
+        Run a chat completion without blocking the event loop
+        
+        Requests share one connection pool per loop and are capped by
+        EVALUATION_MAX_CONCURRENT_REQUESTS so evaluation bursts cannot starve
+        the realtime sessions running on the same worker.
+        """
+        params = {
+            "model": EVALUATION_MODEL,
+            "temperature": EVALUATION_TEMPERATURE,
+        }
+        params.update(kwargs)
+        
+        async with _get_request_slots():
+            return await self.client.chat.completions.create(messages=messages, **params)
+    
+    async def _stream_chat_completion(self, messages: List[Dict], **kwargs) -> AsyncIterator[str]:
+        """Stream a chat completion's text deltas (holds a request slot until the stream ends)"""
+        params = {
+            "model": EVALUATION_MODEL,
+            "temperature": EVALUATION_TEMPERATURE,
+        }
+        params.update(kwargs)
+        
+        async with _get_request_slots():
+            stream = await self.client.chat.completions.create(messages=messages, stream=True, **params)
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
     
     async def evaluate_interview(
         self,
@@ -28,7 +195,10 @@ class InterviewEvaluator:
         transcript: str,
         interview_notes: List[Dict],
         duration_minutes: int,
-        candidate_info: Dict = None
+        candidate_info: Dict = None,
+        on_section: Callable[[str, Any], None] = None,
+        stage_findings: List[Dict] = None,
+        turn_latency: Dict = None
     ) -> Dict:
         """
         Main evaluation function - analyzes the interview and generates comprehensive report
@@ -40,6 +210,14 @@ class InterviewEvaluator:
             interview_notes: Notes taken during interview
             duration_minutes: Interview duration
             candidate_info: Additional candidate information
+            on_section: Stream the AI response and call on_section(name, value)
+                as soon as each top-level section (e.g. overall_assessment,
+                ratings) is complete - see evaluation_stream.print_report_section
+            stage_findings: Partial assessments of stages already evaluated during the
+                interview ({"stage", "finding"} dicts, see incremental_evaluation).
+                `transcript` then only needs the turns not covered by them.
+            turn_latency: Response latency report of the session
+                (TurnLatencyTracker.to_dict()), saved in the metadata
             
         Returns:
             Complete evaluation dictionary
@@ -48,16 +226,55 @@ class InterviewEvaluator:
         logger.info(f"Starting evaluation for {candidate_name} - {position}")
         
         # Generate AI evaluation
+        stream_metrics = {} if on_section else None
+        budget_report = {}
         ai_assessment = await self._generate_ai_assessment(
             candidate_name=candidate_name,
             position=position,
             transcript=transcript,
             interview_notes=interview_notes,
-            duration_minutes=duration_minutes
+            duration_minutes=duration_minutes,
+            on_section=on_section,
+            stream_metrics=stream_metrics,
+            stage_findings=stage_findings,
+            budget_report=budget_report
         )
         
         # Structure the complete evaluation
-        evaluation = {
+        evaluation = self._build_evaluation(
+            candidate_name=candidate_name,
+            position=position,
+            duration_minutes=duration_minutes,
+            interview_notes=interview_notes,
+            candidate_info=candidate_info,
+            ai_assessment=ai_assessment
+        )
+        if stream_metrics:
+            evaluation["metadata"]["streaming_metrics"] = stream_metrics
+        if budget_report:
+            evaluation["metadata"]["prompt_budget"] = budget_report
+        if turn_latency:
+            evaluation["metadata"]["turn_latency"] = turn_latency
+        
+        # Save evaluation to file
+        filename = self._save_evaluation(evaluation)
+        evaluation["metadata"]["saved_to"] = filename
+        
+        logger.info(f"Evaluation completed and saved: {filename}")
+        
+        return evaluation
+    
+    def _build_evaluation(
+        self,
+        candidate_name: str,
+        position: str,
+        duration_minutes: int,
+        interview_notes: List[Dict],
+        candidate_info: Optional[Dict],
+        ai_assessment: Dict
+    ) -> Dict:
+        """Structure the complete evaluation from the AI assessment"""
+        return {
             "metadata": {
                 "candidate_name": candidate_name,
                 "position": position,
@@ -79,14 +296,128 @@ class InterviewEvaluator:
             "interview_notes": interview_notes,
             "transcript_summary": ai_assessment.get("transcript_summary", "")
         }
+    
+    async def evaluate_interviews_batch(
+        self,
+        interviews: List[Dict],
+        transport,
+        poll_interval: float = 60.0,
+        timeout: float = None
+    ) -> List[Dict]:
+        """
+        Evaluate many interviews through a batch backend (non-urgent backfills)
         
-        # Save evaluation to file
-        filename = self._save_evaluation(evaluation)
-        evaluation["metadata"]["saved_to"] = filename
+        All requests are written to one JSONL batch file, submitted through
+        `transport` (see evaluation_batch), polled until the batch finishes,
+        and every result is saved like a regular evaluation. Batch requests
+        carry the transcript in a single call, windowed to the context budget.
         
-        logger.info(f"Evaluation completed and saved: {filename}")
+        Args:
+            interviews: Dicts with candidate_name, position, transcript,
+                interview_notes, duration_minutes and optional candidate_info
+            transport: BatchTransport instance (OpenAIBatchTransport, LocalBatchTransport)
+            poll_interval: Seconds between status polls
+            timeout: Give up waiting after this many seconds (None = wait forever)
+            
+        Returns:
+            Evaluations in the same order as `interviews`. Requests that
+            failed in the batch are not saved: their entry only has metadata
+            (candidate_name, position, batch_id, batch_error).
+        """
+        from evaluation_batch import BATCH_TERMINAL_STATES, parse_batch_result
         
-        return evaluation
+        if not interviews:
+            return []
+        
+        batch_dir = self.evaluations_dir / "batches"
+        batch_dir.mkdir(exist_ok=True)
+        batch_file = batch_dir / f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jsonl"
+        
+        with open(batch_file, 'w', encoding='utf-8') as f:
+            for index, interview in enumerate(interviews):
+                notes_summary = self._format_notes(interview["interview_notes"])
+                fixed_prompt = self._build_evaluation_prompt(
+                    candidate_name=interview["candidate_name"],
+                    position=interview["position"],
+                    duration_minutes=interview["duration_minutes"],
+                    notes_summary=notes_summary,
+                    transcript_section=""
+                )
+                transcript_section, window = self._window_transcript(
+                    "INTERVIEW TRANSCRIPT:",
+                    interview["transcript"],
+                    EVALUATION_CONTEXT_TOKENS - EVALUATION_RESPONSE_TOKENS - count_tokens(fixed_prompt)
+                    - count_tokens(self._build_assessment_messages("")[0]["content"])
+                )
+                if not window["fits"]:
+                    logger.warning(
+                        f"Batch request {index}: candidate answers exceed the context window - "
+                        f"{window['omitted']['candidate_answers']} answers dropped"
+                    )
+                evaluation_prompt = self._build_evaluation_prompt(
+                    candidate_name=interview["candidate_name"],
+                    position=interview["position"],
+                    duration_minutes=interview["duration_minutes"],
+                    notes_summary=notes_summary,
+                    transcript_section=transcript_section
+                )
+                request = {
+                    "custom_id": f"evaluation-{index}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": EVALUATION_MODEL,
+                        "temperature": EVALUATION_TEMPERATURE,
+                        "messages": self._build_assessment_messages(evaluation_prompt),
+                        "response_format": {"type": "json_object"}
+                    }
+                }
+                f.write(json.dumps(request, ensure_ascii=False) + "\n")
+        
+        batch_id = await transport.submit(batch_file)
+        logger.info(f"Submitted {len(interviews)} evaluations as batch {batch_id}")
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+        while True:
+            status = await transport.poll(batch_id)
+            if status["status"] in BATCH_TERMINAL_STATES:
+                break
+            if deadline is not None and loop.time() >= deadline:
+                raise TimeoutError(f"Batch {batch_id} still {status['status']} after {timeout}s")
+            await asyncio.sleep(poll_interval)
+        
+        logger.info(f"Batch {batch_id} finished with status {status['status']}")
+        results = {r["custom_id"]: r for r in await transport.fetch_results(batch_id)}
+        
+        evaluations = []
+        for index, interview in enumerate(interviews):
+            try:
+                ai_assessment = parse_batch_result(results.get(f"evaluation-{index}"))
+            except Exception as e:
+                logger.error(f"Batch evaluation failed for {interview['candidate_name']}: {e}")
+                # Not saved: a fallback report per failed line would pile up on every retry
+                evaluations.append({"metadata": {
+                    "candidate_name": interview["candidate_name"],
+                    "position": interview["position"],
+                    "batch_id": batch_id,
+                    "batch_error": str(e)
+                }})
+                continue
+            
+            evaluation = self._build_evaluation(
+                candidate_name=interview["candidate_name"],
+                position=interview["position"],
+                duration_minutes=interview["duration_minutes"],
+                interview_notes=interview["interview_notes"],
+                candidate_info=interview.get("candidate_info"),
+                ai_assessment=ai_assessment
+            )
+            evaluation["metadata"]["batch_id"] = batch_id
+            evaluation["metadata"]["saved_to"] = self._save_evaluation(evaluation)
+            evaluations.append(evaluation)
+        
+        return evaluations
     
     async def _generate_ai_assessment(
         self,
@@ -94,16 +425,269 @@ class InterviewEvaluator:
         position: str,
         transcript: str,
         interview_notes: List[Dict],
-        duration_minutes: int
+        duration_minutes: int,
+        on_section: Callable[[str, Any], None] = None,
+        stream_metrics: Dict = None,
+        stage_findings: List[Dict] = None,
+        budget_report: Dict = None
     ) -> Dict:
         """
         Use OpenAI to generate comprehensive AI assessment
+        
+        Results are served from / stored in the evaluation cache when one is
+        configured. Fallback assessments are never cached.
+        
+        Args:
+            on_section: Stream the response, reporting each completed top-level section
+            stream_metrics: Filled with time-to-first-section / time-to-complete when streaming
+            stage_findings: Stage assessments made during the interview (merged, not re-assessed)
+            budget_report: Filled with the tokens spent per prompt section (see _build_transcript_section)
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(
+                transcript=transcript,
+                interview_notes=interview_notes,
+                position=position,
+                prompt_version=PROMPT_VERSION,
+                model=EVALUATION_MODEL,
+                temperature=EVALUATION_TEMPERATURE,
+                candidate_name=candidate_name,
+                duration_minutes=duration_minutes,
+                stage_findings=stage_findings
+            )
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                if on_section:
+                    for section, value in cached.items():
+                        on_section(section, value)
+                return cached
+        
+        try:
+            assessment = await self._run_ai_assessment(
+                candidate_name=candidate_name,
+                position=position,
+                transcript=transcript,
+                interview_notes=interview_notes,
+                duration_minutes=duration_minutes,
+                on_section=on_section,
+                stream_metrics=stream_metrics,
+                stage_findings=stage_findings,
+                budget_report=budget_report
+            )
+        except Exception as e:
+            logger.error(f"Error generating AI assessment: {e}")
+            if not self.fallback_on_error:
+                raise
+            # Return fallback assessment
+            fallback = self._generate_fallback_assessment(interview_notes)
+            if on_section:
+                for section, value in fallback.items():
+                    on_section(section, value)
+            return fallback
+        
+        if cache_key is not None:
+            await asyncio.to_thread(self.cache.put, cache_key, assessment)
+        return assessment
+    
+    async def _run_ai_assessment(
+        self,
+        candidate_name: str,
+        position: str,
+        transcript: str,
+        interview_notes: List[Dict],
+        duration_minutes: int,
+        on_section: Callable[[str, Any], None] = None,
+        stream_metrics: Dict = None,
+        stage_findings: List[Dict] = None,
+        budget_report: Dict = None
+    ) -> Dict:
+        """
+        Call OpenAI for the assessment (raises on failure)
+        
+        The transcript is fitted into the model's context window by token
+        count (see _build_transcript_section); map-reduce over segments is
+        only used when the candidate's answers alone don't fit. Stage findings
+        produced during the interview are merged as-is, so only the remaining
+        turns need work.
         """
         
         # Prepare context for AI
         notes_summary = self._format_notes(interview_notes)
         
-        evaluation_prompt = f"""You are an expert hiring manager evaluating an interview. Analyze the following interview data and provide a comprehensive evaluation.
+        # Everything except the transcript is sent as-is; the transcript gets the rest of the window
+        system_prompt = self._build_assessment_messages("")[0]["content"]
+        instructions = self._build_evaluation_prompt(
+            candidate_name=candidate_name,
+            position=position,
+            duration_minutes=duration_minutes,
+            notes_summary="",
+            transcript_section=""
+        )
+        fixed_tokens = count_tokens(system_prompt) + count_tokens(instructions) + count_tokens(notes_summary)
+        budget_report = {} if budget_report is None else budget_report
+        
+        transcript_section = await self._build_transcript_section(
+            position=position,
+            transcript=transcript,
+            stage_findings=stage_findings,
+            budget_tokens=EVALUATION_CONTEXT_TOKENS - EVALUATION_RESPONSE_TOKENS - fixed_tokens,
+            budget_report=budget_report
+        )
+        budget_report["sections"] = section_tokens({
+            "system": system_prompt,
+            "instructions": instructions,
+            "notes": notes_summary,
+            "transcript": transcript_section
+        })
+        budget_report["context_tokens"] = EVALUATION_CONTEXT_TOKENS
+        budget_report["response_tokens_reserved"] = EVALUATION_RESPONSE_TOKENS
+        logger.info(f"Prompt budget: {budget_report['transcript_mode']}, tokens {budget_report['sections']}")
+        
+        evaluation_prompt = self._build_evaluation_prompt(
+            candidate_name=candidate_name,
+            position=position,
+            duration_minutes=duration_minutes,
+            notes_summary=notes_summary,
+            transcript_section=transcript_section
+        )
+        
+        if on_section:
+            return await self._stream_assessment(evaluation_prompt, on_section, stream_metrics)
+        
+        # Call OpenAI API for evaluation
+        response = await self._create_chat_completion(
+            messages=self._build_assessment_messages(evaluation_prompt),
+            response_format={"type": "json_object"}
+        )
+        
+        # Parse AI response
+        ai_response = response.choices[0].message.content
+        assessment = json.loads(ai_response)
+        
+        return assessment
+    
+    async def _stream_assessment(
+        self,
+        evaluation_prompt: str,
+        on_section: Callable[[str, Any], None],
+        stream_metrics: Dict = None
+    ) -> Dict:
+        """
+        Stream the final evaluation call, reporting sections as they complete
+        
+        Records time_to_first_section and time_to_complete (seconds since the
+        request was sent) plus per-section arrival times into stream_metrics.
+        """
+        parser = IncrementalSectionParser()
+        started = time.perf_counter()
+        section_times = {}
+        
+        async for delta in self._stream_chat_completion(
+            messages=self._build_assessment_messages(evaluation_prompt),
+            response_format={"type": "json_object"}
+        ):
+            for section, value in parser.feed(delta):
+                section_times[section] = round(time.perf_counter() - started, 3)
+                on_section(section, value)
+        
+        assessment = parser.result()
+        elapsed = round(time.perf_counter() - started, 3)
+        
+        if stream_metrics is not None:
+            stream_metrics.update({
+                "time_to_first_section": min(section_times.values()) if section_times else None,
+                "time_to_complete": elapsed,
+                "section_times": section_times
+            })
+        logger.info(
+            f"Streamed assessment: first section after {min(section_times.values(), default=elapsed)}s, "
+            f"complete after {elapsed}s"
+        )
+        return assessment
+    
+    def _window_transcript(self, heading: str, transcript: str, budget_tokens: int) -> tuple:
+        """
+        Priority-select transcript turns into `budget_tokens`
+        
+        Returns:
+            (prompt section, window from prompt_budget.select_transcript_window)
+        """
+        heading_tokens = count_tokens(heading) + SEPARATOR_TOKENS
+        window = select_transcript_window(split_transcript_turns(transcript), budget_tokens - heading_tokens)
+        omitted = sum(window["omitted"].values())
+        if omitted:
+            heading = f"{heading} ({omitted} interviewer turns omitted to fit the context window)"
+        return f"{heading}\n{window['text']}", window
+    
+    async def _build_transcript_section(
+        self,
+        position: str,
+        transcript: str,
+        stage_findings: Optional[List[Dict]],
+        budget_tokens: int,
+        budget_report: Dict
+    ) -> str:
+        """
+        Fit the transcript (and any stage findings) into `budget_tokens`
+        
+        The whole transcript is sent when it fits. Otherwise interviewer filler
+        and then interviewer questions are dropped before any candidate answer;
+        if the answers alone exceed the budget the transcript is map-reduced.
+        
+        budget_report gets transcript_mode ("full", "windowed" or "map_reduce",
+        prefixed with "stage_findings+" when findings are merged) and the
+        kept/omitted turn counts.
+        """
+        section = ""
+        heading = "INTERVIEW TRANSCRIPT:"
+        mode_prefix = ""
+        if stage_findings:
+            section = self._format_findings(
+                "INTERVIEW STAGE FINDINGS (assessed during the interview, chronological):",
+                [(f"STAGE: {item['stage'].upper()}", item["finding"]) for item in stage_findings]
+            )
+            budget_tokens -= count_tokens(section) + SEPARATOR_TOKENS
+            heading = "REMAINING TRANSCRIPT (not covered by the stage findings):"
+            mode_prefix = "stage_findings+"
+            if not transcript.strip():
+                budget_report["transcript_mode"] = "stage_findings"
+                return section
+        
+        transcript_part, window = self._window_transcript(heading, transcript, budget_tokens)
+        if window["fits"]:
+            budget_report["transcript_mode"] = mode_prefix + ("windowed" if any(window["omitted"].values()) else "full")
+            budget_report["turns_kept"] = window["kept"]
+            budget_report["turns_omitted"] = window["omitted"]
+        else:
+            budget_report["transcript_mode"] = mode_prefix + "map_reduce"
+            transcript_part = await self._map_transcript_segments(position, transcript)
+        
+        return f"{section}\n\n{transcript_part}" if section else transcript_part
+    
+    def _build_assessment_messages(self, evaluation_prompt: str) -> List[Dict]:
+        """Chat messages for the final evaluation call"""
+        return [
+            {
+                "role": "system",
+                "content": "You are an expert hiring manager and interview evaluator. Provide thorough, fair, and data-driven assessments."
+            },
+            {
+                "role": "user",
+                "content": evaluation_prompt
+            }
+        ]
+    
+    def _build_evaluation_prompt(
+        self,
+        candidate_name: str,
+        position: str,
+        duration_minutes: int,
+        notes_summary: str,
+        transcript_section: str
+    ) -> str:
+        """Build the final evaluation prompt (transcript_section carries its own heading)"""
+        return f"""You are an expert hiring manager evaluating an interview. Analyze the following interview data and provide a comprehensive evaluation.
 
 INTERVIEW DETAILS:
 - Candidate: {candidate_name}
@@ -113,8 +697,7 @@ INTERVIEW DETAILS:
 INTERVIEW NOTES:
 {notes_summary}
 
-INTERVIEW TRANSCRIPT:
-{transcript[:4000]}  # Limit transcript length for API
+{transcript_section}
 
 Based on this interview, provide a detailed evaluation in the following JSON format:
 
@@ -182,35 +765,97 @@ Based on this interview, provide a detailed evaluation in the following JSON for
 }}
 
 Provide ONLY the JSON output, no additional text."""
+    
+    async def _map_transcript_segments(self, position: str, transcript: str) -> str:
+        """
+        Map step - analyse transcript segments concurrently
+        
+        Returns:
+            Prompt section with the chronological findings for every segment
+        """
+        segments = segment_transcript(split_transcript_turns(transcript), SEGMENT_MAX_TOKENS)
+        logger.info(f"Long transcript ({len(transcript)} chars) - evaluating {len(segments)} segments")
+        
+        findings = await asyncio.gather(*[
+            self._assess_segment(position, segment, f"part {index} of {len(segments)}")
+            for index, segment in enumerate(segments, 1)
+        ])
+        
+        return self._format_findings(
+            "INTERVIEW SEGMENT FINDINGS (chronological analysis of the transcript):",
+            [(f"SEGMENT {index}/{len(segments)}", finding) for index, finding in enumerate(findings, 1)]
+        )
+    
+    def _format_findings(self, heading: str, labelled_findings: List[tuple]) -> str:
+        """Format (label, finding) pairs as a prompt section"""
+        formatted = [
+            f"[{label}]\n{json.dumps(finding, indent=1, ensure_ascii=False)}"
+            for label, finding in labelled_findings
+        ]
+        return heading + "\n" + "\n\n".join(formatted)
+    
+    async def assess_stage(self, position: str, stage: str, stage_transcript: str) -> Dict:
+        """
+        Partial assessment of one finished interview stage
+        
+        Used during the live interview so that only a cheap merge is left at
+        disconnect (see incremental_evaluation.StageAssessmentTracker).
+        
+        Returns:
+            Segment finding dict (summary, candidate_answers, evidence, ...)
+        """
+        logger.info(f"Assessing finished stage '{stage}' ({len(stage_transcript)} chars)")
+        return await self._assess_segment(position, stage_transcript, f"the '{stage}' stage")
+    
+    async def _assess_segment(self, position: str, segment: str, part_label: str) -> Dict:
+        """Extract the candidate's answers and evidence from one transcript segment"""
+        segment_prompt = f"""You are analysing {part_label} of an interview for the position of {position}.
+Extract what the candidate said in this part so it can be evaluated later. Do not score the whole interview.
 
-        try:
-            # Call OpenAI API for evaluation
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert hiring manager and interview evaluator. Provide thorough, fair, and data-driven assessments."
-                    },
-                    {
-                        "role": "user",
-                        "content": evaluation_prompt
-                    }
-                ],
-                temperature=0.3,  # Lower temperature for consistent evaluation
-                response_format={"type": "json_object"}
-            )
-            
-            # Parse AI response
-            ai_response = response.choices[0].message.content
-            assessment = json.loads(ai_response)
-            
-            return assessment
-            
-        except Exception as e:
-            logger.error(f"Error generating AI assessment: {e}")
-            # Return fallback assessment
-            return self._generate_fallback_assessment(interview_notes)
+TRANSCRIPT SEGMENT:
+{segment}
+
+Respond in the following JSON format:
+
+{{
+    "summary": "1-2 sentences on what was discussed",
+    "candidate_answers": [
+        {{
+            "question": "question asked (short)",
+            "answer_summary": "what the candidate answered, with concrete details",
+            "quality": 1-10
+        }}
+    ],
+    "evidence": {{
+        "technical_skills": ["specific examples"],
+        "problem_solving": ["specific examples"],
+        "communication": ["specific examples"],
+        "experience_relevance": ["specific examples"],
+        "cultural_fit": ["specific examples"]
+    }},
+    "strengths": ["observed strengths"],
+    "weaknesses": ["observed weaknesses"],
+    "red_flags": ["concerns, empty array if none"],
+    "highlights": ["notable moments"]
+}}
+
+Provide ONLY the JSON output, no additional text."""
+        
+        response = await self._create_chat_completion(
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are an expert interview analyst. Extract evidence faithfully and concisely."
+                },
+                {
+                    "role": "user",
+                    "content": segment_prompt
+                }
+            ],
+            max_tokens=SEGMENT_MAX_OUTPUT_TOKENS,
+            response_format={"type": "json_object"}
+        )
+        return json.loads(response.choices[0].message.content)
     
     def _format_notes(self, notes: List[Dict]) -> str:
         """Format interview notes for AI consumption"""
@@ -252,7 +897,7 @@ Provide ONLY the JSON output, no additional text."""
         }
     
     def _save_evaluation(self, evaluation: Dict) -> str:
-        """Save evaluation to JSON file"""
+        """Save evaluation to JSON file (or to the compressed archive)"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Sanitize candidate name and position for filename
@@ -262,24 +907,63 @@ Provide ONLY the JSON output, no additional text."""
         position = evaluation["metadata"]["position"].replace(" ", "_")
         position = position.replace("/", "-").replace("\\", "-")  # Remove slashes
         
-        filename = f"{candidate_name}_{position}_{timestamp}.json"
-        filepath = self.evaluations_dir / filename
+        if self.archive is not None:
+            filename = f"{candidate_name}_{position}_{timestamp}.json"
+            suffix = 1
+            while True:
+                try:
+                    # The key check and the append share one write transaction
+                    location = self.archive.append(filename, evaluation)
+                    break
+                except FileExistsError:
+                    suffix += 1
+                    filename = f"{candidate_name}_{position}_{timestamp}_{suffix}.json"
+            self.store.index_evaluation(filename, evaluation)
+            logger.info(f"Evaluation archived to: {location}")
+            return location
+        
+        # Several evaluations can finish within the same second (bulk runs, queue workers)
+        filepath = self.evaluations_dir / f"{candidate_name}_{position}_{timestamp}.json"
+        suffix = 1
+        while True:
+            try:
+                f = open(filepath, 'x', encoding='utf-8')
+                break
+            except FileExistsError:
+                suffix += 1
+                filepath = self.evaluations_dir / f"{candidate_name}_{position}_{timestamp}_{suffix}.json"
         
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with f:
             json.dump(evaluation, f, indent=2, ensure_ascii=False)
         
+        # Keep the candidate/position/date/score/decision index in sync
+        self.store.index_evaluation(filepath.name, evaluation)
+        
         logger.info(f"Evaluation saved to: {filepath}")
         return str(filepath)
     
     def load_evaluation(self, filename: str) -> Dict:
-        """Load a saved evaluation"""
+        """Load a saved evaluation (JSON file, or archived record with the same name)"""
         filepath = self.evaluations_dir / filename
+        if not filepath.exists() and self.archive is not None and self.archive.contains(filename):
+            return self.archive.get(filename)
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
     
     def list_evaluations(self) -> List[str]:
-        """List all saved evaluations"""
-        return [f.name for f in self.evaluations_dir.glob("*.json")]
+        """List all saved evaluations (newest first)"""
+        return [row["filename"] for row in self.store.query(limit=-1)]
+    
+    def query_evaluations(self, **filters) -> List[Dict]:
+        """
+        Find evaluations through the index without opening every file
+        
+        Usage:
+            evaluator.query_evaluations(position="AI Developer", min_score=7, limit=20)
+        
+        See EvaluationStore.query for the available filters and pagination.
+        """
+        return self.store.query(**filters)
     
     def generate_summary_report(self, evaluation: Dict) -> str:
         """Generate a human-readable summary report"""
@@ -0,0 +1,221 @@
+"""
+Compressed evaluation archive
+Optional storage format for evaluations: zstd-compressed records appended to
+segment files, with an offset index for random access. Each record holds the
+exact JSON text _save_evaluation would have written, so reading it back is
+byte-for-byte identical to the pretty-printed file.
+
+Requires the optional `zstandard` package (pip install zstandard).
+
+Pack existing JSON evaluations into the archive with:
+    python evaluation_archive.py pack [evaluations_dir]
+"""
+
+import json
+import logging
+import sqlite3
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+try:
+    import zstandard as zstd
+except ImportError:  # Optional dependency
+    zstd = None
+
+logger = logging.getLogger("interview-evaluation-archive")
+
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024  # Start a new segment file after this size
+COMPRESSION_LEVEL = 10
+SEGMENT_PATTERN = "segment_{:06d}.evz"
+
+# Record layout: 4-byte big-endian length, then the zstd frame
+_LENGTH = struct.Struct(">I")
+
+
+def serialize_evaluation(evaluation: Dict) -> str:
+    """The exact JSON text used for evaluation files"""
+    return json.dumps(evaluation, indent=2, ensure_ascii=False)
+
+
+class EvaluationArchive:
+    """
+    Append-only, zstd-compressed evaluation segments with an offset index
+
+    Records are only ever appended; the SQLite index maps each key (the
+    evaluation's file name) to (segment, offset, length), so any single
+    evaluation is read with one seek and one decompression. Appends hold the
+    index write lock, so several processes can share one archive.
+    """
+
+    def __init__(self, archive_dir: str = "evaluations/archive", segment_max_bytes: int = SEGMENT_MAX_BYTES):
+        if zstd is None:
+            raise ImportError("The evaluation archive requires the 'zstandard' package (pip install zstandard)")
+
+        self.archive_dir = Path(archive_dir)
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self._compressor = zstd.ZstdCompressor(level=COMPRESSION_LEVEL)
+        self._decompressor = zstd.ZstdDecompressor()
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.archive_dir / "archive_index.db"),
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=30
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS archive_records (
+                key TEXT PRIMARY KEY,
+                segment INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                raw_length INTEGER NOT NULL
+            )
+        """)
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.archive_dir / SEGMENT_PATTERN.format(segment)
+
+    def _current_segment(self) -> int:
+        row = self._conn.execute("SELECT MAX(segment) FROM archive_records").fetchone()
+        segment = row[0] or 1
+        path = self._segment_path(segment)
+        if path.exists() and path.stat().st_size >= self.segment_max_bytes:
+            segment += 1
+        return segment
+
+    def append(self, key: str, evaluation: Dict) -> str:
+        """
+        Append an evaluation to the archive
+
+        Args:
+            key: Unique record key (the evaluation's file name)
+            evaluation: Evaluation dictionary
+
+        Returns:
+            Location string "<segment file>#<key>"
+
+        Raises:
+            FileExistsError: if the archive already holds a record with this key
+                (checked under the archive's write lock, like open(..., "x"))
+        """
+        raw = serialize_evaluation(evaluation).encode("utf-8")
+        frame = self._compressor.compress(raw)
+
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock - serialises appends across processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self._conn.execute("SELECT 1 FROM archive_records WHERE key = ?", (key,)).fetchone():
+                    raise FileExistsError(f"Archive already contains {key}")
+
+                segment = self._current_segment()
+                path = self._segment_path(segment)
+                with open(path, "ab") as f:
+                    # Append at the real end of file; bytes left by an interrupted
+                    # append are never indexed and simply skipped
+                    offset = f.seek(0, 2)
+                    f.write(_LENGTH.pack(len(frame)))
+                    f.write(frame)
+
+                self._conn.execute(
+                    "INSERT INTO archive_records VALUES (?, ?, ?, ?, ?)",
+                    (key, segment, offset, len(frame), len(raw))
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return f"{path}#{key}"
+
+    def get_text(self, key: str) -> str:
+        """Get the exact JSON text of an archived evaluation"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT segment, offset, length FROM archive_records WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(key)
+
+        segment, offset, length = row
+        with open(self._segment_path(segment), "rb") as f:
+            f.seek(offset)
+            (stored_length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+            if stored_length != length:
+                raise ValueError(f"Corrupt archive record for {key}")
+            frame = f.read(length)
+        return self._decompressor.decompress(frame).decode("utf-8")
+
+    def get(self, key: str) -> Dict:
+        """Load an archived evaluation"""
+        return json.loads(self.get_text(key))
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM archive_records WHERE key = ?", (key,)).fetchone() is not None
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT key FROM archive_records ORDER BY segment, offset")]
+
+    def stats(self) -> Dict:
+        """Record count, raw vs. stored size and compression ratio"""
+        with self._lock:
+            count, stored, raw = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length), 0), COALESCE(SUM(raw_length), 0) FROM archive_records"
+            ).fetchone()
+        return {
+            "records": count,
+            "stored_bytes": stored,
+            "raw_bytes": raw,
+            "compression_ratio": round(raw / stored, 2) if stored else None
+        }
+
+    def pack(self, evaluations_dir: str = "evaluations") -> Dict:
+        """
+        Copy existing JSON evaluation files into the archive
+
+        Every record is read back and compared with the original file before
+        it counts as packed. The JSON files themselves are not removed.
+
+        Returns:
+            Counts of packed, skipped and mismatched files
+        """
+        packed = skipped = mismatched = 0
+        for path in sorted(Path(evaluations_dir).glob("*.json")):
+            if self.contains(path.name):
+                skipped += 1
+                continue
+            original = path.read_text(encoding="utf-8")
+            evaluation = json.loads(original)
+            if "metadata" not in evaluation:
+                skipped += 1
+                continue
+
+            self.append(path.name, evaluation)
+            if self.get_text(path.name) != original:
+                mismatched += 1
+                logger.warning(f"{path.name}: archived text differs from the original file")
+            else:
+                packed += 1
+        return {"packed": packed, "skipped": skipped, "mismatched": mismatched}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "pack":
+        print("\n📖 Usage: python evaluation_archive.py pack [evaluations_dir]\n")
+        sys.exit(1)
+
+    directory = sys.argv[2] if len(sys.argv) > 2 else "evaluations"
+    archive = EvaluationArchive(str(Path(directory) / "archive"))
+    result = archive.pack(directory)
+    stats = archive.stats()
+    print(f"\n✅ Packed {result['packed']} evaluation(s) ({result['skipped']} skipped, {result['mismatched']} mismatched)")
+    print(f"📦 Archive: {stats['records']} records, {stats['raw_bytes']} → {stats['stored_bytes']} bytes "
+          f"(x{stats['compression_ratio']})\n")
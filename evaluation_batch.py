@@ -0,0 +1,190 @@
+"""
+Batch transports for offline evaluation
+InterviewEvaluator.evaluate_interviews_batch writes all evaluation requests
+to one JSONL file and hands it to a transport: the OpenAI Batch API for real
+backfills, or a local file-based stand-in that runs the same flow offline.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from evaluation import get_async_openai_client
+
+logger = logging.getLogger("interview-evaluation-batch")
+
+# Batch states after which polling stops
+BATCH_TERMINAL_STATES = ("completed", "failed", "expired", "cancelled")
+
+
+class BatchTransport:
+    """
+    Interface for submitting a JSONL batch of chat completion requests
+
+    Each request line is {"custom_id", "method", "url", "body"}; each result
+    line is {"custom_id", "response": {"status_code", "body"}, "error"} as in
+    the OpenAI Batch API.
+    """
+
+    async def submit(self, batch_file: Path) -> str:
+        """Submit a JSONL batch file and return the batch id"""
+        raise NotImplementedError
+
+    async def poll(self, batch_id: str) -> Dict:
+        """Get batch status - a dict with at least a 'status' key"""
+        raise NotImplementedError
+
+    async def fetch_results(self, batch_id: str) -> List[Dict]:
+        """Get the result lines of a completed batch"""
+        raise NotImplementedError
+
+
+class OpenAIBatchTransport(BatchTransport):
+    """Submit batches to the OpenAI Batch API (24h completion window, reduced cost)"""
+
+    def __init__(self, openai_api_key: str = None, completion_window: str = "24h"):
+        self.api_key = openai_api_key
+        self.completion_window = completion_window
+        self._output_file_ids = {}
+
+    async def submit(self, batch_file: Path) -> str:
+        client = get_async_openai_client(self.api_key)
+        content = await asyncio.to_thread(Path(batch_file).read_bytes)
+        uploaded = await client.files.create(file=(Path(batch_file).name, content), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.completion_window
+        )
+        logger.info(f"Submitted OpenAI batch {batch.id} ({batch_file})")
+        return batch.id
+
+    async def poll(self, batch_id: str) -> Dict:
+        client = get_async_openai_client(self.api_key)
+        batch = await client.batches.retrieve(batch_id)
+        if batch.output_file_id:
+            self._output_file_ids[batch_id] = batch.output_file_id
+        counts = batch.request_counts
+        return {
+            "status": batch.status,
+            "completed": counts.completed if counts else None,
+            "failed": counts.failed if counts else None,
+            "total": counts.total if counts else None
+        }
+
+    async def fetch_results(self, batch_id: str) -> List[Dict]:
+        output_file_id = self._output_file_ids.get(batch_id)
+        if not output_file_id:
+            return []
+        client = get_async_openai_client(self.api_key)
+        content = await client.files.content(output_file_id)
+        return [json.loads(line) for line in content.text.splitlines() if line.strip()]
+
+
+def _offline_assessment(request_body: Dict) -> Dict:
+    """Default responder for the local transport - a neutral, schema-complete assessment"""
+    return {
+        "overall_assessment": {
+            "summary": "Offline batch assessment",
+            "hire_recommendation": "Needs Review",
+            "confidence_level": "Low",
+            "reasoning": "Produced by the local batch transport"
+        },
+        "detailed_evaluation": {},
+        "ratings": {"overall_score": 5},
+        "strengths": [],
+        "weaknesses": [],
+        "red_flags": [],
+        "key_highlights": [],
+        "recommendation": {
+            "decision": "Needs Review",
+            "next_steps": "Manual evaluation required",
+            "concerns_to_address": [],
+            "role_fit_percentage": 50
+        },
+        "feedback_for_candidate": "",
+        "transcript_summary": ""
+    }
+
+
+class LocalBatchTransport(BatchTransport):
+    """
+    File-based stand-in for the Batch API
+
+    Copies the batch into `work_dir/<batch_id>/`, "processes" it on the first
+    poll by calling `responder(request_body) -> assessment dict` for every
+    line, and writes an output JSONL in the Batch API result format. Lets the
+    full batch flow run without a network.
+    """
+
+    def __init__(self, work_dir: str = "evaluations/batches/local", responder: Callable[[Dict], Dict] = None):
+        self.work_dir = Path(work_dir)
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.responder = responder or _offline_assessment
+
+    def _batch_dir(self, batch_id: str) -> Path:
+        return self.work_dir / batch_id
+
+    async def submit(self, batch_file: Path) -> str:
+        batch_id = f"local_batch_{uuid.uuid4().hex[:12]}"
+        batch_dir = self._batch_dir(batch_id)
+        batch_dir.mkdir(parents=True)
+        content = await asyncio.to_thread(Path(batch_file).read_text, encoding="utf-8")
+        await asyncio.to_thread((batch_dir / "input.jsonl").write_text, content, encoding="utf-8")
+        return batch_id
+
+    def _process(self, batch_id: str) -> None:
+        batch_dir = self._batch_dir(batch_id)
+        results = []
+        for line in (batch_dir / "input.jsonl").read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            try:
+                content = json.dumps(self.responder(request["body"]), ensure_ascii=False)
+                results.append({
+                    "custom_id": request["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": {"choices": [{"message": {"role": "assistant", "content": content}}]}
+                    },
+                    "error": None
+                })
+            except Exception as e:
+                results.append({"custom_id": request["custom_id"], "response": None, "error": {"message": str(e)}})
+
+        with open(batch_dir / "output.jsonl", "w", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+    async def poll(self, batch_id: str) -> Dict:
+        output = self._batch_dir(batch_id) / "output.jsonl"
+        if not output.exists():
+            await asyncio.to_thread(self._process, batch_id)
+        return {"status": "completed"}
+
+    async def fetch_results(self, batch_id: str) -> List[Dict]:
+        output = self._batch_dir(batch_id) / "output.jsonl"
+        text = await asyncio.to_thread(output.read_text, encoding="utf-8")
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def parse_batch_result(result: Optional[Dict]) -> Dict:
+    """
+    Extract the assessment JSON from one batch result line
+
+    Raises:
+        ValueError: if the request failed or the content is not valid JSON
+    """
+    if result is None:
+        raise ValueError("No result returned for request")
+    if result.get("error"):
+        raise ValueError(f"Batch request failed: {result['error']}")
+    response = result.get("response") or {}
+    if response.get("status_code") != 200:
+        raise ValueError(f"Batch request returned status {response.get('status_code')}")
+    content = response["body"]["choices"][0]["message"]["content"]
+    return json.loads(content)
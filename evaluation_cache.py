@@ -0,0 +1,177 @@
+"""
+Content-addressed cache for AI evaluation results
+Re-evaluating an unchanged conversation (same transcript, notes, position,
+prompt version, model and temperature) returns the stored assessment
+instead of paying for another GPT-4o call.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger("interview-evaluation-cache")
+
+# Cache settings (override via environment / .env)
+CACHE_DB_PATH = os.getenv("EVALUATION_CACHE_DB", "evaluations/evaluation_cache.db")
+CACHE_MAX_ENTRIES = int(os.getenv("EVALUATION_CACHE_MAX_ENTRIES", "2000"))
+CACHE_MAX_BYTES = int(os.getenv("EVALUATION_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+CACHE_TTL_SECONDS = float(os.getenv("EVALUATION_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+
+
+def make_cache_key(
+    transcript: str,
+    interview_notes: List[Dict],
+    position: str,
+    prompt_version: str,
+    model: str,
+    temperature: float,
+    **extra
+) -> str:
+    """
+    Hash every input that influences the assessment into a cache key
+
+    Args:
+        extra: Any other prompt inputs (e.g. candidate_name, duration_minutes)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    material = {
+        "transcript": transcript,
+        "interview_notes": interview_notes,
+        "position": position,
+        "prompt_version": prompt_version,
+        "model": model,
+        "temperature": temperature,
+        **extra
+    }
+    canonical = json.dumps(material, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class EvaluationCache:
+    """
+    Bounded on-disk (SQLite) cache with LRU and TTL eviction
+
+    Entries older than `ttl_seconds` are treated as misses. When the cache
+    holds more than `max_entries` or `max_bytes`, the least recently used
+    entries are evicted.
+    """
+
+    def __init__(
+        self,
+        db_path: str = CACHE_DB_PATH,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_BYTES,
+        ttl_seconds: float = CACHE_TTL_SECONDS
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS evaluation_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_last_access ON evaluation_cache (last_access)")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Get a cached assessment, or None on a miss"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM evaluation_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            if now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM evaluation_cache WHERE key = ?", (key,))
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE evaluation_cache SET last_access = ? WHERE key = ?", (now, key))
+            self.hits += 1
+
+        logger.info(f"Evaluation cache hit: {key[:12]}")
+        return json.loads(row[0])
+
+    def put(self, key: str, assessment: Dict) -> None:
+        """Store an assessment and evict entries beyond the configured bounds"""
+        value = json.dumps(assessment, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO evaluation_cache (key, value, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value.encode("utf-8")), now, now)
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones until within bounds"""
+        expired = self._conn.execute(
+            "DELETE FROM evaluation_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+        self.evictions += max(expired, 0)
+
+        count, total_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM evaluation_cache"
+        ).fetchone()
+        if count <= self.max_entries and total_bytes <= self.max_bytes:
+            return
+
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM evaluation_cache ORDER BY last_access"
+        ).fetchall():
+            if count <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM evaluation_cache WHERE key = ?", (key,))
+            count -= 1
+            total_bytes -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        with self._lock:
+            self._conn.execute("DELETE FROM evaluation_cache")
+
+    def stats(self) -> Dict:
+        """Get hit/miss counters and current size"""
+        with self._lock:
+            count, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM evaluation_cache"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": count,
+            "bytes": total_bytes
+        }
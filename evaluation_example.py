@@ -5,6 +5,7 @@ Useful for testing or re-evaluating past interviews
 
 import asyncio
 from evaluation import InterviewEvaluator
+from evaluation_cache import EvaluationCache
 
 async def main():
     # Example interview data
@@ -76,8 +77,8 @@ Candidate: Thank you for the opportunity!
         "current_company": "XYZ Corp"
     }
     
-    # Create evaluator and generate assessment
-    evaluator = InterviewEvaluator()
+    # Create evaluator and generate assessment (cached - re-runs don't call OpenAI again)
+    evaluator = InterviewEvaluator(cache=EvaluationCache())
     
     print("Starting evaluation...\n")
     
@@ -114,6 +115,7 @@ Candidate: Thank you for the opportunity!
             print(f"  • {flag}")
     
     print(f"\n✅ Evaluation saved to: {evaluation['metadata']['saved_to']}")
+    print(f"🗄️  Cache stats: {evaluator.cache.stats()}")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,221 @@
+"""
+Process-isolated evaluation executor
+Runs evaluation jobs - InterviewEvaluator.evaluate_interview and
+generate_summary_report - either in the session process or in a long-lived
+separate process. With the separate process, the JSON parsing, report
+rendering and file writes of an evaluation spike run on another
+interpreter, and the realtime session keeps its GIL and CPU for audio and
+noise cancellation.
+
+Enable with EVALUATION_PROCESSES=N (default 0: run in the session process).
+N caps the evaluation processes per host: every LiveKit job process starts
+at most one, on its first evaluation, and only while one of the N host slots
+(lock files in EVALUATION_SLOT_DIR) is free - otherwise it evaluates
+in-process. Spawned processes re-import the worker's main module, so they
+are never started during prewarm.
+
+Interview data goes to the evaluation process by pickling; the saved
+evaluation path comes back. The process keeps one event loop for its
+lifetime, so its shared OpenAI client and connection pool are reused across
+jobs.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import tempfile
+import traceback
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import IO, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no host-wide slots, one evaluation process per job process
+    fcntl = None
+
+from evaluation import InterviewEvaluator
+
+logger = logging.getLogger("interview-evaluation-executor")
+
+EVALUATION_PROCESSES = int(os.getenv("EVALUATION_PROCESSES", "0"))  # Per host
+EVALUATION_SLOT_DIR = os.getenv(
+    "EVALUATION_SLOT_DIR",
+    os.path.join(tempfile.gettempdir(), "interview-evaluation-slots")
+)
+
+
+async def evaluate_job(interview_data: Dict, final_attempt: bool) -> str:
+    """
+    Run the assessment for one queued interview and print the report
+
+    Args:
+        interview_data: Output of InterviewTools.get_interview_data_for_evaluation()
+        final_attempt: Save a fallback assessment instead of raising on AI errors
+
+    Returns:
+        Path of the saved evaluation
+    """
+    # Create evaluator and run assessment
+    evaluator = InterviewEvaluator(fallback_on_error=final_attempt)
+    stage_findings = interview_data.get("stage_findings")
+    evaluation = await evaluator.evaluate_interview(
+        candidate_name=interview_data["candidate_name"],
+        position=interview_data["position"],
+        transcript=interview_data["unassessed_transcript"] if stage_findings else interview_data["transcript"],
+        interview_notes=interview_data["interview_notes"],
+        duration_minutes=interview_data["duration_minutes"],
+        candidate_info=interview_data["candidate_info"],
+        stage_findings=stage_findings,
+        turn_latency=interview_data.get("turn_latency")  # Absent in jobs queued by older workers
+    )
+
+    # Print summary report
+    summary_report = evaluator.generate_summary_report(evaluation)
+    print(summary_report)
+
+    # Print file location
+    print(f"\n✅ Full evaluation saved to: {evaluation['metadata']['saved_to']}")
+    print(f"📊 Overall Recommendation: {evaluation['recommendation']['decision']}")
+    print(f"📈 Role Fit: {evaluation['recommendation']['role_fit_percentage']}%")
+    print("\n" + "="*70 + "\n")
+
+    return evaluation['metadata']['saved_to']
+
+
+# Event loop of a pool process - lives as long as the process
+_process_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _init_process() -> None:
+    global _process_loop
+    logging.basicConfig(level=logging.INFO)
+    _process_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_process_loop)
+
+
+def _process_ready() -> int:
+    return os.getpid()
+
+
+def _evaluate_in_process(interview_data: Dict, final_attempt: bool) -> str:
+    """Pool entry point - runs evaluate_job on the process's event loop"""
+    try:
+        return _process_loop.run_until_complete(evaluate_job(interview_data, final_attempt))
+    except Exception as e:
+        # Library exceptions don't always survive pickling back to the parent
+        logger.error(f"Evaluation failed in process {os.getpid()}:\n{traceback.format_exc()}")
+        raise RuntimeError(f"{type(e).__name__}: {e}") from None
+
+
+def claim_host_slot(limit: int) -> Optional[IO]:
+    """
+    Take one of `limit` host-wide evaluation process slots
+
+    Slots are lock files in EVALUATION_SLOT_DIR. The lock is held while the
+    returned file stays open and is dropped by the OS if the process dies.
+
+    Returns:
+        The open slot file, or None if every slot is taken
+    """
+    os.makedirs(EVALUATION_SLOT_DIR, exist_ok=True)
+    for index in range(limit):
+        slot = open(os.path.join(EVALUATION_SLOT_DIR, f"slot-{index}.lock"), "a")
+        if fcntl is None:
+            return slot
+        try:
+            fcntl.flock(slot, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return slot
+        except OSError:
+            slot.close()
+    return None
+
+
+class EvaluationExecutor:
+    """
+    Runs evaluation jobs in-process or in one long-lived separate process
+
+    The process is started with "spawn", so it never inherits the realtime
+    session's threads or sockets. A crashed process fails the running job,
+    which the evaluation queue retries, and a new one is started for the
+    next job.
+    """
+
+    def __init__(self, processes: int = EVALUATION_PROCESSES):
+        """
+        Args:
+            processes: Evaluation processes allowed on this host; 0 runs evaluations in this process
+        """
+        self.processes = processes
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._slot: Optional[IO] = None
+
+    def start(self) -> bool:
+        """
+        Claim a host slot and start this process's evaluation process (blocking)
+
+        Returns:
+            True if evaluations will run in the separate process, False if
+            they run in-process (disabled, or every host slot is taken)
+        """
+        if self._pool is not None:
+            return True
+        if self.processes <= 0:
+            return False
+        if self._slot is None:
+            self._slot = claim_host_slot(self.processes)
+            if self._slot is None:
+                logger.info(f"All {self.processes} evaluation process slot(s) on this host are busy - evaluating in-process")
+                return False
+        self._pool = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_process
+        )
+        # The process is spawned on demand - wait until it is up
+        wait([self._pool.submit(_process_ready)])
+        logger.info(f"Started evaluation process (slot {self._slot.name})")
+        return True
+
+    async def run(self, interview_data: Dict, final_attempt: bool) -> str:
+        """
+        Evaluate one interview (evaluation queue handler signature)
+
+        Returns:
+            Path of the saved evaluation
+        """
+        if self._pool is None and (self.processes <= 0 or not await asyncio.to_thread(self.start)):
+            return await evaluate_job(interview_data, final_attempt)
+
+        pool = self._pool
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                pool, _evaluate_in_process, interview_data, final_attempt
+            )
+        except BrokenProcessPool:
+            logger.error("Evaluation process died - starting a new one for the next job")
+            if self._pool is pool:
+                self._pool = None
+                pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def shutdown(self) -> None:
+        """Stop the evaluation process after its current job and free the host slot"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self._slot is not None:
+            self._slot.close()
+            self._slot = None
+
+
+_executor: Optional[EvaluationExecutor] = None
+
+
+def get_evaluation_executor() -> EvaluationExecutor:
+    """Process-wide evaluation executor (see EVALUATION_PROCESSES)"""
+    global _executor
+    if _executor is None:
+        _executor = EvaluationExecutor()
+    return _executor
@@ -0,0 +1,422 @@
+"""
+Durable evaluation job queue
+Persists post-interview evaluations in SQLite and runs them on a bounded,
+rate-limited worker pool with retries, so bursts of finished interviews
+neither overload OpenAI nor get lost when a worker restarts.
+
+Every process using the same queue file shares one OpenAI rate budget (the
+token buckets live in the database) and only runs its own jobs, plus jobs
+whose owner released them or stopped renewing its ownership lease.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from evaluation_executor import get_evaluation_executor
+
+logger = logging.getLogger("interview-evaluation-queue")
+
+# Queue settings (override via environment / .env)
+QUEUE_DB_PATH = os.getenv("EVALUATION_QUEUE_DB", "evaluations/evaluation_jobs.db")
+QUEUE_WORKERS = int(os.getenv("EVALUATION_WORKERS", "4"))
+OPENAI_RPM_LIMIT = int(os.getenv("OPENAI_RPM_LIMIT", "500"))  # Requests per minute
+OPENAI_TPM_LIMIT = int(os.getenv("OPENAI_TPM_LIMIT", "30000"))  # Tokens per minute
+MAX_ATTEMPTS = int(os.getenv("EVALUATION_MAX_ATTEMPTS", "5"))
+BACKOFF_BASE_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 300.0
+LEASE_SECONDS = 600.0  # A running job whose lease expires is considered abandoned
+OWNER_LEASE_SECONDS = 60.0  # Jobs of a process that stops renewing this long can be taken over
+POLL_INTERVAL_SECONDS = 1.0
+
+# Rough token budget for one evaluation: prompt (~4 chars per token) plus the JSON answer
+EVALUATION_OUTPUT_TOKENS = 2000
+PROMPT_OVERHEAD_TOKENS = 1200
+
+JobHandler = Callable[[Dict, bool], Awaitable[Optional[str]]]
+
+
+class SharedTokenBucket:
+    """
+    Token bucket stored in the queue database
+
+    Refills continuously at `rate_per_minute` up to `capacity`. The bucket
+    state is one row, read and updated in a single IMMEDIATE transaction, so
+    every process using the queue file draws from the same budget. Refill
+    uses wall-clock time, which all those processes share. Callers await
+    `acquire(amount)`, which sleeps (without blocking the loop) until enough
+    tokens are available.
+    """
+
+    def __init__(self, queue: "EvaluationJobQueue", name: str, rate_per_minute: float, capacity: float = None):
+        self.queue = queue
+        self.name = name
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+
+    def _try_take(self, amount: float) -> float:
+        """Take `amount` tokens if available; returns 0, or the seconds to wait before retrying"""
+        with self.queue._transaction() as conn:
+            row = conn.execute("SELECT tokens, updated_at FROM rate_limits WHERE name = ?", (self.name,)).fetchone()
+            now = time.time()
+            if row is None:
+                tokens = self.capacity
+            else:
+                tokens = min(self.capacity, row[0] + max(0.0, now - row[1]) * self.rate)
+            wait = 0.0
+            if tokens >= amount:
+                tokens -= amount
+            else:
+                wait = (amount - tokens) / self.rate
+            conn.execute(
+                "INSERT INTO rate_limits (name, tokens, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at",
+                (self.name, tokens, now)
+            )
+        return wait
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until `amount` tokens are available and take them"""
+        # Never ask for more than the bucket can ever hold
+        amount = min(amount, self.capacity)
+        while True:
+            wait = await asyncio.to_thread(self._try_take, amount)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+
+def estimate_evaluation_tokens(interview_data: Dict) -> int:
+    """Estimate the OpenAI tokens one evaluation of this interview will consume"""
+    transcript_chars = len(interview_data.get("transcript", ""))
+    notes_chars = sum(len(note.get("note", "")) for note in interview_data.get("interview_notes", []))
+    return (transcript_chars + notes_chars) // 4 + PROMPT_OVERHEAD_TOKENS + EVALUATION_OUTPUT_TOKENS
+
+
+async def run_evaluation(interview_data: Dict, final_attempt: bool) -> str:
+    """
+    Default job handler - evaluates the interview and saves the report
+
+    Runs through the evaluation executor (see evaluation_executor.evaluate_job),
+    so stage findings and turn latency are kept and EVALUATION_PROCESSES applies.
+
+    Args:
+        interview_data: Output of InterviewTools.get_interview_data_for_evaluation()
+        final_attempt: When True a fallback assessment is saved instead of raising
+
+    Returns:
+        Path of the saved evaluation
+    """
+    return await get_evaluation_executor().run(interview_data, final_attempt)
+
+
+class EvaluationJobQueue:
+    """
+    SQLite-backed evaluation queue with a worker pool
+
+    Jobs are written to disk before `enqueue` returns. Workers claim jobs with
+    a lease; jobs whose lease expired (worker crashed mid-evaluation) and jobs
+    still pending from a previous run are picked up again on startup.
+
+    Each queue instance owns the jobs it enqueues or claims and renews that
+    ownership while it runs. Other processes leave them alone until they are
+    released by stop() or the ownership lease lapses (the owner died).
+    """
+
+    def __init__(
+        self,
+        db_path: str = QUEUE_DB_PATH,
+        handler: JobHandler = run_evaluation,
+        workers: int = QUEUE_WORKERS,
+        requests_per_minute: int = OPENAI_RPM_LIMIT,
+        tokens_per_minute: int = OPENAI_TPM_LIMIT,
+        max_attempts: int = MAX_ATTEMPTS
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.handler = handler
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.owner = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.request_limiter = SharedTokenBucket(self, "requests", requests_per_minute)
+        self.token_limiter = SharedTokenBucket(self, "tokens", tokens_per_minute)
+
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None, timeout=30.0
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS evaluation_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                payload TEXT NOT NULL,
+                estimated_tokens INTEGER NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_run_at REAL NOT NULL,
+                lease_expires_at REAL,
+                last_error TEXT,
+                result TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(evaluation_jobs)")}
+        for column in ("owner TEXT", "owner_expires_at REAL"):  # Queues created before job ownership
+            if column.split()[0] not in columns:
+                self._conn.execute(f"ALTER TABLE evaluation_jobs ADD COLUMN {column}")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_status_next_run ON evaluation_jobs (status, next_run_at)"
+        )
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                name TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+        # start() waits for a stop() in progress, so a new session never finds a half-stopped queue
+        self._lifecycle_lock = asyncio.Lock()
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        with self._db_lock:
+            return self._conn.execute(sql, params)
+
+    @contextmanager
+    def _transaction(self):
+        """IMMEDIATE transaction - serializes writers across processes"""
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _insert_job(self, interview_data: Dict) -> int:
+        now = time.time()
+        cursor = self._execute(
+            "INSERT INTO evaluation_jobs (payload, estimated_tokens, next_run_at, created_at, updated_at, "
+            "owner, owner_expires_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (json.dumps(interview_data, ensure_ascii=False), estimate_evaluation_tokens(interview_data),
+             now, now, now, self.owner, now + OWNER_LEASE_SECONDS)
+        )
+        return cursor.lastrowid
+
+    async def enqueue(self, interview_data: Dict) -> int:
+        """
+        Persist an evaluation job (the SQLite write runs off the event loop)
+
+        Args:
+            interview_data: Output of InterviewTools.get_interview_data_for_evaluation()
+
+        Returns:
+            Job id
+        """
+        job_id = await asyncio.to_thread(self._insert_job, interview_data)
+        logger.info(f"Queued evaluation job {job_id} for {interview_data.get('candidate_name')}")
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job_id
+
+    def _claim_next(self) -> Optional[tuple]:
+        """
+        Atomically claim the next runnable job (pending, or running with an expired lease)
+
+        Only jobs owned by this queue, released jobs and jobs whose owner
+        stopped renewing are considered; claiming takes over ownership.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT id, payload, estimated_tokens, attempts FROM evaluation_jobs "
+                "WHERE ((status = 'pending' AND next_run_at <= ?) "
+                "OR (status = 'running' AND lease_expires_at < ?)) "
+                "AND (owner IS NULL OR owner = ? OR owner_expires_at < ?) "
+                "ORDER BY next_run_at LIMIT 1",
+                (now, now, self.owner, now)
+            ).fetchone()
+            if row:
+                conn.execute(
+                    "UPDATE evaluation_jobs SET status = 'running', attempts = attempts + 1, "
+                    "lease_expires_at = ?, owner = ?, owner_expires_at = ?, updated_at = ? WHERE id = ?",
+                    (now + LEASE_SECONDS, self.owner, now + OWNER_LEASE_SECONDS, now, row[0])
+                )
+        return row
+
+    def _renew_ownership(self) -> None:
+        now = time.time()
+        self._execute(
+            "UPDATE evaluation_jobs SET owner_expires_at = ? WHERE owner = ? AND status IN ('pending', 'running')",
+            (now + OWNER_LEASE_SECONDS, self.owner)
+        )
+
+    def _release_jobs(self) -> int:
+        """Hand this queue's unfinished jobs back so any process can run them right away"""
+        now = time.time()
+        cursor = self._execute(
+            "UPDATE evaluation_jobs SET status = 'pending', owner = NULL, owner_expires_at = NULL, "
+            "lease_expires_at = NULL, next_run_at = MIN(next_run_at, ?), updated_at = ? "
+            "WHERE owner = ? AND status IN ('pending', 'running')",
+            (now, now, self.owner)
+        )
+        return cursor.rowcount
+
+    def _complete(self, job_id: int, result: Optional[str]) -> None:
+        self._execute(
+            "UPDATE evaluation_jobs SET status = 'done', result = ?, lease_expires_at = NULL, updated_at = ? "
+            "WHERE id = ?",
+            (result, time.time(), job_id)
+        )
+
+    def _fail(self, job_id: int, attempts: int, error: str) -> None:
+        now = time.time()
+        if attempts >= self.max_attempts:
+            self._execute(
+                "UPDATE evaluation_jobs SET status = 'failed', last_error = ?, lease_expires_at = NULL, "
+                "updated_at = ? WHERE id = ?",
+                (error, now, job_id)
+            )
+            logger.error(f"Evaluation job {job_id} failed permanently: {error}")
+            return
+
+        # Exponential backoff with jitter
+        delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** (attempts - 1)))
+        delay *= random.uniform(0.5, 1.5)
+        self._execute(
+            "UPDATE evaluation_jobs SET status = 'pending', last_error = ?, next_run_at = ?, "
+            "lease_expires_at = NULL, updated_at = ? WHERE id = ?",
+            (error, now + delay, now, job_id)
+        )
+        logger.warning(f"Evaluation job {job_id} attempt {attempts} failed, retrying in {delay:.1f}s: {error}")
+
+    def get_job(self, job_id: int) -> Optional[Dict]:
+        """Get status information for a job"""
+        row = self._execute(
+            "SELECT id, status, attempts, last_error, result FROM evaluation_jobs WHERE id = ?",
+            (job_id,)
+        ).fetchone()
+        if not row:
+            return None
+        return {"id": row[0], "status": row[1], "attempts": row[2], "last_error": row[3], "result": row[4]}
+
+    def pending_count(self) -> int:
+        """Number of jobs not yet finished (pending or running)"""
+        return self._execute(
+            "SELECT COUNT(*) FROM evaluation_jobs WHERE status IN ('pending', 'running')"
+        ).fetchone()[0]
+
+    async def start(self) -> None:
+        """Start the worker pool; unfinished jobs from earlier runs are replayed"""
+        async with self._lifecycle_lock:
+            if self._tasks:
+                return
+            self._stopping = False
+            self._wakeup = asyncio.Event()
+
+            replayed = await asyncio.to_thread(self.pending_count)
+            if replayed:
+                logger.info(f"Replaying {replayed} unfinished evaluation job(s)")
+
+            self._tasks = [
+                asyncio.create_task(self._worker(i), name=f"evaluation-worker-{i}")
+                for i in range(self.workers)
+            ]
+            self._tasks.append(asyncio.create_task(self._keep_ownership(), name="evaluation-ownership"))
+            logger.info(f"Evaluation queue started with {self.workers} worker(s)")
+
+    async def stop(self) -> None:
+        """Stop the workers and release this queue's unfinished jobs to other processes"""
+        async with self._lifecycle_lock:
+            self._stopping = True
+            tasks, self._tasks = self._tasks, []
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            released = await asyncio.to_thread(self._release_jobs)
+            if released:
+                logger.info(f"Released {released} unfinished evaluation job(s) to other workers")
+
+    async def acquire_quota(self, estimated_tokens: int) -> None:
+        """Wait for one request and `estimated_tokens` tokens of the shared OpenAI budget"""
+        await self.request_limiter.acquire(1)
+        await self.token_limiter.acquire(estimated_tokens)
+
+    async def _keep_ownership(self) -> None:
+        while not self._stopping:
+            await asyncio.sleep(OWNER_LEASE_SECONDS / 3)
+            try:
+                await asyncio.to_thread(self._renew_ownership)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not renew evaluation job ownership: {e}")
+
+    async def wait_for(self, job_id: int, timeout: float = None) -> Optional[Dict]:
+        """
+        Wait until a job is done or failed
+
+        Returns:
+            Job status dict, or the current status if the timeout expired
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            job = await asyncio.to_thread(self.get_job, job_id)
+            if job is None or job["status"] in ("done", "failed"):
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return job
+            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+    async def _worker(self, index: int) -> None:
+        while not self._stopping:
+            row = await asyncio.to_thread(self._claim_next)
+            if row is None:
+                # Idle - sleep until a new job arrives or the next retry is due
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=POLL_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            job_id, payload, estimated_tokens, attempts = row
+            attempts += 1
+            try:
+                await self.acquire_quota(estimated_tokens)
+
+                result = await self.handler(json.loads(payload), attempts >= self.max_attempts)
+                await asyncio.to_thread(self._complete, job_id, result)
+                logger.info(f"Evaluation job {job_id} done (worker {index}, attempt {attempts})")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await asyncio.to_thread(self._fail, job_id, attempts, str(e))
+
+
+# Shared queue for the current worker process
+_queue: Optional[EvaluationJobQueue] = None
+
+
+async def get_evaluation_queue(handler: JobHandler = run_evaluation) -> EvaluationJobQueue:
+    """Get the process-wide evaluation queue, starting it on first use"""
+    global _queue
+    if _queue is None:
+        _queue = EvaluationJobQueue(handler=handler)
+    await _queue.start()
+    return _queue
@@ -0,0 +1,293 @@
+"""
+Indexed evaluation store
+Evaluations stay as JSON files in evaluations/; an embedded SQLite index
+next to them holds candidate, position, date, score and decision so lookups
+and paginated listings don't have to open every file.
+
+Evaluations saved before the index existed are imported on the first query
+of a new index, so live sessions, which only add entries, never pay for the
+scan. Run the import up front (or re-import JSON files copied in later) with:
+    python evaluation_store.py migrate [evaluations_dir]
+
+Use get_evaluation_store() to share one connection per directory and process.
+"""
+
+import json
+import logging
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger("interview-evaluation-store")
+
+INDEX_DB_NAME = "evaluation_index.db"
+
+# Columns that query() can sort by
+SORTABLE_COLUMNS = ("interview_date", "overall_score", "candidate_name", "position", "decision", "indexed_at")
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class EvaluationStore:
+    """
+    SQLite index over the evaluation JSON files
+
+    Secondary indexes on candidate_name, position, interview_date,
+    overall_score and decision keep filtered, paginated queries in the
+    millisecond range even with 100k evaluations.
+    """
+
+    def __init__(self, evaluations_dir: str = "evaluations", db_path: str = None):
+        self.evaluations_dir = Path(evaluations_dir)
+        self.evaluations_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = Path(db_path) if db_path else self.evaluations_dir / INDEX_DB_NAME
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS evaluations (
+                filename TEXT PRIMARY KEY,
+                candidate_name TEXT NOT NULL,
+                position TEXT NOT NULL,
+                interview_date TEXT NOT NULL,
+                overall_score REAL,
+                decision TEXT,
+                role_fit_percentage REAL,
+                indexed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_eval_candidate ON evaluations (candidate_name COLLATE NOCASE, interview_date);
+            CREATE INDEX IF NOT EXISTS idx_eval_position ON evaluations (position COLLATE NOCASE, interview_date);
+            CREATE INDEX IF NOT EXISTS idx_eval_date ON evaluations (interview_date);
+            CREATE INDEX IF NOT EXISTS idx_eval_score ON evaluations (overall_score, interview_date);
+            CREATE INDEX IF NOT EXISTS idx_eval_decision ON evaluations (decision COLLATE NOCASE, interview_date);
+        """)
+
+        # user_version 0: new index - the evaluations already on disk are imported before the first read
+        self._migration_lock = threading.Lock()
+        self._needs_migration = self._conn.execute("PRAGMA user_version").fetchone()[0] == 0
+
+    def _ensure_migrated(self) -> None:
+        if not self._needs_migration:
+            return
+        with self._migration_lock:
+            if self._needs_migration:
+                self.migrate()
+
+    def _row_values(self, filename: str, evaluation: Dict) -> tuple:
+        metadata = evaluation.get("metadata", {})
+        ratings = evaluation.get("ratings") or {}
+        recommendation = evaluation.get("recommendation") or {}
+        return (
+            filename,
+            metadata.get("candidate_name", "Unknown Candidate"),
+            metadata.get("position", "Unknown Position"),
+            metadata.get("interview_date", ""),
+            _to_float(ratings.get("overall_score")),
+            recommendation.get("decision"),
+            _to_float(recommendation.get("role_fit_percentage")),
+            time.time()
+        )
+
+    def index_evaluation(self, filename: str, evaluation: Dict) -> None:
+        """
+        Add or update the index entry for a saved evaluation
+
+        Args:
+            filename: File name inside the evaluations directory
+            evaluation: The evaluation dictionary that was saved
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO evaluations VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                self._row_values(filename, evaluation)
+            )
+
+    def remove(self, filename: str) -> None:
+        """Drop an evaluation from the index (the JSON file is left untouched)"""
+        with self._lock:
+            self._conn.execute("DELETE FROM evaluations WHERE filename = ?", (filename,))
+
+    def _where(
+        self,
+        candidate_name: str = None,
+        position: str = None,
+        decision: str = None,
+        date_from: str = None,
+        date_to: str = None,
+        min_score: float = None,
+        max_score: float = None
+    ) -> tuple:
+        clauses = []
+        params = []
+        if candidate_name:
+            clauses.append("candidate_name = ? COLLATE NOCASE")
+            params.append(candidate_name)
+        if position:
+            clauses.append("position = ? COLLATE NOCASE")
+            params.append(position)
+        if decision:
+            clauses.append("decision = ? COLLATE NOCASE")
+            params.append(decision)
+        if date_from:
+            clauses.append("interview_date >= ?")
+            params.append(date_from)
+        if date_to:
+            # Dates are ISO strings; a bare YYYY-MM-DD includes that whole day
+            clauses.append("interview_date <= ?")
+            params.append(date_to if "T" in date_to else f"{date_to}T99")
+        if min_score is not None:
+            clauses.append("overall_score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            clauses.append("overall_score <= ?")
+            params.append(max_score)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def query(
+        self,
+        candidate_name: str = None,
+        position: str = None,
+        decision: str = None,
+        date_from: str = None,
+        date_to: str = None,
+        min_score: float = None,
+        max_score: float = None,
+        order_by: str = "interview_date",
+        descending: bool = True,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Dict]:
+        """
+        Find evaluations by indexed fields
+
+        Args:
+            candidate_name / position / decision: Exact match, case-insensitive
+            date_from / date_to: ISO date or datetime bounds (inclusive)
+            min_score / max_score: overall_score bounds (inclusive)
+            order_by: One of SORTABLE_COLUMNS
+            limit / offset: Page size and start
+
+        Returns:
+            Index rows (filename, candidate_name, position, interview_date,
+            overall_score, decision, role_fit_percentage)
+        """
+        if order_by not in SORTABLE_COLUMNS:
+            raise ValueError(f"order_by must be one of {SORTABLE_COLUMNS}")
+        self._ensure_migrated()
+        where, params = self._where(candidate_name, position, decision, date_from, date_to, min_score, max_score)
+        direction = "DESC" if descending else "ASC"
+        # Tie-breakers follow the column order of the secondary indexes so SQLite
+        # can walk an index instead of sorting
+        collate = " COLLATE NOCASE" if order_by in ("candidate_name", "position", "decision") else ""
+        order = f"{order_by}{collate} {direction}"
+        if order_by not in ("interview_date", "indexed_at"):
+            order += f", interview_date {direction}"
+        order += f", rowid {direction}"
+        sql = (
+            "SELECT filename, candidate_name, position, interview_date, overall_score, decision, "
+            f"role_fit_percentage FROM evaluations {where} "
+            f"ORDER BY {order} LIMIT ? OFFSET ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, (*params, limit, offset)).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self, **filters) -> int:
+        """Number of evaluations matching the same filters as query()"""
+        self._ensure_migrated()
+        where, params = self._where(**filters)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM evaluations {where}", params).fetchone()[0]
+
+    def load(self, filename: str) -> Dict:
+        """Load the full evaluation JSON for an index entry"""
+        with open(self.evaluations_dir / filename, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def migrate(self, batch_size: int = 500) -> Dict:
+        """
+        Import existing evaluation JSON files into the index
+
+        Files already indexed are skipped, so the migration can be re-run.
+
+        Returns:
+            Counts of imported, skipped and failed files
+        """
+        with self._lock:
+            known = {row[0] for row in self._conn.execute("SELECT filename FROM evaluations")}
+
+        imported = skipped = failed = 0
+        rows = []
+
+        def flush():
+            with self._lock:
+                self._conn.execute("BEGIN")
+                self._conn.executemany("INSERT OR REPLACE INTO evaluations VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                self._conn.execute("COMMIT")
+            rows.clear()
+
+        for path in self.evaluations_dir.glob("*.json"):
+            if path.name in known:
+                skipped += 1
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    evaluation = json.load(f)
+                if "metadata" not in evaluation:
+                    raise ValueError("not an evaluation (no metadata)")
+                rows.append(self._row_values(path.name, evaluation))
+                imported += 1
+            except Exception as e:
+                failed += 1
+                logger.warning(f"Skipping {path.name}: {e}")
+            if len(rows) >= batch_size:
+                flush()
+        if rows:
+            flush()
+        with self._lock:
+            self._conn.execute("PRAGMA user_version = 1")
+        self._needs_migration = False
+
+        logger.info(f"Migration finished: {imported} imported, {skipped} already indexed, {failed} failed")
+        return {"imported": imported, "skipped": skipped, "failed": failed}
+
+
+_stores: Dict[Path, EvaluationStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_evaluation_store(evaluations_dir: str = "evaluations") -> EvaluationStore:
+    """Process-wide store for an evaluations directory (one connection, schema set up once)"""
+    key = Path(evaluations_dir).resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = EvaluationStore(evaluations_dir)
+            _stores[key] = store
+        return store
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "migrate":
+        print("\n📖 Usage: python evaluation_store.py migrate [evaluations_dir]\n")
+        sys.exit(1)
+
+    directory = sys.argv[2] if len(sys.argv) > 2 else "evaluations"
+    store = get_evaluation_store(directory)
+    started = time.perf_counter()
+    result = store.migrate()
+    print(f"\n✅ Indexed {result['imported']} evaluation(s) in {time.perf_counter() - started:.2f}s")
+    print(f"   Already indexed: {result['skipped']}  Failed: {result['failed']}")
+    print(f"🗂️  Index: {store.db_path}\n")
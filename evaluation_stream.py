@@ -0,0 +1,177 @@
+"""
+Streaming evaluation helpers
+Parses the evaluation JSON incrementally while tokens arrive and renders
+each top-level section as soon as it is complete.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class IncrementalSectionParser:
+    """
+    Incremental parser for a streamed JSON object
+
+    Feed raw text chunks; every time a top-level "key": value pair is
+    complete it is returned by `feed` as (key, parsed_value). Only the new
+    characters of each chunk are scanned, so the cost is linear in the size
+    of the response.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.position = 0
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.expecting_key = False
+        self.key_start: Optional[int] = None
+        self.current_key: Optional[str] = None
+        self.value_start: Optional[int] = None
+        self.sections: Dict[str, Any] = {}
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Add streamed text
+
+        Returns:
+            Sections completed by this chunk, in order
+        """
+        self.buffer += chunk
+        completed = []
+
+        while self.position < len(self.buffer):
+            i = self.position
+            char = self.buffer[i]
+            self.position += 1
+
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+                    if self.depth == 1 and self.key_start is not None:
+                        self.current_key = json.loads(self.buffer[self.key_start:i + 1])
+                        self.key_start = None
+                continue
+
+            if char == '"':
+                self.in_string = True
+                if self.depth == 1 and self.expecting_key:
+                    self.key_start = i
+                    self.expecting_key = False
+            elif char in "{[":
+                self.depth += 1
+                if self.depth == 1:
+                    self.expecting_key = True
+            elif char in "}]":
+                if self.depth == 1:
+                    self._close_value(i, completed)
+                self.depth -= 1
+            elif self.depth == 1:
+                if char == ":" and self.current_key is not None:
+                    self.value_start = i + 1
+                elif char == ",":
+                    self._close_value(i, completed)
+                    self.expecting_key = True
+
+        return completed
+
+    def _close_value(self, end: int, completed: List[Tuple[str, Any]]) -> None:
+        if self.current_key is None or self.value_start is None:
+            return
+        raw = self.buffer[self.value_start:end].strip()
+        if raw:
+            value = json.loads(raw)
+            self.sections[self.current_key] = value
+            completed.append((self.current_key, value))
+        self.current_key = None
+        self.value_start = None
+
+    def result(self) -> Dict:
+        """Parse the complete response (call after the stream ended)"""
+        return json.loads(self.buffer)
+
+
+def _render_list(title: str, items: List, bullet: str = None) -> str:
+    text = f"\n{title}:\n"
+    if not items:
+        return text + "  (none)\n"
+    for i, item in enumerate(items, 1):
+        text += f"  {bullet or f'{i}.'} {item}\n"
+    return text
+
+
+def render_report_section(section: str, value: Any) -> Optional[str]:
+    """
+    Render one evaluation section for progressive console output
+
+    Returns:
+        Formatted text, or None for sections that are not shown in the report
+    """
+    if section == "overall_assessment" and isinstance(value, dict):
+        return f"""
+OVERALL ASSESSMENT:
+  Recommendation: {value.get('hire_recommendation', 'N/A')}
+  Confidence:     {value.get('confidence_level', 'N/A')}
+
+SUMMARY:
+  {value.get('summary', '')}
+
+REASONING:
+  {value.get('reasoning', '')}
+"""
+
+    if section == "ratings" and isinstance(value, dict):
+        return f"""
+RATINGS BREAKDOWN:
+  Overall Score:         {value.get('overall_score', 'N/A')}/10
+  Technical Competency:  {value.get('technical_competency', 'N/A')}/10
+  Soft Skills:          {value.get('soft_skills', 'N/A')}/10
+  Experience Match:     {value.get('experience_match', 'N/A')}/10
+  Growth Potential:     {value.get('growth_potential', 'N/A')}/10
+"""
+
+    if section == "strengths":
+        return _render_list("STRENGTHS", value)
+
+    if section == "weaknesses":
+        return _render_list("AREAS FOR IMPROVEMENT", value)
+
+    if section == "red_flags" and value:
+        return _render_list("⚠️  RED FLAGS", value, bullet="⚠️ ")
+
+    if section == "recommendation" and isinstance(value, dict):
+        return f"""
+RECOMMENDATION:
+  Decision:      {value.get('decision', 'N/A')}
+  Role Fit:      {value.get('role_fit_percentage', 'N/A')}%
+
+RECOMMENDED NEXT STEPS:
+  {value.get('next_steps', 'N/A')}
+"""
+
+    return None
+
+
+def render_report_header(candidate_name: str, position: str, duration_minutes: int) -> str:
+    """Report header, printed before any AI output arrives"""
+    return f"""
+╔══════════════════════════════════════════════════════════════════╗
+║              INTERVIEW EVALUATION REPORT (live)                  ║
+╚══════════════════════════════════════════════════════════════════╝
+
+CANDIDATE INFORMATION:
+  Name:          {candidate_name}
+  Position:      {position}
+  Duration:      {duration_minutes} minutes
+"""
+
+
+def print_report_section(section: str, value: Any) -> None:
+    """on_section callback that prints each section as it completes"""
+    text = render_report_section(section, value)
+    if text:
+        print(text, end="", flush=True)
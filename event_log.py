@@ -0,0 +1,210 @@
+"""
+Structured event log
+Non-blocking logging for the realtime session's event handlers. emit() only
+applies sampling and rate limiting and puts the raw fields on a bounded
+queue; a background thread does the JSON serialization, traceback
+formatting and writing. When the queue is full the event is dropped and
+counted, so logging can never hold up audio handling.
+
+Sampling and rate limits are per event type:
+    EVENT_LOG_SAMPLE_RATES="transcript_captured=0.5,agent_stopped_speaking=0.1"
+    EVENT_LOG_RATE_LIMIT=50     # Events per second per type (bursts up to the same number)
+"""
+
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, Optional, TextIO
+
+logger = logging.getLogger("interview-event-log")
+
+EVENT_LOG_QUEUE_SIZE = int(os.getenv("EVENT_LOG_QUEUE_SIZE", "10000"))
+EVENT_LOG_RATE_LIMIT = float(os.getenv("EVENT_LOG_RATE_LIMIT", "50"))
+EVENT_LOG_PATH = os.getenv("EVENT_LOG_PATH")  # Default: stdout
+EVENT_LOG_BATCH_SIZE = 256  # Records written per flush
+
+
+def parse_sample_rates(spec: str) -> Dict[str, float]:
+    """Parse "event=rate,event=rate" (rates between 0 and 1)"""
+    rates = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        event, _, rate = item.partition("=")
+        try:
+            rates[event.strip()] = min(max(float(rate), 0.0), 1.0)
+        except ValueError:
+            logger.warning(f"Ignoring invalid sample rate '{item}'")
+    return rates
+
+
+EVENT_LOG_SAMPLE_RATES = parse_sample_rates(os.getenv("EVENT_LOG_SAMPLE_RATES", ""))
+
+
+class _TypeState:
+    """Sampling accumulator, token bucket and counters of one event type"""
+
+    __slots__ = ("sample_rate", "sample_credit", "tokens", "refilled_at",
+                 "queued", "sampled_out", "rate_limited", "dropped")
+
+    def __init__(self, sample_rate: float, burst: float):
+        self.sample_rate = sample_rate
+        self.sample_credit = 0.0
+        self.tokens = burst
+        self.refilled_at = time.monotonic()
+        self.queued = 0
+        self.sampled_out = 0
+        self.rate_limited = 0
+        self.dropped = 0
+
+
+class EventLogger:
+    """
+    Queue-backed JSON-lines event logger
+
+    Sampling is deterministic: a rate of 0.25 keeps every 4th event of that
+    type. Rate limiting is a token bucket per event type. Both are checked
+    before anything is queued.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO = None,
+        sample_rates: Dict[str, float] = None,
+        rate_limit: float = EVENT_LOG_RATE_LIMIT,
+        queue_size: int = EVENT_LOG_QUEUE_SIZE
+    ):
+        """
+        Args:
+            stream: Where JSON lines are written (default: stdout)
+            sample_rates: Fraction of events kept per event type (default 1.0)
+            rate_limit: Max events per second per type; 0 disables the limit
+            queue_size: Events buffered for the writer before new ones are dropped
+        """
+        self.stream = stream or sys.stdout
+        self.sample_rates = dict(EVENT_LOG_SAMPLE_RATES if sample_rates is None else sample_rates)
+        self.rate_limit = rate_limit
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=queue_size)
+        self._types: Dict[str, _TypeState] = {}
+        self._lock = threading.Lock()
+        self._writer = threading.Thread(target=self._run, name="event-log", daemon=True)
+        self._writer.start()
+
+    def _admit(self, event: str) -> Optional[_TypeState]:
+        """Apply sampling and rate limiting; returns the type's state if the event passes"""
+        with self._lock:
+            state = self._types.get(event)
+            if state is None:
+                state = self._types[event] = _TypeState(self.sample_rates.get(event, 1.0), self.rate_limit)
+
+            state.sample_credit += state.sample_rate
+            if state.sample_credit < 1.0:
+                state.sampled_out += 1
+                return None
+            state.sample_credit -= 1.0
+
+            if self.rate_limit > 0:
+                now = time.monotonic()
+                state.tokens = min(self.rate_limit, state.tokens + (now - state.refilled_at) * self.rate_limit)
+                state.refilled_at = now
+                if state.tokens < 1.0:
+                    state.rate_limited += 1
+                    return None
+                state.tokens -= 1.0
+            state.queued += 1
+            return state
+
+    def emit(self, event: str, exc: BaseException = None, **fields) -> bool:
+        """
+        Log an event without blocking
+
+        Args:
+            event: Event type (sampling and rate limits are keyed on it)
+            exc: Exception whose traceback is formatted on the writer thread
+            **fields: JSON-serializable event fields
+
+        Returns:
+            True if the event was queued
+        """
+        state = self._admit(event)
+        if state is None:
+            return False
+        try:
+            self._queue.put_nowait((time.time(), event, exc, fields))
+        except queue.Full:
+            with self._lock:
+                state.queued -= 1
+                state.dropped += 1
+            return False
+        return True
+
+    def _serialize(self, item: tuple) -> str:
+        timestamp, event, exc, fields = item
+        record = {"ts": round(timestamp, 3), "event": event, **fields}
+        if exc is not None:
+            record["error"] = str(exc)
+            record["traceback"] = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+        return json.dumps(record, ensure_ascii=False, default=str)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < EVENT_LOG_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            closing = batch[-1] is None
+            lines = [self._serialize(item) for item in batch if item is not None]
+            if lines:
+                try:
+                    self.stream.write("\n".join(lines) + "\n")
+                    self.stream.flush()
+                except (OSError, ValueError) as e:
+                    logger.error(f"Event log write failed: {e}")
+            if closing:
+                return
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Per event type: queued, sampled_out, rate_limited and dropped counts"""
+        with self._lock:
+            return {
+                event: {
+                    "queued": state.queued,
+                    "sampled_out": state.sampled_out,
+                    "rate_limited": state.rate_limited,
+                    "dropped": state.dropped
+                }
+                for event, state in self._types.items()
+            }
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write out queued events and stop the writer thread"""
+        if not self._writer.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("Event log queue still full on close - pending events are lost")
+            return
+        self._writer.join(timeout)
+
+
+_event_logger: Optional[EventLogger] = None
+_event_logger_lock = threading.Lock()
+
+
+def get_event_logger() -> EventLogger:
+    """Process-wide event logger (EVENT_LOG_PATH or stdout); a new one replaces a closed one"""
+    global _event_logger
+    with _event_logger_lock:
+        if _event_logger is None or not _event_logger._writer.is_alive():
+            if _event_logger is not None and EVENT_LOG_PATH:
+                _event_logger.stream.close()  # The file opened for the closed logger
+            stream = open(EVENT_LOG_PATH, "a", encoding="utf-8") if EVENT_LOG_PATH else None
+            _event_logger = EventLogger(stream=stream)
+        return _event_logger
@@ -3,30 +3,42 @@ Generate evaluation from saved chat history JSON
 Run this if evaluation didn't auto-generate after interview
 """
 
+import argparse
 import asyncio
+import glob
 import json
+import os
+import statistics
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
 # CRITICAL: Load environment variables FIRST
 load_dotenv(".env")
 
-from evaluation import InterviewEvaluator
+from evaluation import InterviewEvaluator, PROMPT_VERSION
+from evaluation_batch import BatchTransport, LocalBatchTransport, OpenAIBatchTransport
+from evaluation_cache import EvaluationCache
+from evaluation_stream import print_report_section, render_report_header
 from interview_config import get_interview_config
+from role_taxonomy import get_role_taxonomy
 
-async def generate_evaluation_from_json(json_file_path: str):
+def parse_chat_history(json_file_path: str) -> Dict:
     """
-    Generate evaluation report from LiveKit chat history JSON
+    Parse a LiveKit chat history JSON into evaluation inputs
+    
+    Pure function (no network, no printing) so it can run in a process pool.
     
     Args:
         json_file_path: Path to the chat history JSON file
+        
+    Returns:
+        Dictionary with candidate_name, position, transcript, interview_notes,
+        duration_minutes, candidate_info and turn_count
     """
-    
-    print(f"\n{'='*70}")
-    print(f"📄 Loading chat history from: {json_file_path}")
-    print(f"{'='*70}\n")
-    
     # Load JSON file
     with open(json_file_path, 'r') as f:
         chat_data = json.load(f)
@@ -38,6 +50,7 @@ async def generate_evaluation_from_json(json_file_path: str):
     transcript_parts = []
     candidate_name = "Unknown Candidate"
     candidate_position = "Unknown Position"
+    taxonomy = get_role_taxonomy()
     
     for item in items:
         if item.get('type') == 'message':
@@ -69,60 +82,16 @@ async def generate_evaluation_from_json(json_file_path: str):
                                     candidate_name = name_part.capitalize()
                                     break
                     
-                    # Extract position/role - Look for common keywords
-                    role_keywords = {
-                        "ui/ux designer": "UI/UX Designer",
-                        "ui ux designer": "UI/UX Designer",
-                        "designer": "Designer",
-                        "frontend developer": "Frontend Developer",
-                        "front end developer": "Frontend Developer",
-                        "backend developer": "Backend Developer",
-                        "back end developer": "Backend Developer",
-                        "full stack developer": "Full Stack Developer",
-                        "fullstack developer": "Full Stack Developer",
-                        "software developer": "Software Developer",
-                        "software engineer": "Software Engineer",
-                        "ai developer": "AI Developer",
-                        "ml engineer": "ML Engineer",
-                        "machine learning": "ML Engineer",
-                        "data scientist": "Data Scientist",
-                        "devops engineer": "DevOps Engineer",
-                        "qa engineer": "QA Engineer",
-                        "tester": "QA Tester",
-                        "product manager": "Product Manager",
-                        "project manager": "Project Manager",
-                        "sales": "Sales Executive",
-                        "marketing": "Marketing Specialist",
-                        "hr": "HR Professional",
-                    }
-                    
-                    for keyword, position in role_keywords.items():
-                        if keyword in text_lower:
-                            candidate_position = position
-                            break
+                    # Extract position/role stated in the introduction
+                    candidate_position = taxonomy.detect(text) or candidate_position
     
     # If still unknown, try to infer from conversation content
     if candidate_position == "Unknown Position":
-        full_text = " ".join(transcript_parts).lower()
-        if "angular" in full_text or "react" in full_text or "frontend" in full_text:
-            candidate_position = "Frontend Developer"
-        elif "backend" in full_text or "api" in full_text or "database" in full_text:
-            candidate_position = "Backend Developer"
-        elif "figma" in full_text or "design" in full_text or "wireframe" in full_text:
-            candidate_position = "UI/UX Designer"
-        elif "machine learning" in full_text or "model" in full_text or "ai" in full_text:
-            candidate_position = "AI/ML Developer"
+        candidate_position = taxonomy.infer_from_content(" ".join(transcript_parts)) or candidate_position
     
     # Build full transcript
     full_transcript = "\n\n".join(transcript_parts)
     
-    print(f"✅ Extracted {len(transcript_parts)} conversation turns")
-    print(f"👤 Candidate: {candidate_name}")
-    print(f"💼 Detected Position: {candidate_position}\n")
-    
-    # Get interview config - but we'll use detected position instead
-    config = get_interview_config()
-    
     # Create mock interview notes
     interview_notes = [
         {
@@ -148,41 +117,289 @@ async def generate_evaluation_from_json(json_file_path: str):
             end_time = last_item.get('created_at', 0)
             duration_minutes = int((end_time - start_time) / 60)
     
-    print(f"⏱️  Interview duration: {duration_minutes} minutes\n")
+    return {
+        "candidate_name": candidate_name,
+        "position": candidate_position,
+        "transcript": full_transcript,
+        "interview_notes": interview_notes,
+        "duration_minutes": duration_minutes,
+        "candidate_info": {
+            "name": candidate_name,
+            "position": candidate_position,  # Use detected position
+            "source": "LiveKit Chat History JSON"
+        },
+        "turn_count": len(transcript_parts)
+    }
+
+
+async def generate_evaluation_from_json(json_file_path: str):
+    """
+    Generate evaluation report from LiveKit chat history JSON
+    
+    Args:
+        json_file_path: Path to the chat history JSON file
+    """
+    
+    print(f"\n{'='*70}")
+    print(f"📄 Loading chat history from: {json_file_path}")
+    print(f"{'='*70}\n")
+    
+    interview = parse_chat_history(json_file_path)
+    
+    print(f"✅ Extracted {interview['turn_count']} conversation turns")
+    print(f"👤 Candidate: {interview['candidate_name']}")
+    print(f"💼 Detected Position: {interview['position']}\n")
+    print(f"⏱️  Interview duration: {interview['duration_minutes']} minutes\n")
     
     # Generate evaluation
     print(f"{'='*70}")
     print(f"🔍 Generating AI Evaluation...")
     print(f"{'='*70}\n")
     
-    evaluator = InterviewEvaluator()
+    # Stream the report: each section is printed as soon as the model finishes it
+    print(render_report_header(interview["candidate_name"], interview["position"], interview["duration_minutes"]))
+    
+    # Re-running on the same conversation is served from the evaluation cache
+    evaluator = InterviewEvaluator(cache=EvaluationCache())
     evaluation = await evaluator.evaluate_interview(
-        candidate_name=candidate_name,
-        position=candidate_position,  # Use detected position
-        transcript=full_transcript,
-        interview_notes=interview_notes,
-        duration_minutes=duration_minutes,
-        candidate_info={
-            "name": candidate_name,
-            "position": candidate_position,  # Use detected position
-            "source": "LiveKit Chat History JSON"
-        }
+        candidate_name=interview["candidate_name"],
+        position=interview["position"],  # Use detected position
+        transcript=interview["transcript"],
+        interview_notes=interview["interview_notes"],
+        duration_minutes=interview["duration_minutes"],
+        candidate_info=interview["candidate_info"],
+        on_section=print_report_section
     )
+    print("\n" + "═" * 68)
     
-    # Print summary report
-    summary_report = evaluator.generate_summary_report(evaluation)
-    print(summary_report)
+    stream_metrics = evaluation["metadata"].get("streaming_metrics")
+    if stream_metrics:
+        print(f"\n⚡ First section after {stream_metrics['time_to_first_section']}s, complete after {stream_metrics['time_to_complete']}s")
     
     # Print file location
     print(f"\n✅ Full evaluation saved to: {evaluation['metadata']['saved_to']}")
     print(f"📊 Overall Recommendation: {evaluation['recommendation']['decision']}")
-    print(f"📈 Role Fit: {evaluation['recommendation']['role_fit_percentage']}%\n")
+    print(f"📈 Role Fit: {evaluation['recommendation']['role_fit_percentage']}%")
+    cache_stats = evaluator.cache.stats()
+    print(f"🗄️  Evaluation cache: {cache_stats['hits']} hit(s), {cache_stats['misses']} miss(es), {cache_stats['entries']} entries\n")
     print(f"{'='*70}\n")
     
     return evaluation
 
 
+def resolve_chat_history_files(source: str) -> List[Path]:
+    """Resolve a directory (all *.json inside) or a glob pattern to chat history files"""
+    path = Path(source)
+    if path.is_dir():
+        return sorted(path.glob("*.json"))
+    return sorted(Path(p) for p in glob.glob(source, recursive=True) if p.endswith(".json"))
+
+
+def _load_manifest(manifest_path: Path) -> Dict:
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {"prompt_version": PROMPT_VERSION, "files": {}}
+
+
+def _write_manifest(manifest_path: Path, manifest: Dict) -> None:
+    """Write the manifest atomically so a crash never leaves it half-written"""
+    tmp_path = manifest_path.with_suffix(".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, manifest_path)
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def bulk_generate_evaluations(
+    source: str,
+    concurrency: int = 4,
+    manifest_file: str = None,
+    batch_transport: BatchTransport = None
+) -> Dict:
+    """
+    Re-evaluate many chat histories in parallel
+    
+    Chat histories are parsed in a process pool and evaluated with at most
+    `concurrency` evaluations in flight. Progress is recorded in a manifest
+    after every file, so re-running the same command resumes where a crashed
+    run stopped.
+    
+    Args:
+        source: Directory of chat history JSON files, or a glob pattern
+        concurrency: Maximum evaluations running at once
+        manifest_file: Progress manifest path (defaults to one per prompt version)
+        batch_transport: Submit everything as one offline batch instead (cheaper, slower)
+        
+    Returns:
+        Run statistics
+    """
+    files = resolve_chat_history_files(source)
+    manifest_path = Path(manifest_file or f"evaluations/bulk_manifest_v{PROMPT_VERSION}.json")
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = _load_manifest(manifest_path)
+    
+    pending = [f for f in files if manifest["files"].get(str(f.resolve()), {}).get("status") != "done"]
+    
+    print(f"\n{'='*70}")
+    print(f"📦 Bulk evaluation: {len(files)} file(s), {len(files) - len(pending)} already done, {len(pending)} to go")
+    print(f"🗂️  Manifest: {manifest_path}")
+    print(f"{'='*70}\n")
+    
+    # AI errors (e.g. rate limits) fail the file instead of saving a fallback
+    # report, so the manifest leaves it for the next run to retry
+    evaluator = InterviewEvaluator(fallback_on_error=False, cache=EvaluationCache())
+    semaphore = asyncio.Semaphore(concurrency)
+    manifest_lock = asyncio.Lock()
+    latencies = []
+    failures = 0
+    loop = asyncio.get_running_loop()
+    
+    async def record(path: Path, entry: Dict) -> None:
+        async with manifest_lock:
+            manifest["files"][str(path.resolve())] = entry
+            await asyncio.to_thread(_write_manifest, manifest_path, manifest)
+    
+    async def await_parsed(path: Path, parsed) -> Optional[Dict]:
+        nonlocal failures
+        try:
+            return await parsed
+        except Exception as e:
+            failures += 1
+            print(f"❌ {path.name}: could not parse ({e})")
+            await record(path, {"status": "failed", "error": f"parse: {e}"})
+            return None
+    
+    async def evaluate_file(path: Path, parsed) -> None:
+        nonlocal failures
+        interview = await await_parsed(path, parsed)
+        if interview is None:
+            return
+        
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                evaluation = await evaluator.evaluate_interview(
+                    candidate_name=interview["candidate_name"],
+                    position=interview["position"],
+                    transcript=interview["transcript"],
+                    interview_notes=interview["interview_notes"],
+                    duration_minutes=interview["duration_minutes"],
+                    candidate_info=interview["candidate_info"]
+                )
+            except Exception as e:
+                failures += 1
+                print(f"❌ {path.name}: {e}")
+                await record(path, {"status": "failed", "error": str(e)})
+                return
+            elapsed = time.perf_counter() - started
+        
+        latencies.append(elapsed)
+        print(f"✅ {path.name} → {evaluation['recommendation'].get('decision', 'N/A')} ({elapsed:.1f}s)")
+        await record(path, {
+            "status": "done",
+            "saved_to": evaluation["metadata"]["saved_to"],
+            "seconds": round(elapsed, 3)
+        })
+    
+    async def evaluate_as_batch(parsed_files: List) -> None:
+        nonlocal failures
+        ready = []
+        for path, parsed in parsed_files:
+            interview = await await_parsed(path, parsed)
+            if interview is not None:
+                ready.append((path, interview))
+        if not ready:
+            return
+        
+        print(f"📤 Submitting {len(ready)} evaluation(s) as one batch...")
+        started = time.perf_counter()
+        evaluations = await evaluator.evaluate_interviews_batch(
+            [interview for _, interview in ready],
+            batch_transport
+        )
+        elapsed = time.perf_counter() - started
+        
+        for (path, _), evaluation in zip(ready, evaluations):
+            batch_error = evaluation["metadata"].get("batch_error")
+            if batch_error is not None:
+                failures += 1
+                print(f"❌ {path.name}: {batch_error}")
+                await record(path, {"status": "failed", "error": batch_error})
+                continue
+            latencies.append(elapsed)
+            print(f"✅ {path.name} → {evaluation['recommendation'].get('decision', 'N/A')}")
+            await record(path, {
+                "status": "done",
+                "saved_to": evaluation["metadata"]["saved_to"],
+                "batch_id": evaluation["metadata"]["batch_id"],
+                "seconds": round(elapsed, 3)
+            })
+    
+    run_started = time.perf_counter()
+    with ProcessPoolExecutor() as pool:
+        # Submit every parse up front; evaluations start as soon as their file is parsed
+        parsed_files = [
+            (path, loop.run_in_executor(pool, parse_chat_history, str(path)))
+            for path in pending
+        ]
+        if batch_transport is None:
+            await asyncio.gather(*[evaluate_file(path, parsed) for path, parsed in parsed_files])
+        else:
+            await evaluate_as_batch(parsed_files)
+    wall_seconds = time.perf_counter() - run_started
+    
+    stats = {
+        "files": len(pending),
+        "succeeded": len(latencies),
+        "failed": failures,
+        "wall_seconds": round(wall_seconds, 2),
+        "files_per_minute": round(len(latencies) / wall_seconds * 60, 2) if wall_seconds > 0 else 0.0,
+        "p50_seconds": round(statistics.median(latencies), 2) if latencies else None,
+        "p95_seconds": round(_percentile(latencies, 95), 2) if latencies else None,
+        "cache": evaluator.cache.stats()
+    }
+    
+    print(f"\n{'='*70}")
+    print(f"📊 Bulk evaluation finished: {stats['succeeded']} succeeded, {stats['failed']} failed in {stats['wall_seconds']}s")
+    print(f"⚡ Throughput: {stats['files_per_minute']} files/min")
+    if latencies:
+        print(f"⏱️  Latency p50: {stats['p50_seconds']}s  p95: {stats['p95_seconds']}s")
+    print(f"🗄️  Cache: {stats['cache']['hits']} hit(s), {stats['cache']['misses']} miss(es)")
+    print(f"{'='*70}\n")
+    
+    return stats
+
+
 if __name__ == "__main__":
+    # Bulk mode: python generate_evaluation.py --bulk <directory-or-glob> [--concurrency N] [--manifest PATH] [--batch openai|local]
+    if len(sys.argv) > 1 and sys.argv[1] == "--bulk":
+        parser = argparse.ArgumentParser(description="Re-evaluate many chat histories in parallel")
+        parser.add_argument("--bulk", required=True, metavar="SOURCE", help="Directory or glob of chat history JSON files")
+        parser.add_argument("--concurrency", type=int, default=4, help="Evaluations in flight at once")
+        parser.add_argument("--manifest", default=None, help="Progress manifest path (resumes if it exists)")
+        parser.add_argument(
+            "--batch",
+            choices=["openai", "local"],
+            default=None,
+            help="Submit as one offline batch (openai = Batch API, local = file-based stand-in)"
+        )
+        args = parser.parse_args()
+        
+        transport = None
+        if args.batch == "openai":
+            transport = OpenAIBatchTransport()
+        elif args.batch == "local":
+            transport = LocalBatchTransport()
+        
+        asyncio.run(bulk_generate_evaluations(args.bulk, args.concurrency, args.manifest, transport))
+        sys.exit(0)
+    
     # Check if JSON file provided
     if len(sys.argv) < 2:
         print("\n❌ No JSON file provided!")
@@ -190,6 +407,7 @@ if __name__ == "__main__":
         print("\n💡 Examples:")
         print("   python generate_evaluation_from_json.py p_64yg1tqalc3_RM_DNxSHzpBpqtT_chat_history.json")
         print("   python generate_evaluation_from_json.py aman_chat_history.json")
+        print("   python generate_evaluation.py --bulk Json_conversation/ --concurrency 8")
         print("\n📁 Note: Script will look for the file in 'Json_conversation/' folder\n")
         sys.exit(1)
     
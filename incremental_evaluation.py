@@ -0,0 +1,99 @@
+"""
+Incremental per-stage evaluation
+Assesses each interview stage in the background as soon as the agent moves
+on to the next one, so the post-interview evaluation only has to merge the
+stage findings and look at the turns after the last stage change.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List
+
+from evaluation import InterviewEvaluator
+from evaluation_queue import estimate_evaluation_tokens
+
+logger = logging.getLogger("interview-incremental-evaluation")
+
+STAGE_COLLECT_TIMEOUT = 120.0  # Max seconds to wait for in-flight stage assessments
+
+
+class StageAssessmentTracker:
+    """
+    Runs a partial assessment for every finished interview stage
+
+    Registers itself as a stage listener on InterviewTools. Assessments run
+    as background tasks on the running event loop and never block the
+    conversation; a failed stage assessment just leaves its turns to the
+    final evaluation.
+    """
+
+    def __init__(
+        self,
+        interview_tools,
+        evaluator: InterviewEvaluator = None,
+        acquire_quota: Callable[[int], Awaitable[None]] = None
+    ):
+        """
+        Args:
+            interview_tools: The session's InterviewTools
+            evaluator: Evaluator for the stage assessments
+            acquire_quota: Waits for OpenAI rate budget before each assessment
+                (EvaluationJobQueue.acquire_quota, shared with queued evaluations)
+        """
+        self.interview_tools = interview_tools
+        self.evaluator = evaluator or InterviewEvaluator(fallback_on_error=False)
+        self.acquire_quota = acquire_quota
+        self._tasks: List[tuple] = []  # (stage, start_turn, end_turn, task)
+        interview_tools.add_stage_listener(self._on_stage_finished)
+
+    def _on_stage_finished(self, stage: str, start_turn: int, end_turn: int) -> None:
+        if end_turn <= start_turn:
+            return  # Nothing was said in this stage
+
+        stage_transcript = self.interview_tools.get_transcript_range(start_turn, end_turn)
+        position = self.interview_tools.position or "Unknown Position"
+        task = asyncio.create_task(self._assess(position, stage, stage_transcript))
+        self._tasks.append((stage, start_turn, end_turn, task))
+        logger.info(f"Started assessment of stage '{stage}' (turns {start_turn}-{end_turn})")
+
+    async def _assess(self, position: str, stage: str, stage_transcript: str) -> Dict:
+        if self.acquire_quota is not None:
+            await self.acquire_quota(estimate_evaluation_tokens({"transcript": stage_transcript}))
+        return await self.evaluator.assess_stage(position, stage, stage_transcript)
+
+    async def collect(self, timeout: float = STAGE_COLLECT_TIMEOUT) -> Dict:
+        """
+        Wait for the stage assessments started so far
+
+        Returns:
+            {"stage_findings": [{"stage", "turns", "finding"}],
+             "unassessed_transcript": turns not covered by a finding}
+        """
+        tasks = [task for _, _, _, task in self._tasks]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+
+        stage_findings = []
+        covered = set()
+        for stage, start_turn, end_turn, task in self._tasks:
+            if task.cancelled() or not task.done() or task.exception():
+                if task.done() and not task.cancelled():
+                    logger.warning(f"Assessment of stage '{stage}' failed: {task.exception()}")
+                continue
+            stage_findings.append({"stage": stage, "turns": [start_turn, end_turn], "finding": task.result()})
+            covered.update(range(start_turn, end_turn))
+
+        # Everything not covered by a finding (failed stages and the current stage)
+        tools = self.interview_tools
+        unassessed = [
+            tools.get_transcript_range(i, i + 1)
+            for i in range(len(tools.transcript))
+            if i not in covered
+        ]
+
+        return {
+            "stage_findings": stage_findings,
+            "unassessed_transcript": "\n\n".join(unassessed)
+        }
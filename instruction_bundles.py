@@ -0,0 +1,170 @@
+"""
+Instruction bundles
+The agent's persistent instructions, built once per (role, company,
+difficulty) and laid out for provider-side prompt caching: the static
+prompt sections always come first, byte-identical and in a fixed order, and
+the role/company context is appended at the end. Every session therefore
+shares the same cacheable prefix, whatever role it turns out to be for.
+
+Each bundle carries content hashes of its static prefix and of the whole
+text, so cache hits reported by the model can be matched to the exact
+instructions that were sent.
+
+With STAGE_SCOPED_INSTRUCTIONS=true (off by default), sessions do not get
+all six sections: bundles are per interview stage - a base that is always
+sent (system rules, AGENT_INSTRUCTION's general rules, question policy and
+the end-of-interview/misconduct protocol) plus only the current stage's
+phases of AGENT_INSTRUCTION. The internal scoring rubric is then not sent to
+the realtime model; it is only used by the post-interview evaluation.
+"""
+
+import hashlib
+import os
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from prompts import (
+    SYSTEM_INSTRUCTION,
+    AGENT_INSTRUCTION,
+    INTERVIEW_OBJECTIVE,
+    QUESTION_POLICY,
+    EVALUATION_GUIDELINES,
+    CLOSING_INSTRUCTION,
+    INTERVIEW_FLOW_INSTRUCTION,
+    STAGE_INSTRUCTIONS,
+    get_interview_context
+)
+from interview_config import COMPANY_NAME, DEPARTMENT, KEY_SKILLS, QUESTION_DIFFICULTY
+
+# Order matters: changing it changes the cached prefix for every session
+STATIC_SECTIONS = (
+    ("system", SYSTEM_INSTRUCTION),
+    ("agent", AGENT_INSTRUCTION),
+    ("objective", INTERVIEW_OBJECTIVE),
+    ("question_policy", QUESTION_POLICY),
+    ("evaluation_guidelines", EVALUATION_GUIDELINES),
+    ("closing", CLOSING_INSTRUCTION),
+)
+SECTION_SEPARATOR = "\n\n"
+
+STAGE_SCOPED_INSTRUCTIONS = os.getenv("STAGE_SCOPED_INSTRUCTIONS", "false").lower() == "true"
+FIRST_STAGE = "introduction"
+
+# Stage-scoped bundles: shared base first, then the stage's sections
+BASE_SECTIONS = (
+    ("system", SYSTEM_INSTRUCTION),
+    ("interview_flow", INTERVIEW_FLOW_INSTRUCTION),
+    ("question_policy", QUESTION_POLICY),
+    ("closing", CLOSING_INSTRUCTION),  # Misconduct handling applies in every stage
+)
+STAGE_SECTIONS = {
+    "introduction": (("stage", STAGE_INSTRUCTIONS["introduction"]),),
+    "experience": (("stage", STAGE_INSTRUCTIONS["experience"]), ("objective", INTERVIEW_OBJECTIVE)),
+    "technical": (("stage", STAGE_INSTRUCTIONS["technical"]), ("objective", INTERVIEW_OBJECTIVE)),
+    "behavioral": (("stage", STAGE_INSTRUCTIONS["behavioral"]),),
+    "questions": (("stage", STAGE_INSTRUCTIONS["questions"]),),
+    "closing": (("stage", STAGE_INSTRUCTIONS["closing"]),),
+}
+
+EXPERIENCE_LEVELS = {
+    "easy": "Junior",
+    "intermediate": "Mid-Level",
+    "advanced": "Senior",
+}
+DEFAULT_SKILLS = ["core skills for this position"]  # Roles without a KEY_SKILLS entry
+
+
+class InstructionBundle(NamedTuple):
+    instructions: str
+    prefix_hash: str  # sha256 of the static prefix - shared by every bundle of the same kind
+    bundle_hash: str  # sha256 of the full instructions
+    role: Optional[str]
+    company: str
+    difficulty: str
+    stage: Optional[str]  # None for the full, all-stages instructions
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+STATIC_PREFIX = SECTION_SEPARATOR.join(text for _, text in STATIC_SECTIONS)
+STATIC_PREFIX_HASH = _sha256(STATIC_PREFIX)
+BASE_PREFIX = SECTION_SEPARATOR.join(text for _, text in BASE_SECTIONS)
+BASE_PREFIX_HASH = _sha256(BASE_PREFIX)
+
+
+def build_role_context(role: str, company: str, difficulty: str) -> str:
+    """Role and company section appended after the static prefix"""
+    return get_interview_context(
+        company_name=company,
+        role_title=role,
+        key_skills=KEY_SKILLS.get(role) or DEFAULT_SKILLS,
+        experience_level=EXPERIENCE_LEVELS.get(difficulty, "Mid-Level"),
+        department=DEPARTMENT
+    ).strip()
+
+
+@lru_cache(maxsize=256)
+def get_instruction_bundle(
+    role: str = None,
+    company: str = COMPANY_NAME,
+    difficulty: str = QUESTION_DIFFICULTY,
+    stage: str = None
+) -> InstructionBundle:
+    """
+    Instructions for a role, built once per (role, company, difficulty, stage)
+
+    Args:
+        role: Position title; None while the position is still unknown
+            (static sections only)
+        company: Hiring company
+        difficulty: easy, intermediate or advanced (see interview_config)
+        stage: Interview stage for stage-scoped instructions (BASE_PREFIX plus
+            the stage's sections); None for all sections (STATIC_PREFIX)
+
+    Returns:
+        InstructionBundle whose instructions start with its static prefix
+
+    Raises:
+        ValueError: for a stage without stage instructions
+    """
+    if stage is None:
+        instructions, prefix_hash = STATIC_PREFIX, STATIC_PREFIX_HASH
+    elif stage in STAGE_SECTIONS:
+        instructions = SECTION_SEPARATOR.join([BASE_PREFIX] + [text for _, text in STAGE_SECTIONS[stage]])
+        prefix_hash = BASE_PREFIX_HASH
+    else:
+        raise ValueError(f"No instructions for interview stage '{stage}'")
+    if role:
+        instructions += SECTION_SEPARATOR + build_role_context(role, company, difficulty)
+    return InstructionBundle(
+        instructions=instructions,
+        prefix_hash=prefix_hash,
+        bundle_hash=_sha256(instructions),
+        role=role,
+        company=company,
+        difficulty=difficulty,
+        stage=stage
+    )
+
+
+def get_session_bundle(role: str = None, stage: str = FIRST_STAGE) -> InstructionBundle:
+    """
+    Bundle for a live session at the given stage
+
+    Stage-scoped when STAGE_SCOPED_INSTRUCTIONS is on, otherwise the full
+    instructions whatever the stage. Stages without stage instructions fall
+    back to the full instructions.
+    """
+    if not STAGE_SCOPED_INSTRUCTIONS or stage not in STAGE_SECTIONS:
+        stage = None
+    return get_instruction_bundle(role, stage=stage)
+
+
+def prewarm_instruction_bundles(roles=KEY_SKILLS) -> InstructionBundle:
+    """Build the session bundles of all configured roles and stages; returns the starting bundle"""
+    for role in (None, *roles):
+        for stage in STAGE_SECTIONS:
+            get_session_bundle(role, stage)
+    return get_session_bundle()
@@ -0,0 +1,88 @@
+"""
+Moderation keyword matcher
+All moderation phrases are compiled once into a single regular expression,
+so each candidate utterance is scanned in one C-level pass instead of one
+substring scan per phrase. Matches must sit on word boundaries: 'ass' no
+longer fires on "class" or "assess".
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Tuple
+
+SEVERITY_TERMINATE = "terminate"
+SEVERITY_WARNING = "warning"
+
+# A trailing '*' matches any word ending ('fuck*' -> "fucking", "fucked");
+# everything else must match whole words. Only use '*' on stems no innocent
+# word starts with - 'shit' is spelled out because of "shiitake"/"shitake".
+SEVERE_KEYWORDS = [
+    'fuck*', 'shit', 'shits', 'shitty', 'shitting', 'bitch*', 'ass', 'asshole*', 'damn',
+    'stupid interviewer', 'waste of time',
+    'this is bullshit', 'bullshit*', 'you suck'
+]
+
+WARNING_KEYWORDS = [
+    'irritating', 'annoying', 'boring',
+    "don't know anything", "i don't care",
+    'whatever', 'this is dumb'
+]
+
+
+class ModerationHit(NamedTuple):
+    keyword: str
+    severity: str
+    start: int
+    end: int
+
+
+class KeywordMatcher:
+    """
+    Keywords compiled into one regex alternation
+
+    Longer keywords are tried first, so "this is bullshit" wins over
+    "bullshit*" at the same position. The alternation has no capturing
+    groups (they triple the scan time); the matched text maps back to its
+    keyword through a dict.
+    """
+
+    def __init__(self, keywords: List[Tuple[str, str]]):
+        """
+        Args:
+            keywords: (keyword, severity) pairs; see SEVERE_KEYWORDS for the '*' suffix
+        """
+        self._keywords: Dict[str, Tuple[str, str]] = {}
+        alternatives = []
+        for keyword, severity in sorted(keywords, key=lambda item: len(item[0].rstrip("*")), reverse=True):
+            pattern = keyword.rstrip("*").lower()
+            self._keywords.setdefault(pattern, (keyword, severity))
+            alternatives.append(re.escape(pattern) + ("" if keyword.endswith("*") else r"(?!\w)"))
+        self._pattern = re.compile(r"(?<!\w)(?:" + "|".join(alternatives) + ")") if alternatives else None
+
+    def find_all(self, text: str) -> List[ModerationHit]:
+        """
+        Scan text once and return every word-boundary match
+
+        Returns:
+            Non-overlapping hits, left to right
+        """
+        if self._pattern is None:
+            return []
+        keywords = self._keywords
+        return [
+            ModerationHit(*keywords[match.group()], match.start(), match.end())
+            for match in self._pattern.finditer(text.lower())
+        ]
+
+
+_matcher = None
+
+
+def get_moderation_matcher() -> KeywordMatcher:
+    """Process-wide matcher for the interview moderation keywords (built on first use)"""
+    global _matcher
+    if _matcher is None:
+        _matcher = KeywordMatcher(
+            [(keyword, SEVERITY_TERMINATE) for keyword in SEVERE_KEYWORDS]
+            + [(keyword, SEVERITY_WARNING) for keyword in WARNING_KEYWORDS]
+        )
+    return _matcher
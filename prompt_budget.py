@@ -0,0 +1,92 @@
+"""
+Prompt token budgeting
+Fits the interview transcript into the evaluation model's context window by
+token count rather than by characters. Turns are tokenized once (counts are
+cached per turn text) and selected by priority: candidate answers first,
+then interviewer questions, and interviewer filler ("Great, thanks!") last.
+Notes are never cut.
+"""
+
+import os
+from functools import lru_cache
+from typing import Dict, List
+
+from token_counter import count_tokens
+
+# gpt-4o context window, minus what the JSON answer needs
+EVALUATION_CONTEXT_TOKENS = int(os.getenv("EVALUATION_CONTEXT_TOKENS", "128000"))
+EVALUATION_RESPONSE_TOKENS = 4000
+
+# Interviewer turns without a question and at most this long are treated as filler
+FILLER_MAX_TOKENS = 30
+
+PRIORITY_CANDIDATE = 0
+PRIORITY_INTERVIEWER_QUESTION = 1
+PRIORITY_INTERVIEWER_FILLER = 2
+PRIORITY_NAMES = {
+    PRIORITY_CANDIDATE: "candidate_answers",
+    PRIORITY_INTERVIEWER_QUESTION: "interviewer_questions",
+    PRIORITY_INTERVIEWER_FILLER: "interviewer_filler",
+}
+
+SEPARATOR_TOKENS = 1  # "\n\n" between turns
+
+
+@lru_cache(maxsize=50000)
+def turn_tokens(turn: str) -> int:
+    """Token count of one transcript turn (cached - every turn is tokenized once per process)"""
+    return count_tokens(turn)
+
+
+def classify_turn(turn: str) -> int:
+    """Selection priority of a "Speaker: message" turn (lower is kept first)"""
+    if not turn.lower().startswith("interviewer:"):
+        return PRIORITY_CANDIDATE
+    if "?" in turn or turn_tokens(turn) > FILLER_MAX_TOKENS:
+        return PRIORITY_INTERVIEWER_QUESTION
+    return PRIORITY_INTERVIEWER_FILLER
+
+
+def select_transcript_window(turns: List[str], budget_tokens: int) -> Dict:
+    """
+    Choose the turns that fit the budget, by priority
+
+    Candidate answers are never dropped: if they alone exceed the budget the
+    window does not fit and the caller has to fall back to map-reduce.
+
+    Returns:
+        {"fits", "text" (kept turns in chronological order), "tokens",
+         "kept": {priority name: turns}, "omitted": {priority name: turns}}
+    """
+    priorities = [classify_turn(turn) for turn in turns]
+    kept = [False] * len(turns)
+    used = 0
+    fits = True
+
+    for index in sorted(range(len(turns)), key=lambda i: (priorities[i], i)):
+        cost = turn_tokens(turns[index]) + SEPARATOR_TOKENS
+        if used + cost > budget_tokens:
+            if priorities[index] == PRIORITY_CANDIDATE:
+                fits = False
+            continue
+        kept[index] = True
+        used += cost
+
+    kept_counts = {name: 0 for name in PRIORITY_NAMES.values()}
+    omitted_counts = {name: 0 for name in PRIORITY_NAMES.values()}
+    for index, priority in enumerate(priorities):
+        counts = kept_counts if kept[index] else omitted_counts
+        counts[PRIORITY_NAMES[priority]] += 1
+
+    return {
+        "fits": fits,
+        "text": "\n\n".join(turn for index, turn in enumerate(turns) if kept[index]),
+        "tokens": used,
+        "kept": kept_counts,
+        "omitted": omitted_counts
+    }
+
+
+def section_tokens(sections: Dict[str, str]) -> Dict[str, int]:
+    """Tokens spent on each named prompt section"""
+    return {name: count_tokens(text) for name, text in sections.items()}
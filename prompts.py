@@ -1,3 +1,5 @@
+import re
+
 # ============================================================================
 # 1. SYSTEM INSTRUCTION
 # Purpose: Define role, boundaries, and behavior (non-negotiable)
@@ -354,6 +356,9 @@ QUESTION RULES:
    - "What was the outcome?"
    - "What did you learn?"
 ✓ Pick 2-3 interesting points per answer to probe deeper
+✓ Never repeat a question - if unsure whether a topic was already covered, call check_question_asked first
+✓ Interview stages run introduction → experience → technical → behavioral → questions → closing -
+   call update_interview_stage with the new stage whenever you move on, before its first question
 
 ✗ NO multiple questions in one turn
 ✗ NO leading questions
@@ -597,4 +602,58 @@ DATA_SCIENTIST_CONTEXT = get_interview_context(
     key_skills=["Python", "Machine Learning", "SQL", "Statistics", "Data Visualization"],
     experience_level="Senior",
     department="Data Science"
-)
\ No newline at end of file
+)
+
+# ============================================================================
+# 9. STAGE-SCOPED INSTRUCTIONS
+# Purpose: Realtime instructions that only carry the current stage's guidance
+# (see instruction_bundles.py). Derived from AGENT_INSTRUCTION - edit the
+# phases there and every stage picks the change up.
+# ============================================================================
+
+_STRUCTURE_START = "📋 INTERVIEW STRUCTURE - NATURAL FLOW:"
+_STRUCTURE_END = "🗣️ CONVERSATIONAL STYLE - SOUND HUMAN:"
+_PHASE_HEADER = re.compile(r"^\*\*Phase (\d+): .+\*\*$", re.MULTILINE)
+
+# AGENT_INSTRUCTION phases covered by each interview stage
+STAGE_PHASES = {
+    "introduction": (1,),
+    "experience": (2,),
+    "technical": (3, 5),
+    "behavioral": (4,),
+    "questions": (6,),
+    "closing": (),  # CLOSING_INSTRUCTION
+}
+
+STAGE_FLOW = """📋 INTERVIEW STAGES (in order):
+introduction → experience → technical → behavioral → questions → closing
+- After each update_interview_stage call you will get the guidance for the new stage"""
+
+
+def split_agent_phases(agent_instruction: str = AGENT_INSTRUCTION) -> tuple:
+    """
+    Split AGENT_INSTRUCTION into its general rules and its interview phases
+    
+    Returns:
+        (general rules with STAGE_FLOW in place of the phases, {phase number: phase text})
+    """
+    start = agent_instruction.index(_STRUCTURE_START)
+    end = agent_instruction.index(_STRUCTURE_END)
+    structure = agent_instruction[start + len(_STRUCTURE_START):end]
+    
+    headers = list(_PHASE_HEADER.finditer(structure))
+    phases = {
+        int(header.group(1)): structure[header.start():next_header.start() if next_header else None].strip()
+        for header, next_header in zip(headers, headers[1:] + [None])
+    }
+    general = agent_instruction[:start] + STAGE_FLOW + "\n\n" + agent_instruction[end:]
+    return general, phases
+
+
+INTERVIEW_FLOW_INSTRUCTION, _AGENT_PHASES = split_agent_phases()
+
+STAGE_INSTRUCTIONS = {
+    stage: "\n\n".join([f"CURRENT STAGE: {stage.upper()}"] + [_AGENT_PHASES[phase] for phase in phases])
+    for stage, phases in STAGE_PHASES.items()
+}
+STAGE_INSTRUCTIONS["closing"] += "\nFollow the END-OF-INTERVIEW PROTOCOL. Keep it short."
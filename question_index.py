@@ -0,0 +1,151 @@
+"""
+Near-duplicate question index
+Per-session index over the questions already asked, so the agent can check
+"has something like this been asked?" before asking a paraphrase of an
+earlier question.
+
+Questions are reduced to their content words (stopwords dropped, suffix
+stemming so "apps"/"app" and "manage"/"management" meet) and compared by
+exact weighted Jaccard similarity. Generic interview words ("project",
+"code", "biggest") count for little, so "test your code" and "deploy your
+code" stay apart. Each question keeps only its stem tuple; sessions ask a
+few dozen questions, so a linear scan is cheaper than any sketch. Memory per
+session is bounded by `max_questions`.
+
+SIMILARITY_THRESHOLD is tuned on the labelled pairs in
+tests/test_question_index.py and checked against a held-out set there.
+"""
+
+import re
+from collections import deque
+from typing import Deque, FrozenSet, List, Optional, Tuple
+
+SIMILARITY_THRESHOLD = 0.6
+MAX_INDEXED_QUESTIONS = 200
+GENERIC_WEIGHT = 0.25  # Weight of a GENERIC_WORDS stem; other stems weigh 1
+
+_WORD = re.compile(r"[a-z0-9+#]+")
+
+STOPWORDS = frozenset("""
+a about above after again all also am an and any are as at be been before being below between both but by
+can could did do does doing during each few for from had has have having how i if in into is it its just
+me more most my no nor not now of on once only or other our out over own please same should so some such
+tell than that the their them then there these they this those through to too under until up very was we
+were what when where which while who whom why will with would you your yours describe explain share walk
+talk kind sort example examples something thing things like within vs versus difference differ approach
+want interest interested especially really usually typically say bit much many everything anything
+""".split())
+
+# Words found in questions of every kind - they say little about which question it is
+GENERIC_WORDS = frozenset("""
+project projects work working worked job role team teams time times code experience experiences recent recently
+biggest greatest main key major usual day situation situations problem problems challenge challenges
+""".split())
+
+# Interview phrasings that mean the same thing; mapped before stemming. Verbs that
+# change the question ("handle" vs "give" feedback) are content words, not stopwords.
+SYNONYMS = {
+    "deal": "handle",
+    "keep": "stay",
+    "drives": "motivates",
+    "hardest": "challenging",
+    "toughest": "challenging",
+    "difficult": "challenging",
+}
+
+# Longest first; a suffix is only removed if at least 3 letters remain
+_SUFFIXES = ("ations", "ation", "ments", "ment", "ings", "ing", "ers", "er", "ed", "ly", "es", "s", "e")
+
+
+def _stem(word: str) -> str:
+    if word.endswith("ies") and len(word) > 4:
+        return word[:-3] + "y"
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            if suffix == "s" and word.endswith(("ss", "us", "is")):
+                continue
+            word = word[:-len(suffix)]
+            break
+    # "managed" -> "manag", "manage" -> "manag"; "coding" -> "cod", "code" -> "cod"
+    if word.endswith("e") and len(word) > 3:
+        word = word[:-1]
+    return word
+
+
+_GENERIC_STEMS = frozenset(_stem(word) for word in GENERIC_WORDS)
+
+
+def question_shingles(question: str) -> FrozenSet[str]:
+    """Stemmed content words of a question (order-free, so reworded questions still overlap)"""
+    return frozenset(
+        _stem(SYNONYMS.get(word, word)) for word in _WORD.findall(question.lower())
+        if len(word) > 1 and word not in STOPWORDS
+    )
+
+
+def _weight(stems) -> float:
+    return sum(GENERIC_WEIGHT if stem in _GENERIC_STEMS else 1.0 for stem in stems)
+
+
+def question_similarity(first: str, second: str) -> float:
+    """Weighted Jaccard similarity of two questions' content words (0-1)"""
+    a, b = question_shingles(first), question_shingles(second)
+    union = _weight(a | b)
+    return _weight(a & b) / union if union else 0.0
+
+
+class QuestionIndex:
+    """
+    Exact-similarity index of asked questions
+
+    Oldest questions are evicted beyond `max_questions`, keeping memory per
+    session bounded.
+    """
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD, max_questions: int = MAX_INDEXED_QUESTIONS):
+        self.threshold = threshold
+        self.max_questions = max_questions
+        self._entries: Deque[Tuple[str, Tuple[str, ...]]] = deque(maxlen=max_questions)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, question: str, shingles: Tuple[str, ...] = None) -> None:
+        """
+        Index an asked question
+
+        Args:
+            question: The question text
+            shingles: Its content stems, if already known (see entries())
+        """
+        if shingles is None:
+            shingles = tuple(question_shingles(question))
+        if shingles:
+            self._entries.append((question, shingles))
+
+    def entries(self) -> List[Tuple[str, Tuple[str, ...]]]:
+        """Indexed (question, stems) pairs, oldest first - re-add them to rebuild the index"""
+        return list(self._entries)
+
+    def find_similar(self, question: str, threshold: float = None) -> Optional[Tuple[str, float]]:
+        """
+        Most similar indexed question
+
+        Returns:
+            (question, weighted Jaccard similarity) if it reaches the threshold, else None
+        """
+        threshold = self.threshold if threshold is None else threshold
+        shingles = question_shingles(question)
+        if not shingles:
+            return None
+        weight = _weight(shingles)
+
+        best = None
+        for asked, asked_shingles in self._entries:
+            shared = _weight(stem for stem in asked_shingles if stem in shingles)
+            if not shared:
+                continue
+            similarity = shared / (weight + _weight(asked_shingles) - shared)
+            if similarity >= threshold and (best is None or similarity > best[1]):
+                best = (asked, similarity)
+        return best
@@ -0,0 +1,172 @@
+"""
+Role taxonomy
+Single source of truth for detecting a candidate's position from free text,
+used by the live agent (InterviewTools) and the offline chat-history parser.
+
+Roles and their aliases live in role_taxonomy.json (override the path with
+the ROLE_TAXONOMY_FILE environment variable). Aliases are compiled once into
+a word-level trie: text is tokenized into words, so 'hr' never matches inside
+"three", and the longest alias wins ('ui/ux designer' beats 'designer')
+regardless of the order roles are listed in.
+
+Broad field names ("machine learning", "sales") are listed under "fields":
+they only count when no role title is mentioned, so "studied machine
+learning, now I'm a frontend developer" is a Frontend Developer.
+"""
+
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger("interview-role-taxonomy")
+
+ROLE_TAXONOMY_FILE = os.getenv(
+    "ROLE_TAXONOMY_FILE",
+    str(Path(__file__).resolve().parent / "role_taxonomy.json")
+)
+
+_WORD = re.compile(r"[a-z0-9]+")
+_END = ""  # Trie key marking the end of an alias; never a word token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens ('UI/UX designer' -> ['ui', 'ux', 'designer'])"""
+    return _WORD.findall(text.lower())
+
+
+class PhraseIndex:
+    """
+    Word-level trie mapping phrases to values
+
+    Matching walks the trie from every token, so the cost depends on the
+    length of the text and of the longest phrase, not on how many phrases
+    are indexed.
+    """
+
+    def __init__(self):
+        self._root: Dict = {}
+        self.longest_phrase = 0
+
+    def add(self, phrase: str, value: str) -> None:
+        tokens = tokenize(phrase)
+        if not tokens:
+            raise ValueError(f"Empty phrase for {value!r}")
+
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        existing = node.get(_END)
+        if existing is not None and existing != value:
+            raise ValueError(f"Alias {phrase!r} maps to both {existing!r} and {value!r}")
+        node[_END] = value
+        self.longest_phrase = max(self.longest_phrase, len(tokens))
+
+    def find_all(self, text: str) -> List[Tuple[str, int, int]]:
+        """
+        Every longest match, scanning left to right
+
+        Returns:
+            (value, start_token, end_token) tuples; matches don't overlap
+        """
+        tokens = tokenize(text)
+        matches = []
+        position = 0
+        while position < len(tokens):
+            node = self._root
+            best = None
+            for index in range(position, len(tokens)):
+                node = node.get(tokens[index])
+                if node is None:
+                    break
+                if _END in node:
+                    best = (node[_END], position, index + 1)
+            if best:
+                matches.append(best)
+                position = best[2]
+            else:
+                position += 1
+        return matches
+
+
+class RoleTaxonomy:
+    """Compiled role aliases and content hints"""
+
+    def __init__(
+        self,
+        roles: Dict[str, List[str]],
+        content_hints: List[Dict] = None,
+        fields: Dict[str, List[str]] = None
+    ):
+        """
+        Args:
+            roles: Canonical role name -> title aliases (the name itself is always an alias)
+            content_hints: [{"role", "keywords"}] for inferring a role from the
+                conversation when nobody states it; earlier entries win
+            fields: Canonical role name -> field names, used only when the
+                text mentions no title alias
+        """
+        self.roles = sorted(roles)
+        self._aliases = PhraseIndex()
+        for role, aliases in roles.items():
+            for alias in [role, *aliases]:
+                self._aliases.add(alias, role)
+        self._fields = PhraseIndex()
+        for role, names in (fields or {}).items():
+            for name in names:
+                self._fields.add(name, role)
+
+        self._hint_priority = {}
+        self._hints = PhraseIndex()
+        for priority, hint in enumerate(content_hints or []):
+            self._hint_priority.setdefault(hint["role"], priority)
+            for keyword in hint["keywords"]:
+                self._hints.add(keyword, hint["role"])
+
+    @classmethod
+    def from_file(cls, path: str = ROLE_TAXONOMY_FILE) -> "RoleTaxonomy":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        taxonomy = cls(data["roles"], data.get("content_hints"), data.get("fields"))
+        logger.info(f"Loaded role taxonomy: {len(taxonomy.roles)} roles from {path}")
+        return taxonomy
+
+    def detect(self, text: str) -> Optional[str]:
+        """
+        Role the text states explicitly
+
+        Role titles win over field names. Among those, the longest alias wins,
+        and on ties the last mention ("I was a designer, now I'm a recruiter").
+
+        Returns:
+            Canonical role, or None
+        """
+        matches = self._aliases.find_all(text) or self._fields.find_all(text)
+        if not matches:
+            return None
+        return max(matches, key=lambda match: (match[2] - match[1], match[1]))[0]
+
+    def infer_from_content(self, text: str) -> Optional[str]:
+        """
+        Guess a role from topic keywords (e.g. 'figma', 'react') when none was stated
+
+        Returns:
+            The highest-priority hinted role mentioned in the text, or None
+        """
+        hinted = {role for role, _, _ in self._hints.find_all(text)}
+        if not hinted:
+            return None
+        return min(hinted, key=self._hint_priority.__getitem__)
+
+
+_taxonomy = None
+
+
+def get_role_taxonomy() -> RoleTaxonomy:
+    """Process-wide taxonomy, compiled on first use"""
+    global _taxonomy
+    if _taxonomy is None:
+        _taxonomy = RoleTaxonomy.from_file()
+    return _taxonomy
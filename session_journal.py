@@ -0,0 +1,231 @@
+"""
+Crash-safe session journal
+Every InterviewTools mutation is appended to a per-session JSONL journal so
+an interview survives a worker crash. Appends only enqueue the record; a
+background thread writes and fsyncs whole batches (group commit), so the
+conversation never waits on the disk.
+
+Journals of sessions that ended normally are removed once their evaluation
+is queued. Anything left behind belongs to an interrupted session and is
+rebuilt with recover_interview_tools / recover_interrupted_sessions.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows - fall back to journal age
+    fcntl = None
+
+from tools import InterviewTools
+
+logger = logging.getLogger("interview-session-journal")
+
+JOURNAL_DIR = os.getenv("SESSION_JOURNAL_DIR", "evaluations/journals")
+JOURNAL_COMMIT_INTERVAL = float(os.getenv("SESSION_JOURNAL_COMMIT_INTERVAL", "0.05"))  # Seconds between fsyncs
+JOURNAL_STALE_SECONDS = 3600.0  # Without file locks, only journals idle this long are recovered
+JOURNAL_SUFFIX = ".journal"
+
+
+def _try_lock(file) -> bool:
+    """Take an exclusive, non-blocking lock; True if this process now owns the journal"""
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+class SessionJournal:
+    """
+    Append-only JSONL journal with group-commit fsync
+
+    append() never touches the disk. The writer thread takes everything
+    queued since its last commit, writes it in one go and fsyncs once, then
+    waits `commit_interval` so the next batch can build up. The file stays
+    locked while the session is live, so recovery never picks it up.
+    """
+
+    def __init__(self, path: str, commit_interval: float = JOURNAL_COMMIT_INTERVAL):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.commit_interval = commit_interval
+        self._file = open(self.path, "ab")
+        if not _try_lock(self._file):
+            self._file.close()
+            raise RuntimeError(f"Journal {self.path} is in use by another process")
+
+        self._cond = threading.Condition()
+        self._pending: List[Dict] = []
+        self._appended = 0
+        self._durable = 0
+        self._closing = False
+        self.commits = 0
+        self._writer = threading.Thread(target=self._run, name=f"journal-{self.path.stem}", daemon=True)
+        self._writer.start()
+
+    def append(self, op: str, **fields) -> None:
+        """Queue a record (returns immediately)"""
+        record = {"op": op, **fields}
+        with self._cond:
+            if self._closing:
+                logger.warning(f"Dropping '{op}' record - journal {self.path.name} is closed")
+                return
+            self._pending.append(record)
+            self._appended += 1
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closing:
+                    self._cond.wait()
+                batch, self._pending = self._pending, []
+                closing = self._closing
+
+            if batch:
+                data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in batch)
+                try:
+                    self._file.write(data.encode("utf-8"))
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+                except OSError as e:
+                    logger.error(f"Journal write failed ({self.path.name}): {e}")
+                with self._cond:
+                    self._durable += len(batch)
+                    self.commits += 1
+                    self._cond.notify_all()
+
+            if closing and not batch:
+                return
+            if not closing:
+                time.sleep(self.commit_interval)
+
+    def sync(self, timeout: float = None) -> bool:
+        """Block until every record appended so far is on disk; False on timeout"""
+        with self._cond:
+            target = self._appended
+            return self._cond.wait_for(lambda: self._durable >= target, timeout=timeout)
+
+    def close(self, remove: bool = False) -> None:
+        """
+        Write out pending records and release the journal
+
+        Args:
+            remove: Delete the file - the session's data is safe elsewhere
+                (e.g. its evaluation job has been queued)
+        """
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            self._cond.notify_all()
+        self._writer.join()
+        if remove:
+            self.path.unlink(missing_ok=True)
+        self._file.close()  # Releases the lock
+
+
+def open_session_journal(session_id: str, journal_dir: str = JOURNAL_DIR) -> SessionJournal:
+    """Create the journal for a new session"""
+    safe_id = "".join(char if char.isalnum() or char in "-_" else "_" for char in session_id)
+    return SessionJournal(Path(journal_dir) / f"{safe_id}_{int(time.time() * 1000)}{JOURNAL_SUFFIX}")
+
+
+def read_journal(path: str) -> List[Dict]:
+    """
+    Read journal records, stopping at a torn final line
+
+    A crash can interrupt the last write; everything before it was fsynced
+    in an earlier commit and is intact.
+    """
+    records = []
+    with open(path, "rb") as f:
+        for line_number, line in enumerate(f, 1):
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                logger.warning(f"{Path(path).name}: ignoring incomplete record at line {line_number}")
+                break
+    return records
+
+
+def recover_interview_tools(path: str) -> InterviewTools:
+    """
+    Rebuild an InterviewTools instance from a session journal
+
+    The session's end time is taken from the journal's last write.
+    """
+    tools = InterviewTools()
+    for record in read_journal(path):
+        tools.apply_journal_record(record)
+    tools.end_time = datetime.fromtimestamp(os.path.getmtime(path))
+    return tools
+
+
+def _claim_journal(path: Path) -> Optional[object]:
+    """Lock an abandoned journal for recovery; returns the open file or None"""
+    try:
+        file = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    if fcntl is None:
+        claimed = time.time() - os.fstat(file.fileno()).st_mtime > JOURNAL_STALE_SECONDS
+    else:
+        # Still the file at this path (not one another process already recovered and removed)?
+        claimed = _try_lock(file) and path.exists() and os.stat(path).st_ino == os.fstat(file.fileno()).st_ino
+    if not claimed:
+        file.close()
+        return None
+    return file
+
+
+async def recover_interrupted_sessions(
+    enqueue: Callable[[Dict], Awaitable[int]],
+    journal_dir: str = JOURNAL_DIR
+) -> List[int]:
+    """
+    Queue evaluations for sessions whose worker died mid-interview
+
+    Journals still locked by a live session are skipped. Each recovered
+    journal is removed once its evaluation job is queued.
+
+    Args:
+        enqueue: EvaluationJobQueue.enqueue (awaited on the event loop)
+
+    Returns:
+        Ids of the queued evaluation jobs
+    """
+    directory = Path(journal_dir)
+    if not directory.exists():
+        return []
+
+    job_ids = []
+    for path in sorted(directory.glob(f"*{JOURNAL_SUFFIX}")):
+        file = await asyncio.to_thread(_claim_journal, path)
+        if file is None:
+            continue
+        try:
+            tools = await asyncio.to_thread(recover_interview_tools, str(path))
+            if tools.transcript:
+                job_id = await enqueue(tools.get_interview_data_for_evaluation())
+                job_ids.append(job_id)
+                logger.info(f"Recovered interrupted session {path.name} ({len(tools.transcript)} turns) as job {job_id}")
+            else:
+                logger.info(f"Discarding journal {path.name} - no conversation captured")
+            path.unlink(missing_ok=True)
+        except Exception as e:
+            logger.error(f"Could not recover {path.name}: {e}")
+        finally:
+            file.close()
+    return job_ids
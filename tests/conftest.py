@@ -0,0 +1,51 @@
+"""Shared helpers for the session journal and snapshot tests"""
+
+import logging
+
+import pytest
+
+logging.disable(logging.CRITICAL)
+
+
+def _run_interview(tools):
+    """Drive an InterviewTools session through every kind of journaled change"""
+    tools.add_to_transcript("interviewer", "Hello, I am SIMA. Tell me about yourself?")
+    tools.add_to_transcript("candidate", "Hi, my name is Priya Sharma and I'm a backend developer with 4 years experience.")
+    tools.store_candidate_info("experience_years", "4")
+    tools.record_note("Four years of backend work", "experience")
+    tools.update_interview_stage("technical")
+    tools.mark_question_asked("How do you design a REST API?", "technical")
+    tools.add_to_transcript("interviewer", "How do you design a REST API?")
+    tools.add_to_transcript("candidate", "Resources first, then versioning and pagination. This is boring though.")
+    tools.check_inappropriate_behavior("This is boring though.")
+    tools.record_note("Clear API design answer", "technical")
+    tools.update_interview_stage("behavioral")
+    tools.add_to_transcript("interviewer", "Tell me about a conflict in your team?")
+
+
+def _session_state(tools) -> dict:
+    """Everything a restored or recovered session must reproduce"""
+    return {
+        "candidate_name": tools.candidate_name,
+        "position": tools.position,
+        "candidate_info": tools.candidate_info,
+        "stage": tools.interview_stage,
+        "stage_history": tools.stage_history,
+        "transcript": tools.get_full_transcript(),
+        "transcript_token_count": tools.transcript_token_count,
+        "notes": [(note.category, note.note, note.stage) for note in tools.candidate_notes],
+        "questions": [(q.question, q.stage, q.category) for q in tools.questions_asked],
+        "indexed_questions": tools.question_index.entries(),
+        "warning_count": tools.warning_count,
+        "terminated": tools.interview_terminated,
+    }
+
+
+@pytest.fixture
+def run_interview():
+    return _run_interview
+
+
+@pytest.fixture
+def session_state():
+    return _session_state
@@ -0,0 +1,75 @@
+"""Resumable bulk mode of generate_evaluation.py"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from evaluation_batch import LocalBatchTransport
+from generate_evaluation import bulk_generate_evaluations
+
+
+def write_chat_history(path, name):
+    items = [
+        {"type": "message", "role": "assistant", "content": ["Hello, tell me about yourself?"], "created_at": 0},
+        {"type": "message", "role": "user", "content": [f"My name is {name} and I'm a backend developer."], "created_at": 600},
+    ]
+    path.write_text(json.dumps({"items": items}), encoding="utf-8")
+
+
+class Responder:
+    """Local batch responder that fails the requests of the given candidates"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.candidates = []
+
+    def __call__(self, request_body):
+        prompt = json.dumps(request_body)
+        name = next(name for name in ("Asha", "Bilal", "Chen") if name in prompt)
+        self.candidates.append(name)
+        if name in self.failing:
+            raise RuntimeError("rate limited")
+        return {"ratings": {"overall_score": 7}, "recommendation": {"decision": "Hire"}}
+
+
+@pytest.fixture
+def histories(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    directory = tmp_path / "histories"
+    directory.mkdir()
+    for name in ("Asha", "Bilal", "Chen"):
+        write_chat_history(directory / f"{name.lower()}.json", name)
+    return directory
+
+
+def run_bulk(histories, responder):
+    transport = LocalBatchTransport(work_dir="evaluations/batches/local", responder=responder)
+    return asyncio.run(bulk_generate_evaluations(
+        str(histories), manifest_file="manifest.json", batch_transport=transport
+    ))
+
+
+def test_rerun_retries_only_failed_and_new_files(histories, tmp_path):
+    first = Responder(failing={"Chen"})
+    stats = run_bulk(histories, first)
+    assert (stats["succeeded"], stats["failed"]) == (2, 1)
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+    statuses = {Path(name).name: entry["status"] for name, entry in manifest["files"].items()}
+    assert statuses == {"asha.json": "done", "bilal.json": "done", "chen.json": "failed"}
+    assert not list((tmp_path / "evaluations").glob("Chen_*.json"))  # No fallback report for the failure
+
+    second = Responder()
+    stats = run_bulk(histories, second)
+    assert second.candidates == ["Chen"]
+    assert (stats["files"], stats["succeeded"], stats["failed"]) == (1, 1, 0)
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+    assert {entry["status"] for entry in manifest["files"].values()} == {"done"}
+    assert len(list((tmp_path / "evaluations").glob("*_*.json"))) == 3
+
+    third = Responder()
+    assert run_bulk(histories, third)["files"] == 0
+    assert third.candidates == []
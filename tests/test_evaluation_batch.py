@@ -0,0 +1,82 @@
+"""Batch evaluation flow through the local (offline) batch transport"""
+
+import asyncio
+import json
+
+import pytest
+
+from evaluation import InterviewEvaluator
+from evaluation_batch import LocalBatchTransport, parse_batch_result
+
+
+def make_interview(name):
+    return {
+        "candidate_name": name,
+        "position": "Backend Developer",
+        "transcript": f"Interviewer: Tell me about yourself?\n\nCandidate: I'm {name}, a backend developer.",
+        "interview_notes": [{"category": "experience", "note": "Four years of backend work"}],
+        "duration_minutes": 20,
+    }
+
+
+def failing_responder(request_body):
+    """Offline assessment, except for the broken candidate's request"""
+    prompt = json.dumps(request_body)
+    if "Broken Candidate" in prompt:
+        raise RuntimeError("model refused")
+    return {
+        "overall_assessment": {"summary": "Solid", "hire_recommendation": "Hire"},
+        "ratings": {"overall_score": 8},
+        "recommendation": {"decision": "Hire"},
+    }
+
+
+@pytest.fixture
+def evaluator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return InterviewEvaluator(openai_api_key="test-key", fallback_on_error=False)
+
+
+def test_local_transport_submit_poll_fetch(tmp_path):
+    transport = LocalBatchTransport(work_dir=str(tmp_path / "local"), responder=failing_responder)
+    batch_file = tmp_path / "batch.jsonl"
+    requests = [
+        {"custom_id": "evaluation-0", "body": {"messages": [{"role": "user", "content": "Good Candidate"}]}},
+        {"custom_id": "evaluation-1", "body": {"messages": [{"role": "user", "content": "Broken Candidate"}]}},
+    ]
+    batch_file.write_text("".join(json.dumps(r) + "\n" for r in requests), encoding="utf-8")
+
+    async def run():
+        batch_id = await transport.submit(batch_file)
+        status = await transport.poll(batch_id)
+        return status, {r["custom_id"]: r for r in await transport.fetch_results(batch_id)}
+
+    status, results = asyncio.run(run())
+
+    assert status["status"] == "completed"
+    assert parse_batch_result(results["evaluation-0"])["recommendation"] == {"decision": "Hire"}
+    with pytest.raises(ValueError, match="model refused"):
+        parse_batch_result(results["evaluation-1"])
+    with pytest.raises(ValueError, match="No result"):
+        parse_batch_result(None)
+
+
+def test_batch_saves_successes_and_skips_failed_lines(evaluator, tmp_path):
+    transport = LocalBatchTransport(work_dir=str(tmp_path / "local"), responder=failing_responder)
+    interviews = [make_interview("Good Candidate"), make_interview("Broken Candidate")]
+
+    good, broken = asyncio.run(evaluator.evaluate_interviews_batch(interviews, transport, poll_interval=0))
+
+    assert good["metadata"]["candidate_name"] == "Good Candidate"
+    assert good["recommendation"]["decision"] == "Hire"
+    assert good["metadata"]["batch_id"] == broken["metadata"]["batch_id"]
+    saved = json.loads((tmp_path / good["metadata"]["saved_to"]).read_text(encoding="utf-8"))
+    assert saved["metadata"]["candidate_name"] == "Good Candidate"
+
+    assert broken["metadata"]["candidate_name"] == "Broken Candidate"
+    assert "model refused" in broken["metadata"]["batch_error"]
+    assert "saved_to" not in broken["metadata"]
+
+    saved_files = sorted(path.name for path in (tmp_path / "evaluations").glob("*.json"))
+    assert len(saved_files) == 1 and saved_files[0].startswith("Good_Candidate_")
+    assert [row["candidate_name"] for row in evaluator.store.query()] == ["Good Candidate"]
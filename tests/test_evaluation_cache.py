@@ -0,0 +1,87 @@
+"""Content-addressed evaluation cache: hits, misses, LRU and TTL eviction"""
+
+import pytest
+
+import evaluation_cache
+from evaluation_cache import EvaluationCache, make_cache_key
+
+KEY_INPUTS = {
+    "transcript": "Interviewer: Hi\n\nCandidate: Hello",
+    "interview_notes": [{"category": "general", "note": "Friendly"}],
+    "position": "Backend Developer",
+    "prompt_version": "3",
+    "model": "gpt-4o",
+    "temperature": 0.3,
+}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(evaluation_cache.time, "time", clock)
+    return clock
+
+
+def make_cache(tmp_path, **kwargs):
+    return EvaluationCache(db_path=str(tmp_path / "cache.db"), **kwargs)
+
+
+def test_key_covers_every_input():
+    key = make_cache_key(**KEY_INPUTS)
+    assert make_cache_key(**dict(reversed(list(KEY_INPUTS.items())))) == key
+    for name, value in [("transcript", "Candidate: Bye"), ("prompt_version", "4"), ("temperature", 0.5)]:
+        assert make_cache_key(**{**KEY_INPUTS, name: value}) != key
+    assert make_cache_key(**KEY_INPUTS, candidate_name="Priya") != key
+
+
+def test_hit_and_miss(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    key = make_cache_key(**KEY_INPUTS)
+
+    assert cache.get(key) is None
+    cache.put(key, {"ratings": {"overall_score": 8}})
+    assert cache.get(key) == {"ratings": {"overall_score": 8}}
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path, clock):
+    cache = make_cache(tmp_path, max_entries=2)
+    cache.put("a", {"value": 1})
+    clock.now += 1
+    cache.put("b", {"value": 2})
+    clock.now += 1
+    assert cache.get("a") == {"value": 1}  # "b" is now the least recently used
+    clock.now += 1
+    cache.put("c", {"value": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"value": 1} and cache.get("c") == {"value": 3}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_size_bound_evicts_entries(tmp_path, clock):
+    cache = make_cache(tmp_path, max_bytes=100)
+    cache.put("a", {"text": "x" * 60})
+    clock.now += 1
+    cache.put("b", {"text": "y" * 60})
+
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 1
+
+
+def test_expired_entries_are_misses(tmp_path, clock):
+    cache = make_cache(tmp_path, ttl_seconds=60)
+    cache.put("a", {"value": 1})
+    clock.now += 30
+    assert cache.get("a") == {"value": 1}  # Access does not extend the TTL
+    clock.now += 31
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
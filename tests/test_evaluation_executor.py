@@ -0,0 +1,45 @@
+"""Host-wide cap on evaluation processes"""
+
+import pytest
+
+import evaluation_executor
+from evaluation_executor import EvaluationExecutor, claim_host_slot
+
+pytestmark = pytest.mark.skipif(evaluation_executor.fcntl is None, reason="host slots need fcntl")
+
+
+@pytest.fixture(autouse=True)
+def slot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(evaluation_executor, "EVALUATION_SLOT_DIR", str(tmp_path / "slots"))
+
+
+def test_slots_are_capped_and_freed_on_close():
+    first = claim_host_slot(2)
+    second = claim_host_slot(2)
+    assert first is not None and second is not None
+    assert claim_host_slot(2) is None
+
+    first.close()
+    third = claim_host_slot(2)
+    assert third is not None
+    second.close()
+    third.close()
+
+
+def test_executor_evaluates_in_process_when_every_slot_is_busy():
+    held = claim_host_slot(1)
+    executor = EvaluationExecutor(processes=1)
+    try:
+        assert executor.start() is False
+        assert executor._pool is None and executor._slot is None
+    finally:
+        held.close()
+        executor.shutdown()
+
+
+def test_disabled_executor_never_claims_a_slot():
+    executor = EvaluationExecutor(processes=0)
+    assert executor.start() is False
+    slot = claim_host_slot(1)
+    assert slot is not None
+    slot.close()
@@ -0,0 +1,138 @@
+"""Leasing, retries, ownership and shared rate limits of the evaluation queue"""
+
+import asyncio
+import time
+
+import pytest
+
+import evaluation_queue
+from evaluation_queue import EvaluationJobQueue
+
+INTERVIEW = {"candidate_name": "Test Candidate", "transcript": "Interviewer: Hi\n\nCandidate: Hello", "interview_notes": []}
+
+
+async def no_op_handler(interview_data, final_attempt):
+    return "saved.json"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "queue.db")
+
+
+def make_queue(db_path, handler=no_op_handler, **kwargs):
+    kwargs.setdefault("workers", 1)
+    return EvaluationJobQueue(db_path=db_path, handler=handler, **kwargs)
+
+
+def test_claimed_job_is_leased_until_completed(db_path):
+    queue = make_queue(db_path)
+    job_id = asyncio.run(queue.enqueue(INTERVIEW))
+
+    assert queue._claim_next()[0] == job_id
+    assert queue._claim_next() is None  # Leased
+    queue._complete(job_id, "saved.json")
+    assert queue.get_job(job_id) == {
+        "id": job_id, "status": "done", "attempts": 1, "last_error": None, "result": "saved.json"
+    }
+    assert queue._claim_next() is None
+
+
+def test_expired_lease_is_claimed_again(db_path):
+    queue = make_queue(db_path)
+    job_id = asyncio.run(queue.enqueue(INTERVIEW))
+    queue._claim_next()
+
+    queue._execute("UPDATE evaluation_jobs SET lease_expires_at = ? WHERE id = ?", (time.time() - 1, job_id))
+    row = queue._claim_next()
+    assert row[0] == job_id
+    assert row[3] == 1  # Attempts before this claim
+    assert queue.get_job(job_id)["attempts"] == 2
+
+
+def test_failure_backs_off_then_fails_permanently(db_path):
+    queue = make_queue(db_path, max_attempts=2)
+    job_id = asyncio.run(queue.enqueue(INTERVIEW))
+
+    queue._claim_next()
+    queue._fail(job_id, 1, "rate limited")
+    job = queue.get_job(job_id)
+    assert (job["status"], job["last_error"]) == ("pending", "rate limited")
+    assert queue._claim_next() is None  # Backing off
+
+    queue._execute("UPDATE evaluation_jobs SET next_run_at = ? WHERE id = ?", (time.time() - 1, job_id))
+    assert queue._claim_next()[0] == job_id
+    queue._fail(job_id, 2, "rate limited again")
+    assert queue.get_job(job_id)["status"] == "failed"
+    assert queue._claim_next() is None
+
+
+def test_jobs_of_a_live_owner_are_left_alone(db_path):
+    owner = make_queue(db_path)
+    other = make_queue(db_path)
+    job_id = asyncio.run(owner.enqueue(INTERVIEW))
+
+    assert other._claim_next() is None
+    owner._execute("UPDATE evaluation_jobs SET owner_expires_at = ? WHERE id = ?", (time.time() - 1, job_id))
+    assert other._claim_next()[0] == job_id  # Owner stopped renewing
+
+
+def test_stop_releases_unfinished_jobs(db_path):
+    owner = make_queue(db_path)
+    other = make_queue(db_path)
+    pending_id = asyncio.run(owner.enqueue(INTERVIEW))
+    running_id = asyncio.run(owner.enqueue(INTERVIEW))
+    owner._execute("UPDATE evaluation_jobs SET next_run_at = next_run_at + 1000 WHERE id = ?", (pending_id,))
+    assert owner._claim_next()[0] == running_id
+
+    asyncio.run(owner.stop())
+    assert {other._claim_next()[0], other._claim_next()[0]} == {pending_id, running_id}
+
+
+def test_start_during_stop_waits_and_restarts_workers(db_path):
+    async def run():
+        queue = make_queue(db_path)
+        await queue.start()
+        stopping = asyncio.create_task(queue.stop())
+        await asyncio.sleep(0)  # stop() is now awaiting its workers
+        await queue.start()
+        assert stopping.done()
+        running = [task for task in queue._tasks if not task.done()]
+        await queue.stop()
+        return len(running)
+
+    assert asyncio.run(run()) == 2  # One worker plus the ownership renewal task
+
+
+def test_worker_retries_until_the_handler_succeeds(db_path, monkeypatch):
+    monkeypatch.setattr(evaluation_queue, "BACKOFF_BASE_SECONDS", 0.01)
+    monkeypatch.setattr(evaluation_queue, "POLL_INTERVAL_SECONDS", 0.01)
+    calls = []
+
+    async def flaky_handler(interview_data, final_attempt):
+        calls.append(final_attempt)
+        if len(calls) < 3:
+            raise RuntimeError("temporary failure")
+        return "saved.json"
+
+    async def run():
+        queue = make_queue(db_path, handler=flaky_handler, max_attempts=3)
+        await queue.start()
+        job_id = await queue.enqueue(INTERVIEW)
+        job = await queue.wait_for(job_id, timeout=10)
+        await queue.stop()
+        return job
+
+    job = asyncio.run(run())
+    assert (job["status"], job["attempts"], job["result"]) == ("done", 3, "saved.json")
+    assert calls == [False, False, True]  # Only the last attempt may save a fallback
+
+
+def test_rate_limit_is_shared_by_every_queue_on_the_database(db_path):
+    first = make_queue(db_path, requests_per_minute=60)
+    second = make_queue(db_path, requests_per_minute=60)
+
+    for _ in range(30):
+        assert first.request_limiter._try_take(1) == 0
+        assert second.request_limiter._try_take(1) == 0
+    assert second.request_limiter._try_take(1) == pytest.approx(1.0, abs=0.1)  # 1 request per second
@@ -0,0 +1,40 @@
+"""Shared evaluation index and its lazy import of pre-index evaluations"""
+
+import json
+
+from evaluation_store import get_evaluation_store
+
+
+def write_evaluation(directory, filename, candidate_name, score):
+    evaluation = {
+        "metadata": {"candidate_name": candidate_name, "position": "Backend Developer", "interview_date": "2026-01-01"},
+        "ratings": {"overall_score": score},
+        "recommendation": {"decision": "Hire"},
+    }
+    (directory / filename).write_text(json.dumps(evaluation), encoding="utf-8")
+    return evaluation
+
+
+def test_one_store_per_directory(tmp_path):
+    assert get_evaluation_store(tmp_path / "evaluations") is get_evaluation_store(str(tmp_path / "evaluations"))
+    assert get_evaluation_store(tmp_path / "evaluations") is not get_evaluation_store(tmp_path / "other")
+
+
+def test_existing_evaluations_are_imported_on_first_read_only(tmp_path):
+    directory = tmp_path / "evaluations"
+    directory.mkdir()
+    write_evaluation(directory, "old.json", "Old Candidate", 6)
+
+    store = get_evaluation_store(directory)
+    new = write_evaluation(directory, "new.json", "New Candidate", 8)
+    store.index_evaluation("new.json", new)
+    assert store._needs_migration  # Writes alone never scan the directory
+
+    assert sorted(row["filename"] for row in store.query()) == ["new.json", "old.json"]
+    assert not store._needs_migration
+
+    # Copied in after the import: picked up by an explicit migrate()
+    write_evaluation(directory, "copied.json", "Copied Candidate", 7)
+    assert store.count() == 2
+    assert store.migrate() == {"imported": 1, "skipped": 2, "failed": 0}
+    assert store.count() == 3
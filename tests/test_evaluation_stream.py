@@ -0,0 +1,59 @@
+"""Incremental parsing of the streamed evaluation JSON (evaluation_stream)"""
+
+import json
+
+import pytest
+
+from evaluation_stream import IncrementalSectionParser
+
+EVALUATION = {
+    "overall_assessment": {
+        "summary": "Solid answers, {braces} and [brackets] inside strings",
+        "hire_recommendation": "Hire",
+        "reasoning": "Said \"it depends\", then explained, with commas"
+    },
+    "ratings": {"overall_score": 7.5, "technical_competency": 8},
+    "strengths": ["Clear communication", "Knows \\ escapes"],
+    "weaknesses": [],
+    "red_flags": [],
+    "transcript_summary": "Ünïcödé and a colon: here"
+}
+RESPONSE = json.dumps(EVALUATION, indent=4, ensure_ascii=False)
+
+
+def feed_in_chunks(text: str, size: int) -> list:
+    parser = IncrementalSectionParser()
+    sections = []
+    for start in range(0, len(text), size):
+        sections.extend(parser.feed(text[start:start + size]))
+    assert parser.result() == EVALUATION
+    return sections
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, len(RESPONSE)])
+def test_sections_match_a_full_parse_whatever_the_chunking(chunk_size):
+    assert feed_in_chunks(RESPONSE, chunk_size) == list(EVALUATION.items())
+
+
+def test_section_is_emitted_as_soon_as_it_is_complete():
+    parser = IncrementalSectionParser()
+    end_of_ratings = RESPONSE.index('"strengths"')
+
+    completed = parser.feed(RESPONSE[:end_of_ratings])
+    assert [key for key, _ in completed] == ["overall_assessment", "ratings"]
+    assert parser.sections["ratings"] == EVALUATION["ratings"]
+
+    completed = parser.feed(RESPONSE[end_of_ratings:])
+    assert [key for key, _ in completed] == ["strengths", "weaknesses", "red_flags", "transcript_summary"]
+
+
+def test_incomplete_section_is_not_emitted():
+    parser = IncrementalSectionParser()
+    assert parser.feed('{"summary": "half a sent') == []
+    assert parser.feed('ence", ') == [("summary", "half a sentence")]
+    assert parser.feed('"score": 7') == []
+    assert parser.feed('}') == [("score", 7)]
+
+
+def test_compact_json():
+    assert feed_in_chunks(json.dumps(EVALUATION, separators=(",", ":")), 3) == list(EVALUATION.items())
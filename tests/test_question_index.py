@@ -0,0 +1,116 @@
+"""Near-duplicate question detection (question_index)"""
+
+import pytest
+
+from question_index import SIMILARITY_THRESHOLD, QuestionIndex, question_similarity
+
+# Labelled pairs SIMILARITY_THRESHOLD is tuned on
+PARAPHRASES = [
+    ("Can you explain how you manage state in React apps?", "How do you handle state management in a React app?"),
+    ("What are your strengths?", "What are your biggest strengths?"),
+    ("Tell me about yourself.", "Could you tell me a bit about yourself?"),
+    ("How do you handle conflicts within your team?", "How do you deal with conflict in a team?"),
+    ("Why do you want to work at our company?", "Why are you interested in working for our company?"),
+    ("What is your experience with Python?", "How much experience do you have with Python?"),
+    ("How do you test your code?", "What is your approach to testing code?"),
+    ("Describe a time you missed a deadline.", "Tell me about a time when you missed a deadline."),
+    ("How do you optimize database queries?", "What do you do to optimize slow database queries?"),
+    ("What is your biggest weakness?", "What would you say is your greatest weakness?"),
+    ("How do you prioritize tasks when everything is urgent?", "How do you prioritize your tasks?"),
+    ("Walk me through how you design a REST API.", "How would you design a REST API?"),
+    ("Where do you see yourself in five years?", "Where do you see yourself in 5 years time?"),
+    ("How do you stay up to date with new technologies?", "How do you keep up with new technology?"),
+]
+
+DIFFERENT_QUESTIONS = [
+    ("How do you test your code?", "How do you deploy your code?"),
+    ("Tell me about a recent project where you worked on the frontend.",
+     "Tell me about a recent project where you worked on the backend."),
+    ("What is your biggest weakness?", "What are your biggest strengths?"),
+    ("How do you manage state in React?", "How do you test React components?"),
+    ("What is your experience with Python?", "What is your experience with Java?"),
+    ("Tell me about a challenging project.", "Tell me about a challenging team situation."),
+    ("How do you optimize database queries?", "How do you design a database schema?"),
+    ("Why do you want to leave your current job?", "Why do you want to work at our company?"),
+    ("How do you handle code reviews?", "How do you handle production incidents?"),
+    ("Describe a time you disagreed with your manager.", "Describe a time you mentored a junior developer."),
+    ("What do you know about our company?", "Why do you want to work at our company?"),
+    ("How do you debug memory leaks?", "How do you debug slow API responses?"),
+]
+
+# Held out: not used when tuning SIMILARITY_THRESHOLD, GENERIC_WORDS or SYNONYMS
+HELD_OUT_PARAPHRASES = [
+    ("What motivates you?", "What drives you at work?"),
+    ("Tell me about your most challenging project.", "What was your hardest project?"),
+    ("How do you handle tight deadlines?", "How do you deal with tight deadlines?"),
+    ("How do you keep your skills current?", "How do you stay current with your skills?"),
+    ("What was the most difficult bug you fixed?", "What is the hardest bug you have fixed?"),
+    ("Can you give an example of a time you missed a deadline?", "Describe a time you missed a deadline."),
+]
+
+HELD_OUT_DIFFERENT = [
+    ("How do you handle feedback?", "How do you give feedback?"),
+    ("How would you design a REST API?", "How would you secure a REST API?"),
+    ("What is your experience with Python?", "What is your experience with Python testing?"),
+    ("How do you handle stress?", "How do you handle criticism?"),
+    ("Why did you choose software engineering?", "Why did you leave your last job?"),
+    ("What is your experience with AWS?", "What is your experience with AWS Lambda?"),
+    ("How do you mentor junior developers?", "How do you onboard junior developers?"),
+    ("What motivates you to learn?", "What motivates your team?"),
+]
+
+
+@pytest.mark.parametrize("asked, paraphrase", PARAPHRASES + HELD_OUT_PARAPHRASES)
+def test_paraphrases_reach_threshold(asked, paraphrase):
+    assert question_similarity(asked, paraphrase) >= SIMILARITY_THRESHOLD
+
+
+@pytest.mark.parametrize("asked, other", DIFFERENT_QUESTIONS + HELD_OUT_DIFFERENT)
+def test_different_questions_stay_below_threshold(asked, other):
+    assert question_similarity(asked, other) < SIMILARITY_THRESHOLD
+
+
+def test_find_similar_returns_best_match():
+    index = QuestionIndex()
+    index.add("How do you test your code?")
+    index.add("Can you explain how you manage state in React apps?")
+
+    question, similarity = index.find_similar("How do you handle state management in a React app?")
+    assert question == "Can you explain how you manage state in React apps?"
+    assert similarity >= SIMILARITY_THRESHOLD
+    assert index.find_similar("How do you deploy your code?") is None
+
+
+def test_entries_rebuild_the_index():
+    index = QuestionIndex()
+    index.add("What are your strengths?")
+    rebuilt = QuestionIndex()
+    for question, shingles in index.entries():
+        rebuilt.add(question, shingles)
+    assert rebuilt.find_similar("What are your biggest strengths?")[0] == "What are your strengths?"
+
+
+def test_oldest_questions_are_evicted():
+    index = QuestionIndex(max_questions=2)
+    for question in ("How do you test your code?", "What are your strengths?", "Why this company?"):
+        index.add(question)
+    assert len(index) == 2
+    assert index.find_similar("How do you test your code?") is None
+
+
+def test_questions_without_content_words_are_not_indexed():
+    index = QuestionIndex()
+    index.add("What do you do?")
+    assert len(index) == 0
+    assert index.find_similar("How are you?") is None
+
+
+def test_spoken_interviewer_questions_are_indexed_not_counted():
+    from tools import InterviewTools
+
+    tools = InterviewTools()
+    tools.candidate_name = "Test Candidate"
+    tools.add_to_transcript("interviewer", "Thanks. Can you explain how you manage state in React apps?")
+
+    assert tools.questions_asked == []
+    assert tools.find_similar_question("How do you handle state management in a React app?") is not None
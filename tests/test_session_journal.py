@@ -0,0 +1,78 @@
+"""Crash recovery from the session journal (session_journal)"""
+
+import asyncio
+
+from session_journal import (
+    SessionJournal,
+    read_journal,
+    recover_interrupted_sessions,
+    recover_interview_tools
+)
+from tools import InterviewTools
+
+
+def write_journal(path, run_interview, close=True) -> tuple:
+    tools = InterviewTools()
+    journal = SessionJournal(str(path), commit_interval=0)
+    tools.attach_journal(journal)
+    run_interview(tools)
+    if close:
+        journal.close()
+    else:
+        assert journal.sync(timeout=5)
+    return tools, journal
+
+
+def test_replay_rebuilds_the_session(tmp_path, run_interview, session_state):
+    path = tmp_path / "session.journal"
+    tools, _ = write_journal(path, run_interview)
+
+    recovered = recover_interview_tools(str(path))
+    assert session_state(recovered) == session_state(tools)
+    assert recovered.candidate_name == "Priya Sharma"
+    assert recovered.warning_count == 1
+    assert [q.question for q in recovered.questions_asked] == ["How do you design a REST API?"]
+    assert recovered.find_similar_question("Could you tell me about a team conflict?") is not None
+
+
+def test_replay_keeps_record_timestamps(tmp_path, run_interview):
+    path = tmp_path / "session.journal"
+    tools, _ = write_journal(path, run_interview)
+
+    recovered = recover_interview_tools(str(path))
+    assert [turn.timestamp for turn in recovered.transcript] == [turn.timestamp for turn in tools.transcript]
+    assert recovered.clock.wall_start == tools.clock.wall_start
+
+
+def test_torn_final_record_is_ignored(tmp_path, run_interview, session_state):
+    path = tmp_path / "session.journal"
+    tools, _ = write_journal(path, run_interview)
+    complete = len(read_journal(str(path)))
+    with open(path, "ab") as f:
+        f.write(b'{"op": "turn", "speaker": "candidate", "mess')
+
+    assert len(read_journal(str(path))) == complete
+    assert session_state(recover_interview_tools(str(path))) == session_state(tools)
+
+
+def test_interrupted_sessions_are_queued_and_removed(tmp_path, run_interview):
+    interrupted = tmp_path / "interrupted.journal"
+    write_journal(interrupted, run_interview)
+    live = tmp_path / "live.journal"
+    _, live_journal = write_journal(live, run_interview, close=False)
+    queued = []
+
+    async def enqueue(interview_data):
+        queued.append(interview_data)
+        return len(queued)
+
+    try:
+        job_ids = asyncio.run(recover_interrupted_sessions(enqueue, journal_dir=str(tmp_path)))
+    finally:
+        live_journal.close()
+
+    assert job_ids == [1]
+    assert queued[0]["candidate_name"] == "Priya Sharma"
+    assert "How do you design a REST API?" in queued[0]["transcript"]
+    assert not interrupted.exists()
+    assert live.exists()  # Still locked by its session
@@ -0,0 +1,78 @@
+"""Session snapshot/restore round trip (InterviewTools.snapshot)"""
+
+import marshal
+import struct
+import time
+
+import pytest
+
+from tools import SNAPSHOT_VERSION, InterviewTools
+
+
+@pytest.fixture
+def tools(run_interview):
+    tools = InterviewTools()
+    run_interview(tools)
+    return tools
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_round_trip_restores_the_session(tools, session_state, compress):
+    restored = InterviewTools.restore(tools.snapshot(compress=compress))
+
+    assert session_state(restored) == session_state(tools)
+    assert list(restored.turn_char_counts) == list(tools.turn_char_counts)
+    assert restored.transcript_char_count == tools.transcript_char_count
+    assert restored.get_notes_summary() == tools.get_notes_summary()
+    assert restored.find_similar_question("How would you design a REST API?") is not None
+
+
+def test_round_trip_keeps_timestamps_relative_to_the_session(tools):
+    restored = InterviewTools.restore(tools.snapshot())
+
+    assert restored.clock.wall_start == tools.clock.wall_start
+    original = [turn.timestamp - tools.clock.monotonic_start for turn in tools.transcript]
+    offsets = [turn.timestamp - restored.clock.monotonic_start for turn in restored.transcript]
+    assert offsets == pytest.approx(original)
+    assert restored.get_interview_duration() == tools.get_interview_duration()
+
+
+def test_restored_session_keeps_working(tools):
+    restored = InterviewTools.restore(tools.snapshot())
+    restored.add_to_transcript("candidate", "We split the team's work by service.")
+    restored.update_interview_stage("closing")
+
+    assert len(restored.transcript) == len(tools.transcript) + 1
+    assert restored.stage_history[-1] == {"stage": "behavioral", "start_turn": 4, "end_turn": 6}
+    assert InterviewTools.restore(restored.snapshot()).get_full_transcript() == restored.get_full_transcript()
+
+
+def test_counts_have_a_fixed_byte_order(tools):
+    data = tools.snapshot()
+    assert data[6:7] == b"<"
+    state = list(marshal.loads(data[7:]))
+    assert state[11] == struct.pack(f"<{len(tools.turn_char_counts)}I", *tools.turn_char_counts)
+
+    # A snapshot written with big-endian counts (as the header says) restores the same
+    state[11] = struct.pack(f">{len(tools.turn_char_counts)}I", *tools.turn_char_counts)
+    state[12] = struct.pack(f">{len(tools.turn_token_counts)}I", *tools.turn_token_counts)
+    big_endian = data[:6] + b">" + marshal.dumps(tuple(state))
+    restored = InterviewTools.restore(big_endian)
+    assert list(restored.turn_char_counts) == list(tools.turn_char_counts)
+    assert list(restored.turn_token_counts) == list(tools.turn_token_counts)
+
+
+def test_compressed_snapshot_is_smaller(tools):
+    tools.add_to_transcript("candidate", "we discussed the design trade-offs in detail " * 50)
+    assert len(tools.snapshot(compress=True)) < len(tools.snapshot())
+
+
+@pytest.mark.parametrize("data, message", [
+    (b"SIM", "too short"),
+    (b"NOPE\x01\x00<payload", "Not an interview snapshot"),
+    (b"SIMA" + bytes([SNAPSHOT_VERSION + 1, 0]) + b"<payload", "Unsupported snapshot version"),
+    (b"SIMA" + bytes([SNAPSHOT_VERSION, 0]) + b"=payload", "Unsupported snapshot byte order"),
+])
+def test_invalid_snapshots_are_rejected(data, message):
+    with pytest.raises(ValueError, match=message):
+        InterviewTools.restore(data)
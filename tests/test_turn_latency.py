@@ -0,0 +1,21 @@
+"""Per-turn response latency (turn_latency.TurnLatencyTracker)"""
+
+from turn_latency import LatencyHistogram, TurnLatencyTracker
+
+
+def test_every_turn_is_recorded_and_slo_breaches_marked():
+    tracker = TurnLatencyTracker(slo_ms=1000, worker_histogram=LatencyHistogram())
+    assert tracker.agent_started_speaking(at=1.0) is None  # Greeting - no candidate turn yet
+
+    for turn, (stopped, started) in enumerate([(10.0, 10.4), (20.0, 22.0), (30.0, 30.9)]):
+        tracker.user_stopped_speaking(stopped)
+        tracker.agent_started_speaking(started, turn=2 * turn + 1)
+
+    report = tracker.to_dict()
+    assert report["turns"] == [
+        {"turn": 1, "latency_ms": 400.0, "over_slo": False},
+        {"turn": 3, "latency_ms": 2000.0, "over_slo": True},
+        {"turn": 5, "latency_ms": 900.0, "over_slo": False},
+    ]
+    assert report["slo_breaches"] == 1
+    assert report["session"]["count"] == 3
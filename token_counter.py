@@ -0,0 +1,60 @@
+"""
+Token counting
+Counts tokens with tiktoken (see requirements.txt). Without it, counts fall
+back to a deliberately high estimate of one token per 3 characters - code,
+names and non-English text often run below the usual ~4 - so prompt budgets
+err on the safe side; a warning is logged the first time the estimate is used.
+"""
+
+import logging
+import os
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:  # Falls back to the character estimate
+    tiktoken = None
+
+logger = logging.getLogger("interview-token-counter")
+
+TOKEN_COUNT_MODEL = os.getenv("TOKEN_COUNT_MODEL", "gpt-4o")
+CHARS_PER_TOKEN = 3  # Fallback estimate when tiktoken is unavailable (with a safety margin)
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    if tiktoken is None:
+        logger.warning(
+            f"tiktoken is not installed - estimating {CHARS_PER_TOKEN} characters per token, "
+            "so prompt budgets are approximate (pip install tiktoken)"
+        )
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        logger.warning(f"No tiktoken encoding for {model}, using o200k_base")
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(text: str, model: str = TOKEN_COUNT_MODEL) -> int:
+    """
+    Number of tokens in text for the given model
+
+    Args:
+        text: Text to count
+        model: OpenAI model name (selects the tiktoken encoding)
+
+    Returns:
+        Exact count with tiktoken, otherwise ceil(len(text) / CHARS_PER_TOKEN)
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def is_exact() -> bool:
+    """True when counts come from tiktoken rather than the character estimate"""
+    return tiktoken is not None
@@ -1,24 +1,192 @@
 import logging
+import marshal
+import re
+import struct
+import sys
+import zlib
+import time
+from array import array
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Callable, Optional, List, Dict
+
+from moderation import SEVERITY_TERMINATE, get_moderation_matcher
+from question_index import QuestionIndex
+from role_taxonomy import get_role_taxonomy
+from token_counter import count_tokens, is_exact as token_counter_is_exact
+from turn_latency import TurnLatencyTracker
 
 logger = logging.getLogger("interview-tools")
 
+# A sentence ending in a question mark
+_QUESTION_SENTENCE = re.compile(r"[^.!?]*\?")
+
+# Session snapshot: magic, format version, flags, byte order of the per-turn
+# counts ("<" or ">"), then a marshal payload
+SNAPSHOT_MAGIC = b"SIMA"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FLAG_ZLIB = 1
+SNAPSHOT_COUNT_ORDER = b"<"  # Counts are written as little-endian uint32 on every host
+_SNAPSHOT_HEADER = struct.Struct(">4sBBc")
+
+
+def _pack_counts(counts: array) -> bytes:
+    """Per-turn counts as uint32 in SNAPSHOT_COUNT_ORDER (array.tobytes() is native size and order)"""
+    return struct.pack(f"{SNAPSHOT_COUNT_ORDER.decode()}{len(counts)}I", *counts)
+
+
+def _unpack_counts(data: bytes, byte_order: bytes) -> tuple:
+    return struct.unpack(f"{byte_order.decode()}{len(data) // 4}I", data)
+
+
+class SessionClock:
+    """Monotonic session clock; readings become wall-clock ISO timestamps only on export"""
+    __slots__ = ("wall_start", "monotonic_start")
+    
+    def __init__(self):
+        self.wall_start = time.time()
+        self.monotonic_start = time.monotonic()
+    
+    def now(self) -> float:
+        return time.monotonic()
+    
+    def isoformat(self, reading: float) -> str:
+        return datetime.fromtimestamp(self.wall_start + (reading - self.monotonic_start)).isoformat()
+
+
+class _Record:
+    """Compact record - exported as a dict with the fields in __slots__ order"""
+    __slots__ = ()
+    
+    def to_dict(self, clock: SessionClock) -> dict:
+        return {
+            field: clock.isoformat(self.timestamp) if field == "timestamp" else getattr(self, field)
+            for field in self.__slots__
+        }
+
+
+class TranscriptTurn(_Record):
+    __slots__ = ("timestamp", "speaker", "message")
+    
+    def __init__(self, timestamp: float, speaker: str, message: str):
+        self.timestamp = timestamp
+        self.speaker = sys.intern(speaker)
+        self.message = message
+
+
+class InterviewNote(_Record):
+    __slots__ = ("timestamp", "category", "note", "stage")
+    
+    def __init__(self, timestamp: float, category: str, note: str, stage: str):
+        self.timestamp = timestamp
+        self.category = sys.intern(category)
+        self.note = note
+        self.stage = sys.intern(stage)
+
+
+class AskedQuestion(_Record):
+    __slots__ = ("timestamp", "question", "stage", "category")
+    
+    def __init__(self, timestamp: float, question: str, stage: str, category: Optional[str]):
+        self.timestamp = timestamp
+        self.question = question
+        self.stage = sys.intern(stage)
+        self.category = sys.intern(category) if category else category
+
 
 class InterviewTools:
     """Tools and utilities for the interview assistant"""
     
     def __init__(self):
-        self.candidate_notes = []
+        self.clock = SessionClock()
+        self.candidate_notes: List[InterviewNote] = []
+        # Notes indexed as they are recorded (insertion ordered, like candidate_notes)
+        self._notes_by_category: Dict[str, List[InterviewNote]] = {}
+        self._notes_by_stage: Dict[str, List[InterviewNote]] = {}
+        self._notes_summary: Optional[str] = None  # Cached get_notes_summary() text
         self.interview_stage = "introduction"
-        self.questions_asked = []
-        self.start_time = datetime.now()
+        self.questions_asked: List[AskedQuestion] = []
+        self.question_index = QuestionIndex()  # Near-duplicate lookup over asked and spoken questions
+        self.start_time = datetime.fromtimestamp(self.clock.wall_start)
         self.candidate_info = {}
         self.warning_count = 0  # Track warnings for rude behavior
         self.interview_terminated = False
-        self.transcript = []  # Store conversation transcript
+        self.transcript: List[TranscriptTurn] = []  # Store conversation transcript
         self.candidate_name = None
         self.position = None
+        self.stage_history = []  # Finished stages with the transcript turns they cover
+        # Rendered transcript, maintained as turns are added
+        self.turn_char_counts = array("I")  # Rendered "Speaker: message" length per turn
+        self.turn_token_counts = array("I")
+        self.transcript_char_count = 0  # Length of the rendered transcript
+        self.transcript_token_count = 0
+        self._rendered_transcript = ""
+        self._rendered_turn_count = 0  # Turns included in _rendered_transcript
+        self._stage_start_turn = 0
+        self._stage_listeners = []
+        self.turn_latency = TurnLatencyTracker()  # Candidate-stops to interviewer-starts gaps
+        self.journal = None  # SessionJournal receiving every mutation (see attach_journal)
+        self.end_time: Optional[datetime] = None  # Set for sessions rebuilt after they ended
+    
+    def attach_journal(self, journal) -> None:
+        """
+        Stream every mutation of this session to a journal
+        
+        Args:
+            journal: session_journal.SessionJournal; appends never block on disk
+        """
+        self.journal = journal
+        journal.append(
+            "session",
+            wall_start=self.clock.wall_start,
+            monotonic_start=self.clock.monotonic_start,
+            stage=self.interview_stage
+        )
+    
+    def _journal(self, op: str, **fields) -> None:
+        if self.journal is not None:
+            self.journal.append(op, **fields)
+    
+    def _journal_moderation(self) -> None:
+        self._journal("moderation", warning_count=self.warning_count, terminated=self.interview_terminated)
+    
+    def apply_journal_record(self, record: Dict) -> None:
+        """
+        Replay one journal record (see session_journal.recover_interview_tools)
+        
+        Records are applied without being journaled again and without the
+        auto-detection side effects of the live methods; detected details
+        have their own records.
+        """
+        op = record["op"]
+        if op == "session":
+            self.clock.wall_start = record["wall_start"]
+            self.clock.monotonic_start = record["monotonic_start"]
+            self.start_time = datetime.fromtimestamp(self.clock.wall_start)
+            self.interview_stage = record["stage"]
+        elif op == "turn":
+            entry = TranscriptTurn(record["t"], record["speaker"], record["message"])
+            self.transcript.append(entry)
+            self._index_turn(entry)
+            if entry.speaker == "interviewer":
+                self._index_interviewer_questions(entry.message)
+        elif op == "note":
+            self._add_note(InterviewNote(record["t"], record["category"], record["note"], record["stage"]))
+        elif op == "question":
+            self.questions_asked.append(
+                AskedQuestion(record["t"], record["question"], record["stage"], record["category"])
+            )
+            self.question_index.add(record["question"])
+        elif op == "info":
+            self.candidate_info[record["key"]] = record["value"]
+        elif op == "stage":
+            self.update_interview_stage(record["stage"])
+        elif op == "details":
+            self.set_candidate_details(name=record["name"], position=record["position"])
+        elif op == "moderation":
+            self.warning_count = record["warning_count"]
+            self.interview_terminated = record["terminated"]
+        else:
+            logger.warning(f"Unknown journal record: {op}")
     
     def record_note(self, note: str, category: str = "general") -> dict:
         """
@@ -31,16 +199,18 @@ class InterviewTools:
         Returns:
             Dictionary with note details
         """
-        note_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "category": category,
-            "note": note,
-            "stage": self.interview_stage
-        }
-        self.candidate_notes.append(note_entry)
+        note_entry = InterviewNote(self.clock.now(), category, note, self.interview_stage)
+        self._add_note(note_entry)
+        self._journal("note", t=note_entry.timestamp, category=category, note=note, stage=note_entry.stage)
         logger.info(f"Recorded note [{category}]: {note}")
         
-        return note_entry
+        return note_entry.to_dict(self.clock)
+    
+    def _add_note(self, note_entry: InterviewNote) -> None:
+        self.candidate_notes.append(note_entry)
+        self._notes_by_category.setdefault(note_entry.category, []).append(note_entry)
+        self._notes_by_stage.setdefault(note_entry.stage, []).append(note_entry)
+        self._notes_summary = None
     
     def update_interview_stage(self, stage: str) -> str:
         """
@@ -53,11 +223,37 @@ class InterviewTools:
             Confirmation message
         """
         old_stage = self.interview_stage
+        if stage == old_stage:
+            return f"Stage updated to {stage}"
+        
+        # Close the finished stage: turns [start_turn, end_turn) of the transcript
+        start_turn = self._stage_start_turn
+        end_turn = len(self.transcript)
+        self.stage_history.append({"stage": old_stage, "start_turn": start_turn, "end_turn": end_turn})
+        self._stage_start_turn = end_turn
+        
         self.interview_stage = stage
         logger.info(f"Interview stage: {old_stage} -> {stage}")
+        self._journal("stage", stage=stage)
+        
+        for listener in self._stage_listeners:
+            try:
+                listener(old_stage, start_turn, end_turn)
+            except Exception as e:
+                logger.error(f"Stage listener failed: {e}")
         
         return f"Stage updated to {stage}"
     
+    def add_stage_listener(self, listener: Callable[[str, int, int], None]) -> None:
+        """
+        Register a callback for stage transitions
+        
+        Args:
+            listener: Called as listener(finished_stage, start_turn, end_turn) where
+                the finished stage covers transcript turns [start_turn, end_turn)
+        """
+        self._stage_listeners.append(listener)
+    
     def mark_question_asked(self, question: str, category: Optional[str] = None) -> None:
         """
         Track questions that have been asked to avoid repetition
@@ -66,14 +262,27 @@ class InterviewTools:
             question: The question that was asked
             category: Optional category of the question
         """
-        self.questions_asked.append({
-            "timestamp": datetime.now().isoformat(),
-            "question": question,
-            "stage": self.interview_stage,
-            "category": category
-        })
+        entry = AskedQuestion(self.clock.now(), question, self.interview_stage, category)
+        self.questions_asked.append(entry)
+        self.question_index.add(question)
+        self._journal("question", t=entry.timestamp, question=question, stage=entry.stage, category=category)
         logger.info(f"Question logged: {question}")
     
+    def find_similar_question(self, question: str) -> Optional[dict]:
+        """
+        Check whether a question (or a paraphrase of it) was already asked
+        
+        Args:
+            question: The question about to be asked
+        
+        Returns:
+            {"question": earlier question, "similarity": 0-1} or None
+        """
+        match = self.question_index.find_similar(question)
+        if match is None:
+            return None
+        return {"question": match[0], "similarity": round(match[1], 2)}
+    
     def store_candidate_info(self, key: str, value: str) -> None:
         """
         Store important information about the candidate
@@ -84,6 +293,7 @@ class InterviewTools:
         """
         self.candidate_info[key] = value
         logger.info(f"Stored candidate info - {key}: {value}")
+        self._journal("info", key=key, value=value)
     
     def check_inappropriate_behavior(self, message: str) -> tuple[bool, str]:
         """
@@ -95,39 +305,26 @@ class InterviewTools:
         Returns:
             (is_inappropriate, severity) where severity is 'warning' or 'terminate'
         """
-        message_lower = message.lower()
-        
-        # Severe - immediate termination
-        severe_keywords = [
-            'fuck', 'shit', 'bitch', 'ass', 'damn',
-            'stupid interviewer', 'waste of time',
-            'this is bullshit', 'you suck'
-        ]
+        hits = get_moderation_matcher().find_all(message)
+        if not hits:
+            return (False, 'none')
         
-        # Warning - track and terminate on repeat
-        warning_keywords = [
-            'irritating', 'annoying', 'boring',
-            "don't know anything", "i don't care",
-            'whatever', 'this is dumb'
-        ]
-        
-        for keyword in severe_keywords:
-            if keyword in message_lower:
-                self.interview_terminated = True
-                logger.warning(f"Severe inappropriate behavior detected: {keyword}")
-                return (True, 'terminate')
+        severe = [hit.keyword for hit in hits if hit.severity == SEVERITY_TERMINATE]
+        if severe:
+            self.interview_terminated = True
+            logger.warning(f"Severe inappropriate behavior detected: {', '.join(severe)}")
+            self._journal_moderation()
+            return (True, 'terminate')
         
-        for keyword in warning_keywords:
-            if keyword in message_lower:
-                self.warning_count += 1
-                logger.warning(f"Warning behavior detected: {keyword} (count: {self.warning_count})")
-                
-                if self.warning_count >= 2:
-                    self.interview_terminated = True
-                    return (True, 'terminate')
-                return (True, 'warning')
+        self.warning_count += 1
+        logger.warning(
+            f"Warning behavior detected: {', '.join(hit.keyword for hit in hits)} (count: {self.warning_count})"
+        )
         
-        return (False, 'none')
+        if self.warning_count >= 2:
+            self.interview_terminated = True
+        self._journal_moderation()
+        return (True, 'terminate' if self.interview_terminated else 'warning')
     
     def issue_warning(self) -> str:
         """Issue a warning to the candidate"""
@@ -136,6 +333,7 @@ class InterviewTools:
     def terminate_interview(self) -> str:
         """Terminate the interview due to inappropriate behavior"""
         self.interview_terminated = True
+        self._journal_moderation()
         return "I don't think we can continue this interview. Thank you."
     
     def add_to_transcript(self, speaker: str, message: str) -> None:
@@ -146,66 +344,49 @@ class InterviewTools:
             speaker: 'interviewer' or 'candidate'
             message: The message content
         """
-        self.transcript.append({
-            "timestamp": datetime.now().isoformat(),
-            "speaker": speaker,
-            "message": message
-        })
+        entry = TranscriptTurn(self.clock.now(), speaker, message)
+        self.transcript.append(entry)
+        self._index_turn(entry)
+        self._journal("turn", t=entry.timestamp, speaker=speaker, message=message)
+        
+        # Interviewer questions are indexed so paraphrased repeats can be caught
+        if speaker == "interviewer":
+            self._index_interviewer_questions(message)
         
         # Auto-detect candidate name and position from their first response
         if speaker == "candidate" and not self.candidate_name and len(self.transcript) <= 3:
             self.auto_detect_candidate_name(message)
             self.auto_detect_position(message)
     
+    def _index_interviewer_questions(self, message: str) -> None:
+        """Index the question sentences of an interviewer turn (lookup only - not counted as asked)"""
+        for question in _QUESTION_SENTENCE.findall(message):
+            self.question_index.add(question.strip())
+    
+    @staticmethod
+    def _render_turn(entry: TranscriptTurn) -> str:
+        return f"{entry.speaker.capitalize()}: {entry.message}"
+    
+    def _index_turn(self, entry: TranscriptTurn) -> None:
+        """Count one transcript turn's rendered characters and tokens"""
+        rendered = self._render_turn(entry)
+        tokens = count_tokens(rendered)
+        self.turn_char_counts.append(len(rendered))
+        self.turn_token_counts.append(tokens)
+        # Turns are joined with a blank line ("\n\n")
+        self.transcript_char_count += len(rendered) + (2 if len(self.turn_char_counts) > 1 else 0)
+        self.transcript_token_count += tokens
+    
     def auto_detect_position(self, text: str) -> None:
         """Try to auto-detect candidate's position from their introduction"""
         if self.position:  # Already detected
             return
             
-        text_lower = text.lower()
-        
-        # Common position keywords
-        position_keywords = {
-            "ui/ux designer": "UI/UX Designer",
-            "ui ux designer": "UI/UX Designer", 
-            "ux designer": "UX Designer",
-            "ui designer": "UI Designer",
-            "designer": "Designer",
-            "frontend developer": "Frontend Developer",
-            "front end developer": "Frontend Developer",
-            "frontend engineer": "Frontend Developer",
-            "backend developer": "Backend Developer",
-            "back end developer": "Backend Developer",
-            "backend engineer": "Backend Developer",
-            "full stack developer": "Full Stack Developer",
-            "fullstack developer": "Full Stack Developer",
-            "software developer": "Software Developer",
-            "software engineer": "Software Engineer",
-            "ai developer": "AI Developer",
-            "ml engineer": "ML Engineer",
-            "machine learning engineer": "ML Engineer",
-            "data scientist": "Data Scientist",
-            "data analyst": "Data Analyst",
-            "devops engineer": "DevOps Engineer",
-            "qa engineer": "QA Engineer",
-            "quality assurance": "QA Engineer",
-            "tester": "QA Tester",
-            "product manager": "Product Manager",
-            "project manager": "Project Manager",
-            "sales executive": "Sales Executive",
-            "business development": "Business Development",
-            "marketing": "Marketing Specialist",
-            "digital marketing": "Digital Marketing",
-            "hr": "HR Professional",
-            "recruiter": "Recruiter",
-        }
-        
-        for keyword, position in position_keywords.items():
-            if keyword in text_lower:
-                self.set_candidate_details(position=position)
-                logger.info(f"Auto-detected position: {position}")
-                print(f"🎯 Position detected: {position}")
-                return
+        position = get_role_taxonomy().detect(text)
+        if position:
+            self.set_candidate_details(position=position)
+            logger.info(f"Auto-detected position: {position}")
+            print(f"🎯 Position detected: {position}")
     
     def set_candidate_details(self, name: str = None, position: str = None) -> None:
         """Set candidate name and position for evaluation"""
@@ -217,6 +398,8 @@ class InterviewTools:
             self.position = position
             self.candidate_info['position'] = position
             logger.info(f"Position set: {position}")
+        if name or position:
+            self._journal("details", name=name, position=position)
     
     def auto_detect_candidate_name(self, text: str) -> None:
         """Try to auto-detect candidate name from their introduction"""
@@ -250,13 +433,29 @@ class InterviewTools:
         if not self.transcript:
             return "No transcript available."
         
-        formatted = []
-        for entry in self.transcript:
-            speaker = entry['speaker'].capitalize()
-            message = entry['message']
-            formatted.append(f"{speaker}: {message}")
+        # Only turns added since the last call are joined onto the cached text
+        if self._rendered_turn_count < len(self.transcript):
+            new_turns = self.get_transcript_range(self._rendered_turn_count, len(self.transcript))
+            if self._rendered_turn_count:
+                self._rendered_transcript += "\n\n" + new_turns
+            else:
+                self._rendered_transcript = new_turns
+            self._rendered_turn_count = len(self.transcript)
         
-        return "\n\n".join(formatted)
+        return self._rendered_transcript
+    
+    def get_transcript_range(self, start_turn: int, end_turn: int) -> str:
+        """Get turns [start_turn, end_turn) formatted like get_full_transcript"""
+        return "\n\n".join(self._render_turn(entry) for entry in self.transcript[start_turn:end_turn])
+    
+    def get_transcript_stats(self) -> Dict:
+        """Transcript size without rendering it - for prompt budget decisions"""
+        return {
+            "turns": len(self.transcript),
+            "chars": self.transcript_char_count,
+            "tokens": self.transcript_token_count,
+            "exact_tokens": token_counter_is_exact()
+        }
     
     def get_interview_data_for_evaluation(self) -> Dict:
         """
@@ -265,19 +464,20 @@ class InterviewTools:
         Returns:
             Dictionary with all data needed for evaluation
         """
-        duration = datetime.now() - self.start_time
+        duration = (self.end_time or datetime.now()) - self.start_time
         duration_minutes = int(duration.total_seconds() / 60)
         
         return {
             "candidate_name": self.candidate_name or "Unknown Candidate",
             "position": self.position or "Unknown Position",
             "transcript": self.get_full_transcript(),
-            "interview_notes": self.candidate_notes,
+            "interview_notes": self._export_records(self.candidate_notes),
             "duration_minutes": duration_minutes,
             "candidate_info": self.candidate_info,
             "questions_asked_count": len(self.questions_asked),
             "interview_terminated": self.interview_terminated,
-            "warning_count": self.warning_count
+            "warning_count": self.warning_count,
+            "turn_latency": self.turn_latency.to_dict()
         }
     
     def get_notes_summary(self) -> str:
@@ -285,33 +485,32 @@ class InterviewTools:
         if not self.candidate_notes:
             return "No notes recorded yet."
         
-        summary = f"Interview Notes Summary ({len(self.candidate_notes)} total)\n"
-        summary += "=" * 50 + "\n\n"
+        # Rebuilt only after a new note was recorded
+        if self._notes_summary is None:
+            parts = [f"Interview Notes Summary ({len(self.candidate_notes)} total)\n", "=" * 50 + "\n\n"]
+            for category, notes in self._notes_by_category.items():
+                parts.append(f"{category.upper()} ({len(notes)}):\n")
+                parts.extend(f"  • {note.note} [{note.stage}]\n" for note in notes)
+                parts.append("\n")
+            self._notes_summary = "".join(parts)
         
-        # Group by category
-        categories = {}
-        for note in self.candidate_notes:
-            cat = note["category"]
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(note)
-        
-        # Format by category
-        for category, notes in categories.items():
-            summary += f"{category.upper()} ({len(notes)}):\n"
-            for note in notes:
-                summary += f"  • {note['note']} [{note['stage']}]\n"
-            summary += "\n"
-        
-        return summary
+        return self._notes_summary
+    
+    def get_notes_by_stage(self, stage: str) -> List[str]:
+        """Notes recorded during one interview stage"""
+        return [note.note for note in self._notes_by_stage.get(stage, [])]
+    
+    def get_note_counts(self) -> Dict[str, int]:
+        """Number of notes per category"""
+        return {category: len(notes) for category, notes in self._notes_by_category.items()}
     
     def get_asked_questions(self) -> list:
         """Get list of questions that have been asked"""
-        return [q["question"] for q in self.questions_asked]
+        return [q.question for q in self.questions_asked]
     
     def get_interview_duration(self) -> str:
         """Get the current duration of the interview"""
-        duration = datetime.now() - self.start_time
+        duration = (self.end_time or datetime.now()) - self.start_time
         minutes = int(duration.total_seconds() / 60)
         seconds = int(duration.total_seconds() % 60)
         return f"{minutes}m {seconds}s"
@@ -329,24 +528,123 @@ class InterviewTools:
     
     def _get_notes_by_category(self) -> dict:
         """Helper to group notes by category"""
-        categories = {}
-        for note in self.candidate_notes:
-            cat = note["category"]
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(note["note"])
-        return categories
+        return {
+            category: [note.note for note in notes]
+            for category, notes in self._notes_by_category.items()
+        }
+    
+    def snapshot(self, compress: bool = False) -> bytes:
+        """
+        Versioned binary snapshot of the session (see restore)
+        
+        Covers identity, stage and stage history, transcript, notes,
+        questions and moderation state. Timestamps are stored relative to
+        the session start so they stay correct on another machine. Journal
+        and stage listeners are process-local and not included.
+        
+        Args:
+            compress: zlib-compress the payload (smaller, slower)
+        """
+        clock = self.clock
+        base = clock.monotonic_start
+        state = (
+            clock.wall_start,
+            time.time() - clock.wall_start,  # Session age at snapshot time
+            self.candidate_name,
+            self.position,
+            self.candidate_info,
+            self.interview_stage,
+            [(item["stage"], item["start_turn"], item["end_turn"]) for item in self.stage_history],
+            self._stage_start_turn,
+            self.warning_count,
+            self.interview_terminated,
+            [(turn.timestamp - base, turn.speaker, turn.message) for turn in self.transcript],
+            _pack_counts(self.turn_char_counts),
+            _pack_counts(self.turn_token_counts),
+            [(note.timestamp - base, note.category, note.note, note.stage) for note in self.candidate_notes],
+            [(q.timestamp - base, q.question, q.stage, q.category) for q in self.questions_asked],
+            self.question_index.entries(),
+        )
+        payload = marshal.dumps(state)
+        flags = 0
+        if compress:
+            payload = zlib.compress(payload, 1)
+            flags |= SNAPSHOT_FLAG_ZLIB
+        return _SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags, SNAPSHOT_COUNT_ORDER) + payload
+    
+    @classmethod
+    def restore(cls, data: bytes) -> "InterviewTools":
+        """
+        Rebuild a session from snapshot() bytes
+        
+        Only restore snapshots from trusted sources (the payload is marshal data).
+        
+        Raises:
+            ValueError: if the data is not a snapshot or has an unsupported version
+        """
+        if len(data) < _SNAPSHOT_HEADER.size:
+            raise ValueError("Not an interview snapshot (too short)")
+        magic, version, flags, count_order = _SNAPSHOT_HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not an interview snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {version} (expected {SNAPSHOT_VERSION})")
+        if count_order not in (b"<", b">"):
+            raise ValueError(f"Unsupported snapshot byte order {count_order!r}")
+        payload = data[_SNAPSHOT_HEADER.size:]
+        if flags & SNAPSHOT_FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+        (wall_start, age, candidate_name, position, candidate_info, stage, stage_history, stage_start_turn,
+         warning_count, terminated, turns, char_counts, token_counts, notes, questions, question_entries) = marshal.loads(payload)
+        
+        tools = cls()
+        # Re-anchor the monotonic clock so relative timestamps map to the original wall times
+        tools.clock.wall_start = wall_start
+        tools.clock.monotonic_start = time.monotonic() - age
+        tools.start_time = datetime.fromtimestamp(wall_start)
+        base = tools.clock.monotonic_start
+        
+        tools.candidate_name = candidate_name
+        tools.position = position
+        tools.candidate_info = candidate_info
+        tools.interview_stage = stage
+        tools.stage_history = [
+            {"stage": name, "start_turn": start, "end_turn": end} for name, start, end in stage_history
+        ]
+        tools._stage_start_turn = stage_start_turn
+        tools.warning_count = warning_count
+        tools.interview_terminated = terminated
+        
+        tools.transcript = [TranscriptTurn(base + offset, speaker, message) for offset, speaker, message in turns]
+        # Per-turn counts are carried over, so nothing is re-tokenized
+        tools.turn_char_counts.extend(_unpack_counts(char_counts, count_order))
+        tools.turn_token_counts.extend(_unpack_counts(token_counts, count_order))
+        tools.transcript_char_count = sum(tools.turn_char_counts) + 2 * max(len(turns) - 1, 0)
+        tools.transcript_token_count = sum(tools.turn_token_counts)
+        
+        for offset, category, note, note_stage in notes:
+            tools._add_note(InterviewNote(base + offset, category, note, note_stage))
+        tools.questions_asked = [
+            AskedQuestion(base + offset, question, q_stage, category) for offset, question, q_stage, category in questions
+        ]
+        for question, shingles in question_entries:
+            tools.question_index.add(question, shingles)
+        return tools
+    
+    def _export_records(self, records: List[_Record]) -> List[dict]:
+        return [record.to_dict(self.clock) for record in records]
     
     def export_interview_data(self) -> dict:
         """Export all interview data for storage/analysis"""
         return {
             "start_time": self.start_time.isoformat(),
-            "end_time": datetime.now().isoformat(),
+            "end_time": (self.end_time or datetime.now()).isoformat(),
             "duration": self.get_interview_duration(),
             "final_stage": self.interview_stage,
             "candidate_info": self.candidate_info,
-            "notes": self.candidate_notes,
-            "questions_asked": self.questions_asked,
+            "notes": self._export_records(self.candidate_notes),
+            "questions_asked": self._export_records(self.questions_asked),
+            "turn_latency": self.turn_latency.to_dict(),
             "summary": self.get_interview_summary()
         }
 
@@ -0,0 +1,176 @@
+"""
+Conversational turn latency
+Measures the gap between the candidate finishing speaking and the
+interviewer starting to answer - the delay candidates actually notice.
+
+Latencies go into HDR-style histograms: log-linear buckets with 128
+sub-buckets per power of two, so every recorded value keeps better than 1%
+precision from 1 ms to a minute in a fixed ~5 KB array. Each session has its
+own histogram and also feeds one per worker process. Every turn's gap is
+also kept individually, with the turns slower than the SLO marked.
+"""
+
+import logging
+import math
+import os
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger("interview-latency")
+
+TURN_LATENCY_SLO_MS = float(os.getenv("TURN_LATENCY_SLO_MS", "1500"))
+MAX_TRACKED_LATENCY_MS = 60000  # Slower turns are counted at this value
+
+_SUB_BUCKET_BITS = 7
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS  # 128 - relative error below 1/128
+_LINEAR_LIMIT = 2 * _SUB_BUCKETS  # Values below 256 ms get their own bucket
+
+REPORTED_PERCENTILES = (50, 90, 95, 99)
+
+
+def _bucket_index(value: int) -> int:
+    if value < _LINEAR_LIMIT:
+        return value
+    shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+    return _LINEAR_LIMIT + (shift - 1) * _SUB_BUCKETS + (value >> shift) - _SUB_BUCKETS
+
+
+def _bucket_upper_bound(index: int) -> int:
+    """Highest value that lands in a bucket (percentiles err on the slow side)"""
+    if index < _LINEAR_LIMIT:
+        return index
+    shift, sub_bucket = divmod(index - _LINEAR_LIMIT, _SUB_BUCKETS)
+    shift += 1
+    return ((sub_bucket + _SUB_BUCKETS + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Fixed-size log-linear histogram of millisecond latencies"""
+
+    def __init__(self, max_value: int = MAX_TRACKED_LATENCY_MS):
+        self.max_value = max_value
+        self.counts = array("I", bytes(4 * (_bucket_index(max_value) + 1)))
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, latency_ms: float) -> None:
+        value = min(max(int(round(latency_ms)), 0), self.max_value)
+        self.counts[_bucket_index(value)] += 1
+        self.count += 1
+        self.total += latency_ms
+        self.min = latency_ms if self.min is None else min(self.min, latency_ms)
+        self.max = latency_ms if self.max is None else max(self.max, latency_ms)
+
+    def percentile(self, percent: float) -> Optional[int]:
+        """Latency (ms) at or below which `percent` of the recorded turns fall"""
+        if not self.count:
+            return None
+        target = max(1, math.ceil(self.count * percent / 100))
+        highest = math.ceil(self.max)  # Bucket bounds can overshoot the slowest turn
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(_bucket_upper_bound(index), highest)
+        return highest
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's recordings to this one"""
+        for index, bucket_count in enumerate(other.counts):
+            if bucket_count:
+                self.counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def summary(self) -> Dict:
+        """Count, mean, min/max and p50/p90/p95/p99 in milliseconds"""
+        if not self.count:
+            return {"count": 0}
+        result = {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 1),
+            "min_ms": round(self.min, 1),
+            "max_ms": round(self.max, 1)
+        }
+        for percent in REPORTED_PERCENTILES:
+            result[f"p{percent}_ms"] = self.percentile(percent)
+        return result
+
+
+_worker_histogram: Optional[LatencyHistogram] = None
+
+
+def get_worker_latency_histogram() -> LatencyHistogram:
+    """Turn latencies of every session handled by this worker process"""
+    global _worker_histogram
+    if _worker_histogram is None:
+        _worker_histogram = LatencyHistogram()
+    return _worker_histogram
+
+
+class TurnLatencyTracker:
+    """
+    Per-session response latency
+
+    Call user_stopped_speaking() when the candidate's turn ends and
+    agent_started_speaking() when the interviewer starts answering. Agent
+    speech without a preceding candidate turn (the greeting) is not counted.
+    Times are wall-clock seconds (time.time()), like the chat history metrics.
+    """
+
+    def __init__(self, slo_ms: float = TURN_LATENCY_SLO_MS, worker_histogram: LatencyHistogram = None):
+        self.slo_ms = slo_ms
+        self.histogram = LatencyHistogram()
+        self.worker_histogram = worker_histogram if worker_histogram is not None else get_worker_latency_histogram()
+        self.turns: List[Tuple[Optional[int], float]] = []  # (transcript turn, latency ms) per answered turn
+        self.slo_breaches = 0
+        self._user_stopped_at: Optional[float] = None
+
+    def user_stopped_speaking(self, at: float = None) -> None:
+        self._user_stopped_at = time.time() if at is None else at
+
+    def agent_started_speaking(self, at: float = None, turn: int = None) -> Optional[float]:
+        """
+        Close the pending candidate turn
+
+        Args:
+            at: When the agent started speaking (defaults to now)
+            turn: Transcript turn index, to locate the turn in the export
+
+        Returns:
+            The response latency in ms, or None if no candidate turn was pending
+        """
+        if self._user_stopped_at is None:
+            return None
+        at = time.time() if at is None else at
+        latency_ms = (at - self._user_stopped_at) * 1000
+        self._user_stopped_at = None
+        if latency_ms < 0:
+            return None
+
+        self.histogram.record(latency_ms)
+        self.worker_histogram.record(latency_ms)
+        self.turns.append((turn, latency_ms))
+        if latency_ms > self.slo_ms:
+            self.slo_breaches += 1
+            logger.warning(f"Slow response: {latency_ms:.0f} ms (SLO {self.slo_ms:.0f} ms) at turn {turn}")
+        return latency_ms
+
+    def to_dict(self) -> Dict:
+        """Session latency report for the interview export"""
+        return {
+            "slo_ms": self.slo_ms,
+            "slo_breaches": self.slo_breaches,
+            "session": self.histogram.summary(),
+            "turns": [
+                {"turn": turn, "latency_ms": round(latency_ms, 1), "over_slo": latency_ms > self.slo_ms}
+                for turn, latency_ms in self.turns
+            ]
+        }